@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
 """
-Add the causal overlay to the telecom graph:
+Add the causal overlay to the telecom graph (see docs/causal_overlay_schema.md).
+
+Factors (relationship dimensions such as Contract/Offer and binned Customer properties
+such as tenure) come from --factors (default: src/specs/overlays/churn_factors.yml).
+
+--mode customer (default):
   - ChurnOutcome node per churned customer (id = "churn:<customerId>")
   - Customer -[:HAS_OUTCOME]-> ChurnOutcome
-  - Contract -[:CAUSES]-> ChurnOutcome, Offer -[:CAUSES]-> ChurnOutcome for each churned customer
-
-Run after import_telecom_data.py. From project root: uv run python scripts/add_causal_overlay.py
-See docs/causal_overlay_schema.md for the schema.
+  - (factor) -[:CAUSES]-> ChurnOutcome for each of the churned customer's factors
+  - incremental: only customers whose status/contract/offer changed since the last run are
+    rewritten, --chunk-size customers per transaction; --full reconciles every customer in place
+--mode segment:
+  - one aggregated ChurnOutcome (id = "churn:all") with the population churn rate
+  - one weighted (factor) -[:CAUSES {support, total, churnRate, baseRate, lift}]-> edge per factor value
+
+Run after import_telecom_data.py. From project root: uv run python scripts/add_causal_overlay.py [--mode segment]
 """
 
+import argparse
 import os
 import sys
 
@@ -17,7 +27,17 @@ PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 os.chdir(PROJECT_ROOT)
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
 
+from graph.causal_overlay import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_SPEC_PATH,
+    OVERLAY_MODES,
+    build_customer_overlay,
+    build_segment_overlay,
+    load_overlay_spec,
+)
 from graph.neo4j_client import Neo4jClient
+from graph.query_cache import bump_write_generation
+from graph.schema import apply_schema
 
 
 def load_settings():
@@ -26,45 +46,40 @@ def load_settings():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Add the ChurnOutcome/CAUSES causal overlay.")
+    parser.add_argument("--mode", choices=OVERLAY_MODES, default="customer",
+                        help="Per-customer outcomes or one aggregated outcome with weighted edges.")
+    parser.add_argument("--factors", default=str(DEFAULT_SPEC_PATH),
+                        help="Overlay factor spec YAML (default: %(default)s).")
+    parser.add_argument("--min-support", type=int, default=1,
+                        help="Segment mode: minimum churned customers per factor value.")
+    parser.add_argument("--min-lift", type=float, default=1.0,
+                        help="Segment mode: minimum churn rate relative to the population rate.")
+    parser.add_argument("--full", action="store_true",
+                        help="Customer mode: reconcile every customer, ignoring the change watermark.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Customer mode: customers per write transaction (default: %(default)s).")
+    args = parser.parse_args()
+    spec = load_overlay_spec(args.factors)
+
     settings = load_settings()
-    client = Neo4jClient(
-        settings.neo4j_uri,
-        settings.neo4j_user,
-        settings.neo4j_password,
-    )
+    client = Neo4jClient.from_settings(settings)
 
     try:
         client.connect()
-
-        # Remove existing causal overlay so we can re-run
-        client.run_cypher("MATCH (co:ChurnOutcome) DETACH DELETE co")
-
-        # Create ChurnOutcome per churned customer and HAS_OUTCOME
-        client.run_cypher("""
-            MATCH (c:Customer {customerStatus: 'Churned'})
-            MERGE (co:ChurnOutcome {id: 'churn:' + c.id})
-            SET co.customerId = c.id
-            MERGE (c)-[:HAS_OUTCOME]->(co)
-        """)
-
-        # Contract -[:CAUSES]-> ChurnOutcome for each churned customer
-        client.run_cypher("""
-            MATCH (c:Customer {customerStatus: 'Churned'})-[:HAS_OUTCOME]->(co:ChurnOutcome),
-                  (c)-[:HAS_CONTRACT]->(ct:Contract)
-            MERGE (ct)-[:CAUSES]->(co)
-        """)
-
-        # Offer -[:CAUSES]-> ChurnOutcome for each churned customer (only when they have an offer)
-        client.run_cypher("""
-            MATCH (c:Customer {customerStatus: 'Churned'})-[:HAS_OUTCOME]->(co:ChurnOutcome),
-                  (c)-[:HAS_OFFER]->(o:Offer)
-            MERGE (o)-[:CAUSES]->(co)
-        """)
-
-        n_outcomes = client.run_cypher("MATCH (co:ChurnOutcome) RETURN count(co) AS n")[0]["n"]
-        n_causes = client.run_cypher("MATCH ()-[r:CAUSES]->() RETURN count(r) AS n")[0]["n"]
-        print(f"ChurnOutcome nodes: {n_outcomes}")
-        print(f"CAUSES edges: {n_causes}")
+        apply_schema(client)
+
+        print(f"Overlay factors ({spec.name}): {len(spec.factors)}")
+        if args.mode == "segment":
+            counts = build_segment_overlay(client, args.min_support, args.min_lift, spec=spec)
+        else:
+            counts = build_customer_overlay(
+                client, full=args.full, chunk_size=args.chunk_size, spec=spec
+            )
+            print(f"Customers updated: {counts['changed']}, stale outcomes removed: {counts['removed']}")
+        print(f"ChurnOutcome nodes ({args.mode}): {counts['outcomes']}")
+        print(f"CAUSES edges ({args.mode}): {counts['causes']}")
+        print(f"Graph write generation: {bump_write_generation(client)}")
 
     finally:
         client.close()
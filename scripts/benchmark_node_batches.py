@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Compare per-row Pydantic NodeBase mapping with columnar NodeBatch mapping:
+transform throughput (rows/s) and peak traced memory for N synthetic
+customer-like records. No Neo4j needed.
+
+Run from project root: uv run python scripts/benchmark_node_batches.py --rows 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from data_pipeline.transform import to_node_models, to_nodes  # noqa: E402
+
+
+def synthetic_rows(n: int) -> list[dict]:
+    statuses = ("Stayed", "Churned", "Joined")
+    return [
+        {
+            "id": f"{i:07d}-CUST",
+            "label": "Customer",
+            "age": 18 + i % 60,
+            "tenureMonths": i % 72,
+            "monthlyCharge": 20.0 + (i % 100) * 0.85,
+            "customerStatus": statuses[i % 3],
+        }
+        for i in range(n)
+    ]
+
+
+def measure(name: str, fn, rows: list[dict]) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn(rows)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        "path": name,
+        "seconds": elapsed,
+        "rows_per_s": len(rows) / elapsed if elapsed > 0 else 0.0,
+        "peak_mb": peak / 1_048_576,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NodeBase vs NodeBatch transforms.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.rows)
+    results = [
+        measure("pydantic NodeBase", to_node_models, rows),
+        measure("columnar NodeBatch", to_nodes, rows),
+    ]
+    scale = 1_000_000 / max(1, args.rows)
+    print(f"{args.rows} rows (memory also scaled to per 1M nodes)")
+    for r in results:
+        print(
+            f"  {r['path']:<20} {r['seconds']:.2f}s  {r['rows_per_s']:>10.0f} rows/s  "
+            f"peak {r['peak_mb']:.1f} MB  ({r['peak_mb'] * scale:.1f} MB per 1M)"
+        )
+
+
+if __name__ == "__main__":
+    main()
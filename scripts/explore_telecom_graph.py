@@ -12,6 +12,7 @@ PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 os.chdir(PROJECT_ROOT)
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
 
+from graph.causal_kg import customer_columns
 from graph.neo4j_client import Neo4jClient
 
 
@@ -22,15 +23,11 @@ def load_settings():
 
 def main():
     settings = load_settings()
-    client = Neo4jClient(
-        settings.neo4j_uri,
-        settings.neo4j_user,
-        settings.neo4j_password,
-    )
+    client = Neo4jClient.from_settings(settings)
 
     try:
         client.connect()
-        run = client.run_cypher
+        run = client.run_cypher_iter
         print("=== Node counts (by label) ===")
         for r in run("MATCH (n) RETURN labels(n)[0] AS label, count(*) AS cnt ORDER BY cnt DESC"):
             print(f"  {r['label']}: {r['cnt']}")
@@ -71,6 +68,16 @@ def main():
         for r in rows:
             print(f"  {r}")
 
+        print("\n=== Numeric customer properties by status (columnar pull) ===")
+        cols = customer_columns(client, ("monthlyCharge", "tenureMonths", "totalRevenue"))
+        statuses = cols["customerStatus"]
+        for prop in ("monthlyCharge", "tenureMonths", "totalRevenue"):
+            values = cols[prop]
+            for status in sorted({s for s in statuses if s}):
+                picked = [v for v, s in zip(values, statuses) if s == status and v == v and v is not None]
+                mean = sum(picked) / len(picked) if picked else float("nan")
+                print(f"  {prop} | {status}: mean={mean:.2f} (n={len(picked)})")
+
     finally:
         client.close()
 
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Export the IBM Telco CSVs as neo4j-admin bulk import files:
+  - nodes:  Customer, Contract, Offer, InternetType, PaymentMethod, City, ZipCode, Table, Field
+  - rels:   IN_ZIPCODE, HAS_CONTRACT, HAS_OFFER, HAS_INTERNET_TYPE, HAS_PAYMENT_METHOD, IN_CITY, HAS_FIELD
+  - optional causal overlay (--with-overlay): ChurnOutcome, HAS_OUTCOME, CAUSES
+
+Customer rows are streamed and mapped with the same CUSTOMER_PROPERTIES /
+CUSTOMER_LINKS as import_telecom_data.py (both derived from
+src/specs/mappings/telecom_customers.yml), so `neo4j-admin database import`
+and the Bolt importer produce identical graphs. Only distinct dimension
+values are held in memory.
+
+Run from project root: uv run python scripts/export_admin_import.py --out-dir import
+"""
+
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+from import_telecom_data import (  # noqa: E402
+    CUSTOMER_LINKS,
+    CUSTOMER_PROPERTIES,
+    iter_customer_rows,
+    iter_zipcode_rows,
+    read_data_dictionary,
+)
+from graph.causal_overlay import (  # noqa: E402
+    DEFAULT_OVERLAY_SPEC,
+    DEFAULT_SPEC_PATH,
+    BinnedFactor,
+    OverlaySpec,
+    load_overlay_spec,
+)
+
+# CUSTOMER_PROPERTIES type -> neo4j-admin header type
+HEADER_TYPES = {"str": "", "str?": "", "int": ":int", "float": ":float"}
+
+
+def _field(value) -> str:
+    """One CSV field: None is an empty (absent) cell, "" is a quoted empty string.
+
+    neo4j-admin skips the property for an empty cell but stores "" when quoted;
+    csv.writer cannot tell the two apart (QUOTE_NOTNULL needs Python 3.12).
+    """
+    if value is None:
+        return ""
+    text = str(value)
+    if not text or any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+class AdminCsvWriter:
+    """Minimal csv.writer stand-in using _field quoting."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def writerow(self, row) -> None:
+        self._f.write(",".join(_field(v) for v in row) + "\r\n")
+
+
+class RelWriter:
+    """One relationship file per (type, start ID space, end ID space), opened lazily."""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self._files: dict[tuple[str, str, str], tuple] = {}
+        self.counts: dict[str, int] = {}
+
+    def write(self, rel_type: str, start_space: str, start_id: str, end_space: str, end_id: str):
+        key = (rel_type, start_space, end_space)
+        if key not in self._files:
+            name = f"rels_{start_space}_{rel_type}_{end_space}.csv".lower()
+            f = open(os.path.join(self.out_dir, name), "w", newline="", encoding="utf-8")
+            writer = AdminCsvWriter(f)
+            writer.writerow([f":START_ID({start_space})", f":END_ID({end_space})", ":TYPE"])
+            self._files[key] = (f, writer)
+        self._files[key][1].writerow([start_id, end_id, rel_type])
+        self.counts[rel_type] = self.counts.get(rel_type, 0) + 1
+
+    def paths(self) -> list[str]:
+        return [f.name for f, _ in self._files.values()]
+
+    def close(self) -> None:
+        for f, _ in self._files.values():
+            f.close()
+
+
+def _write_nodes(path: str, header: list[str], rows) -> int:
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = AdminCsvWriter(f)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            n += 1
+    return n
+
+
+def export(
+    churn_path: str,
+    zip_path: str,
+    dict_path: str,
+    out_dir: str,
+    with_overlay: bool = False,
+    overlay_spec: OverlaySpec = DEFAULT_OVERLAY_SPEC,
+) -> dict:
+    """Write node/relationship CSVs into out_dir. Returns file paths and counts."""
+    os.makedirs(out_dir, exist_ok=True)
+    counts: dict[str, int] = {}
+    node_files: list[str] = []
+    rels = RelWriter(out_dir)
+    dims = {label: set() for label, _, _, _ in CUSTOMER_LINKS}
+    key_of = {rel: (label, key) for label, key, rel, _ in CUSTOMER_LINKS}
+
+    try:
+        customer_path = os.path.join(out_dir, "nodes_customer.csv")
+        outcome_path = os.path.join(out_dir, "nodes_churn_outcome.csv")
+        header = ["id:ID(Customer)"]
+        header += [f"{prop}{HEADER_TYPES[kind]}" for prop, _, kind in CUSTOMER_PROPERTIES]
+        header += ["contentHash", ":LABEL"]
+        outcome_file = None
+        if with_overlay:
+            outcome_file = open(outcome_path, "w", newline="", encoding="utf-8")
+        outcome_writer = AdminCsvWriter(outcome_file) if outcome_file else None
+        if outcome_writer:
+            outcome_writer.writerow(["id:ID(ChurnOutcome)", "customerId", "scope", ":LABEL"])
+            counts["ChurnOutcome"] = 0
+
+        def customer_nodes():
+            for row in iter_customer_rows(churn_path):
+                cid = row["id"]
+                for rel_type, values in row["links"].items():
+                    label, _ = key_of[rel_type]
+                    for value in values:
+                        dims[label].add(value)
+                        rels.write(rel_type, "Customer", cid, label, value)
+                if outcome_writer and row["props"].get("customerStatus") == "Churned":
+                    outcome_id = f"churn:{cid}"
+                    outcome_writer.writerow([outcome_id, cid, "customer", "ChurnOutcome"])
+                    counts["ChurnOutcome"] += 1
+                    rels.write("HAS_OUTCOME", "Customer", cid, "ChurnOutcome", outcome_id)
+                    for factor in overlay_spec.factors:
+                        if isinstance(factor, BinnedFactor):
+                            bin_id = factor.bin_for(row["props"].get(factor.property))
+                            if bin_id is not None:
+                                rels.write("CAUSES", "FactorBin", bin_id, "ChurnOutcome", outcome_id)
+                            continue
+                        for value in row["links"].get(factor.relationship, ()):
+                            rels.write("CAUSES", factor.label, value, "ChurnOutcome", outcome_id)
+                props = row["props"]
+                values = [props[p] for p, _, _ in CUSTOMER_PROPERTIES]
+                yield [cid, *values, row["hash"], "Customer"]
+
+        try:
+            counts["Customer"] = _write_nodes(customer_path, header, customer_nodes())
+        finally:
+            if outcome_file:
+                outcome_file.close()
+        node_files.append(customer_path)
+        if with_overlay:
+            node_files.append(outcome_path)
+            bins = [row for factor in overlay_spec.binned for row in factor.bin_rows()]
+            if bins:
+                bin_path = os.path.join(out_dir, "nodes_factor_bin.csv")
+                counts["FactorBin"] = _write_nodes(
+                    bin_path,
+                    ["id:ID(FactorBin)", "name", "property", "lower:float", "upper:float", ":LABEL"],
+                    ([b["id"], b["id"], b["property"], b["lower"], b["upper"], "FactorBin"]
+                     for b in bins),
+                )
+                node_files.append(bin_path)
+
+        # ZipCode: population file first, then zips only referenced by customers
+        zip_nodes = os.path.join(out_dir, "nodes_zipcode.csv")
+        populations: dict[str, object] = {}
+        for r in iter_zipcode_rows(zip_path):
+            populations[r["zipCode"]] = r["population"]
+        for z in dims.pop("ZipCode"):
+            populations.setdefault(z, None)
+        counts["ZipCode"] = _write_nodes(
+            zip_nodes,
+            ["zipCode:ID(ZipCode)", "population:int", ":LABEL"],
+            ([z, p, "ZipCode"] for z, p in sorted(populations.items())),
+        )
+        node_files.append(zip_nodes)
+
+        for label, key, _, _ in CUSTOMER_LINKS:
+            if label not in dims:
+                continue
+            path = os.path.join(out_dir, f"nodes_{label.lower()}.csv")
+            counts[label] = _write_nodes(
+                path, [f"{key}:ID({label})", ":LABEL"], ([v, label] for v in sorted(dims[label]))
+            )
+            node_files.append(path)
+
+        fields: dict[tuple[str, str], object] = {}
+        for r in read_data_dictionary(dict_path):
+            fields[(r["table"], r["field"])] = r["description"]
+        tables = sorted({table for table, _ in fields})
+        table_path = os.path.join(out_dir, "nodes_table.csv")
+        counts["Table"] = _write_nodes(
+            table_path, ["name:ID(Table)", ":LABEL"], ([t, "Table"] for t in tables)
+        )
+        field_path = os.path.join(out_dir, "nodes_field.csv")
+        counts["Field"] = _write_nodes(
+            field_path,
+            [":ID(Field)", "name", "tableName", "description", ":LABEL"],
+            ([f"{t}|{name}", name, t, desc, "Field"] for (t, name), desc in fields.items()),
+        )
+        node_files += [table_path, field_path]
+        for t, name in fields:
+            rels.write("HAS_FIELD", "Table", t, "Field", f"{t}|{name}")
+    finally:
+        rels.close()
+
+    counts.update(rels.counts)
+    return {"nodes": node_files, "relationships": rels.paths(), "counts": counts}
+
+
+def admin_command(result: dict, database: str = "neo4j") -> str:
+    parts = ["neo4j-admin database import full", "--overwrite-destination"]
+    parts += [f"--nodes={p}" for p in result["nodes"]]
+    parts += [f"--relationships={p}" for p in result["relationships"]]
+    parts.append(database)
+    return " \\\n  ".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export telecom CSVs for neo4j-admin database import."
+    )
+    parser.add_argument("--out-dir", default="import", help="Output directory (default: %(default)s).")
+    parser.add_argument("--with-overlay", action="store_true", help="Also export ChurnOutcome/CAUSES.")
+    parser.add_argument("--factors", default=str(DEFAULT_SPEC_PATH),
+                        help="Overlay factor spec YAML for --with-overlay (default: %(default)s).")
+    parser.add_argument("--database", default="neo4j", help="Target database name in the printed command.")
+    args = parser.parse_args()
+
+    result = export(
+        os.path.join(SCRIPT_DIR, "telecom_customer_churn.csv"),
+        os.path.join(SCRIPT_DIR, "telecom_zipcode_population.csv"),
+        os.path.join(SCRIPT_DIR, "telecom_data_dictionary.csv"),
+        args.out_dir,
+        with_overlay=args.with_overlay,
+        overlay_spec=load_overlay_spec(args.factors),
+    )
+    for name, n in result["counts"].items():
+        print(f"  {name}: {n}")
+    print("\nLoad with (database must be stopped):")
+    print(admin_command(result, args.database))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,31 @@ Import local IBM Telco data into Neo4j:
   - scripts/telecom_zipcode_population.csv -> ZipCode nodes
   - scripts/telecom_data_dictionary.csv   -> Table + Field nodes (metadata)
 
-Run from project root: uv run python scripts/import_telecom_data.py
+Rows are written in UNWIND batches inside explicit write transactions.
+
+Run from project root: uv run python scripts/import_telecom_data.py [--batch-size 1000]
 """
 
-import csv
+import argparse
 import os
+import queue
 import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 os.chdir(PROJECT_ROOT)
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
 
-from neo4j import GraphDatabase
+from data_pipeline.extract import extract_from_csv
+from data_pipeline.mapping import load_mapping
+from data_pipeline.transform import content_hash
+from graph.neo4j_client import Neo4jClient
+from graph.query_cache import bump_write_generation
+from graph.schema import apply_schema, schema_drift
 
 
 def load_settings():
@@ -25,218 +37,483 @@ def load_settings():
     return get_settings()
 
 
-def strip_row(r):
-    return {k.strip(): (v.strip() if isinstance(v, str) else v) for k, v in r.items()}
+# The Customer mapping spec is the single source of truth for property columns,
+# types and dimension links; scripts/load_mapping.py loads the same file.
+TELECOM_MAPPING = load_mapping(
+    os.path.join(PROJECT_ROOT, "src", "specs", "mappings", "telecom_customers.yml")
+)
 
+# (property, CSV column, type) for Customer node properties. Types are
+# data_pipeline.extract.COLUMN_TYPES keys: "str" keeps the stripped value,
+# "str?" turns empty strings into null.
+CUSTOMER_PROPERTIES = tuple(
+    (prop, spec.column, spec.type) for prop, spec in TELECOM_MAPPING.node.properties.items()
+)
 
-def safe_float(s):
-    if s is None or (isinstance(s, str) and not s.strip()):
-        return None
-    try:
-        return float(s)
-    except (ValueError, TypeError):
-        return None
+# (label, key property, relationship type, CSV column) for dimension links
+# from Customer.
+CUSTOMER_LINKS = tuple(
+    (dim.label, dim.key, dim.relationship, dim.column) for dim in TELECOM_MAPPING.dimensions
+)
 
+# Per relationship, dimension values that mean "no link" (Offer uses "None").
+LINK_NULL_VALUES = {
+    dim.relationship: {v.lower() for v in dim.null_values} for dim in TELECOM_MAPPING.dimensions
+}
 
-def safe_int(s):
-    if s is None or (isinstance(s, str) and not s.strip()):
+CUSTOMER_COLUMN_TYPES = {col: kind for _, col, kind in CUSTOMER_PROPERTIES}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def link_value(rel_type: str, raw):
+    """Return the dimension value a customer links to via rel_type, or None."""
+    value = (raw or "").strip()
+    if value.lower() in LINK_NULL_VALUES.get(rel_type, ()):
         return None
-    try:
-        return int(float(s))
-    except (ValueError, TypeError):
+    return value or None
+
+
+def customer_row(r: dict):
+    """Map a typed CSV row (CUSTOMER_COLUMN_TYPES) to the CUSTOMER_QUERY parameter shape."""
+    cid = (r.get(TELECOM_MAPPING.node.key_column) or "").strip()
+    if not cid:
         return None
+    props = {prop: r.get(col) for prop, col, _ in CUSTOMER_PROPERTIES}
+    links = {}
+    for _, _, rel_type, column in CUSTOMER_LINKS:
+        value = link_value(rel_type, r.get(column))
+        links[rel_type] = [value] if value else []
+    return {"id": cid, "props": props, "links": links, "hash": content_hash(props, links)}
+
+
+def _customer_query(drop_links: bool = False) -> str:
+    """Customer MERGE + dimension links; `drop_links` first removes managed links.
+
+    Changed customers may have moved to another contract/offer/city, so the
+    upsert variant deletes the managed dimension links before re-linking.
+    """
+    link_clauses = "\n".join(
+        f"FOREACH (v IN r.links.{rel} | MERGE (d:{label} {{{key}: v}}) MERGE (c)-[:{rel}]->(d))"
+        for label, key, rel, _ in CUSTOMER_LINKS
+    )
+    cleanup = ""
+    if drop_links:
+        rel_types = "|".join(rel for _, _, rel, _ in CUSTOMER_LINKS)
+        cleanup = f"CALL {{ WITH c MATCH (c)-[old:{rel_types}]->() DELETE old }}\n"
+    return f"""
+UNWIND $rows AS r
+MERGE (c:Customer {{id: r.id}})
+{cleanup}SET c += r.props, c.contentHash = r.hash
+{link_clauses}
+"""
+
+
+CUSTOMER_QUERY = _customer_query()
+CUSTOMER_UPSERT_QUERY = _customer_query(drop_links=True)
+
+DELETE_CUSTOMERS_QUERY = """
+UNWIND $rows AS id
+MATCH (c:Customer {id: id})
+OPTIONAL MATCH (c)-[:HAS_OUTCOME]->(co:ChurnOutcome)
+DETACH DELETE c, co
+"""
+
+ZIPCODE_QUERY = """
+UNWIND $rows AS r
+MERGE (z:ZipCode {zipCode: r.zipCode})
+SET z.population = r.population
+"""
+
+DATA_DICTIONARY_QUERY = """
+UNWIND $rows AS r
+MERGE (t:Table {name: r.table})
+MERGE (f:Field {name: r.field, tableName: r.table})
+SET f.description = r.description
+MERGE (t)-[:HAS_FIELD]->(f)
+"""
 
 
-def load_zipcodes(driver, path: str) -> int:
-    with open(path, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
+def batched(rows, size: int):
+    """Yield lists of at most size rows from any iterable."""
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, max(1, size)))
+        if not batch:
+            return
+        yield batch
+
+
+def write_batches(
+    driver,
+    query: str,
+    rows,
+    label: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_per_batch: bool = True,
+) -> int:
+    """Send rows to `query` as $rows in chunks inside explicit write transactions.
+
+    With commit_per_batch each chunk is committed on its own; otherwise all
+    chunks share one transaction that commits at the end. Prints throughput.
+    """
+    started = time.perf_counter()
+    total = 0
     with driver.session() as session:
-        session.run("MATCH (z:ZipCode) DETACH DELETE z")
-        for r in rows:
-            r = strip_row(r)
-            zip_code = (r.get("Zip Code") or "").strip()
-            pop = safe_int(r.get("Population", ""))
-            if not zip_code:
-                continue
-            session.run(
-                "MERGE (z:ZipCode {zipCode: $zipCode}) SET z.population = $population",
-                zipCode=zip_code,
-                population=pop,
-            )
-    return len(rows)
+        tx = None
+        try:
+            for batch in batched(rows, batch_size):
+                if tx is None:
+                    tx = session.begin_transaction()
+                tx.run(query, rows=batch).consume()
+                total += len(batch)
+                if commit_per_batch:
+                    tx.commit()
+                    tx = None
+                if total % 1000 < len(batch):
+                    print(f"  {label}: {total}...")
+            if tx is not None:
+                tx.commit()
+                tx = None
+        finally:
+            if tx is not None:
+                tx.rollback()
+    report_throughput(label, total, time.perf_counter() - started)
+    return total
+
+
+def report_throughput(label: str, rows: int, elapsed: float) -> None:
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"  {label}: {rows} rows in {elapsed:.2f}s ({rate:.0f} rows/s)")
+
+
+def load_zipcodes(
+    driver,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_per_batch: bool = True,
+    wipe: bool = True,
+) -> int:
+    if wipe:
+        with driver.session() as session:
+            session.run("MATCH (z:ZipCode) DETACH DELETE z").consume()
+    return write_batches(
+        driver, ZIPCODE_QUERY, iter_zipcode_rows(path), "ZipCode", batch_size, commit_per_batch
+    )
+
+
+def iter_zipcode_rows(path: str):
+    """Stream zipcode CSV rows mapped to ZIPCODE_QUERY parameters."""
+    for batch in extract_from_csv(path, types={"Population": "int"}):
+        for r in batch:
+            if r.get("Zip Code"):
+                yield {"zipCode": r["Zip Code"], "population": r.get("Population")}
+
+
+def wipe_customers(driver) -> None:
+    with driver.session() as session:
+        session.run("MATCH (c:Customer) DETACH DELETE c").consume()
+        for label, _, _, _ in CUSTOMER_LINKS:
+            if label != "ZipCode":
+                session.run(f"MATCH (n:{label}) DETACH DELETE n").consume()
+
+
+def iter_customer_rows(path: str):
+    """Stream customer CSV rows already mapped by customer_row (blank ids skipped)."""
+    for batch in extract_from_csv(path, types=CUSTOMER_COLUMN_TYPES):
+        for r in batch:
+            row = customer_row(r)
+            if row:
+                yield row
+
+
+def load_customers(
+    driver,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_per_batch: bool = True,
+) -> int:
+    wipe_customers(driver)
+    return write_batches(
+        driver,
+        CUSTOMER_QUERY,
+        iter_customer_rows(path),
+        "Customer",
+        batch_size,
+        commit_per_batch,
+    )
+
 
+def partition_of(customer_id: str, workers: int) -> int:
+    """Stable partition for a customer id (crc32, so identical across runs and processes)."""
+    return zlib.crc32(customer_id.encode("utf-8")) % workers
 
-def load_customers(driver, path: str) -> int:
-    with open(path, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-    if not rows:
+
+def merge_dimensions(driver, values: dict) -> int:
+    """Create the given {relationship: dimension values} nodes in one transaction.
+
+    Parallel writers then only MERGE onto existing Contract/Offer/City/ZipCode
+    nodes, so concurrent MERGEs cannot create duplicates and lock contention is
+    limited to relationship creation.
+    """
+
+    def work(tx):
+        for label, key, rel, _ in CUSTOMER_LINKS:
+            if values.get(rel):
+                tx.run(
+                    f"UNWIND $values AS v MERGE (:{label} {{{key}: v}})",
+                    values=sorted(values[rel]),
+                ).consume()
+
+    if not any(values.values()):
         return 0
+    with driver.session() as session:
+        session.execute_write(work)
+    return sum(len(v) for v in values.values())
+
+
+def _customer_worker(driver, worker_id: int, batches: queue.Queue) -> dict:
+    attempts = 0
+    done = 0
+    rows = 0
+
+    def work(tx, batch):
+        # Called again by the driver when the transaction hits a transient
+        # error (e.g. DeadlockDetected on a shared dimension node).
+        nonlocal attempts
+        attempts += 1
+        tx.run(CUSTOMER_QUERY, rows=batch).consume()
 
+    started = time.perf_counter()
     with driver.session() as session:
-        session.run("MATCH (c:Customer) DETACH DELETE c")
-        session.run("MATCH (n:Contract) DETACH DELETE n")
-        session.run("MATCH (n:Offer) DETACH DELETE n")
-        session.run("MATCH (n:InternetType) DETACH DELETE n")
-        session.run("MATCH (n:PaymentMethod) DETACH DELETE n")
-        session.run("MATCH (n:City) DETACH DELETE n")
-
-        for i, raw in enumerate(rows):
-            r = strip_row(raw)
-            cid = (r.get("Customer ID") or "").strip()
-            if not cid:
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            session.execute_write(work, batch)
+            done += 1
+            rows += len(batch)
+    return {
+        "worker": worker_id,
+        "rows": rows,
+        "batches": done,
+        "retries": attempts - done,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def _put(batches: queue.Queue, item, future) -> None:
+    """Queue item for a worker, surfacing the worker's error instead of blocking forever."""
+    while True:
+        if future.done():
+            future.result()
+            raise RuntimeError("Import worker exited before the input was exhausted.")
+        try:
+            batches.put(item, timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+def _close(batches: queue.Queue, future) -> None:
+    """Send a worker its stop sentinel unless it already exited (never blocks forever)."""
+    while not future.done():
+        try:
+            batches.put(None, timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+def load_customers_parallel(
+    driver,
+    path: str,
+    workers: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Load customers with `workers` writer threads, each owning a hash partition.
+
+    The CSV is read once: dimension values are collected while rows are
+    partitioned and merged before the first batch that links to them. Rows
+    are partitioned by crc32(Customer ID); every worker has its own session
+    and writes its batches in managed write transactions, which the driver
+    retries on TransientError (including deadlocks) up to
+    max_transaction_retry_time.
+    """
+    wipe_customers(driver)
+    queues = [queue.Queue(maxsize=4) for _ in range(workers)]
+    pending = [[] for _ in range(workers)]
+    seen = {rel: set() for _, _, rel, _ in CUSTOMER_LINKS}
+    new_dims = {rel: set() for rel in seen}
+    n_dims = 0
+
+    def flush_dimensions():
+        # A batch is queued only after every dimension value it links to exists.
+        nonlocal n_dims
+        n_dims += merge_dimensions(driver, new_dims)
+        for values in new_dims.values():
+            values.clear()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import") as pool:
+        futures = [
+            pool.submit(_customer_worker, driver, i, queues[i]) for i in range(workers)
+        ]
+        try:
+            for row in iter_customer_rows(path):
+                for rel, linked in row["links"].items():
+                    for value in linked:
+                        if value not in seen[rel]:
+                            seen[rel].add(value)
+                            new_dims[rel].add(value)
+                part = partition_of(row["id"], workers)
+                pending[part].append(row)
+                if len(pending[part]) >= batch_size:
+                    flush_dimensions()
+                    _put(queues[part], pending[part], futures[part])
+                    pending[part] = []
+            flush_dimensions()
+            for part, rows in enumerate(pending):
+                if rows:
+                    _put(queues[part], rows, futures[part])
+        finally:
+            for part in range(workers):
+                _close(queues[part], futures[part])
+        stats = [f.result() for f in futures]
+
+    for s in sorted(stats, key=lambda x: x["worker"]):
+        rate = s["rows"] / s["seconds"] if s["seconds"] > 0 else 0.0
+        print(
+            f"  worker {s['worker']}: {s['rows']} rows in {s['batches']} batches, "
+            f"{s['retries']} retries, {s['seconds']:.2f}s ({rate:.0f} rows/s)"
+        )
+    print(f"  Dimension nodes: {n_dims}")
+    total = sum(s["rows"] for s in stats)
+    report_throughput("Customer", total, time.perf_counter() - started)
+    return total
+
+
+def load_customers_incremental(
+    driver,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_per_batch: bool = True,
+) -> dict:
+    """Upsert only new/changed customers and delete vanished ones.
+
+    Each Customer stores `contentHash` (see content_hash); rows whose hash
+    matches the stored one are skipped, so a nightly file where few customers
+    changed costs one id/hash scan plus the delta writes. Without
+    commit_per_batch, the upserts and the deletes each run in one transaction.
+    """
+    with driver.session() as session:
+        result = session.run("MATCH (c:Customer) RETURN c.id AS id, c.contentHash AS hash")
+        existing = {record["id"]: record["hash"] for record in result}
+
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+    seen = set()
+
+    def changed_rows():
+        for row in iter_customer_rows(path):
+            cid = row["id"]
+            if cid in seen:
+                continue
+            seen.add(cid)
+            if cid not in existing:
+                counts["inserted"] += 1
+            elif existing[cid] != row["hash"]:
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
                 continue
+            yield row
 
-            session.run(
-                """
-                MERGE (c:Customer {id: $id})
-                SET c.gender = $gender, c.age = $age, c.married = $married,
-                    c.numberOfDependents = $numberOfDependents, c.city = $city,
-                    c.zipCode = $zipCode, c.latitude = $latitude, c.longitude = $longitude,
-                    c.numberOfReferrals = $numberOfReferrals, c.tenureMonths = $tenureMonths,
-                    c.offer = $offer, c.phoneService = $phoneService,
-                    c.avgMonthlyLongDistanceCharges = $avgMonthlyLongDistanceCharges,
-                    c.multipleLines = $multipleLines, c.internetService = $internetService,
-                    c.internetType = $internetType, c.avgMonthlyGBDownload = $avgMonthlyGBDownload,
-                    c.onlineSecurity = $onlineSecurity, c.onlineBackup = $onlineBackup,
-                    c.deviceProtectionPlan = $deviceProtectionPlan,
-                    c.premiumTechSupport = $premiumTechSupport,
-                    c.streamingTV = $streamingTV, c.streamingMovies = $streamingMovies,
-                    c.streamingMusic = $streamingMusic, c.unlimitedData = $unlimitedData,
-                    c.contract = $contract, c.paperlessBilling = $paperlessBilling,
-                    c.paymentMethod = $paymentMethod, c.monthlyCharge = $monthlyCharge,
-                    c.totalCharges = $totalCharges, c.totalRefunds = $totalRefunds,
-                    c.totalExtraDataCharges = $totalExtraDataCharges,
-                    c.totalLongDistanceCharges = $totalLongDistanceCharges,
-                    c.totalRevenue = $totalRevenue, c.customerStatus = $customerStatus,
-                    c.churnCategory = $churnCategory, c.churnReason = $churnReason
-                """,
-                id=cid,
-                gender=r.get("Gender"),
-                age=safe_int(r.get("Age")),
-                married=r.get("Married"),
-                numberOfDependents=safe_int(r.get("Number of Dependents")),
-                city=r.get("City"),
-                zipCode=r.get("Zip Code"),
-                latitude=safe_float(r.get("Latitude")),
-                longitude=safe_float(r.get("Longitude")),
-                numberOfReferrals=safe_int(r.get("Number of Referrals")),
-                tenureMonths=safe_int(r.get("Tenure in Months")),
-                offer=r.get("Offer") or None,
-                phoneService=r.get("Phone Service"),
-                avgMonthlyLongDistanceCharges=safe_float(r.get("Avg Monthly Long Distance Charges")),
-                multipleLines=r.get("Multiple Lines"),
-                internetService=r.get("Internet Service"),
-                internetType=r.get("Internet Type") or None,
-                avgMonthlyGBDownload=safe_float(r.get("Avg Monthly GB Download")),
-                onlineSecurity=r.get("Online Security"),
-                onlineBackup=r.get("Online Backup"),
-                deviceProtectionPlan=r.get("Device Protection Plan"),
-                premiumTechSupport=r.get("Premium Tech Support"),
-                streamingTV=r.get("Streaming TV"),
-                streamingMovies=r.get("Streaming Movies"),
-                streamingMusic=r.get("Streaming Music"),
-                unlimitedData=r.get("Unlimited Data"),
-                contract=r.get("Contract"),
-                paperlessBilling=r.get("Paperless Billing"),
-                paymentMethod=r.get("Payment Method"),
-                monthlyCharge=safe_float(r.get("Monthly Charge")),
-                totalCharges=safe_float(r.get("Total Charges")),
-                totalRefunds=safe_float(r.get("Total Refunds")),
-                totalExtraDataCharges=safe_float(r.get("Total Extra Data Charges")),
-                totalLongDistanceCharges=safe_float(r.get("Total Long Distance Charges")),
-                totalRevenue=safe_float(r.get("Total Revenue")),
-                customerStatus=r.get("Customer Status"),
-                churnCategory=r.get("Churn Category") or None,
-                churnReason=r.get("Churn Reason") or None,
-            )
+    write_batches(
+        driver, CUSTOMER_UPSERT_QUERY, changed_rows(), "Customer (changed)", batch_size, commit_per_batch
+    )
+    vanished = [cid for cid in existing if cid not in seen]
+    counts["deleted"] = write_batches(
+        driver, DELETE_CUSTOMERS_QUERY, vanished, "Customer (deleted)", batch_size, commit_per_batch
+    )
+    print(
+        "  inserted={inserted} updated={updated} unchanged={unchanged} deleted={deleted}".format(
+            **counts
+        )
+    )
+    return counts
+
+
+def load_data_dictionary(
+    driver,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_per_batch: bool = True,
+    wipe: bool = True,
+) -> int:
+    if wipe:
+        with driver.session() as session:
+            session.run("MATCH (t:Table) DETACH DELETE t").consume()
+            session.run("MATCH (f:Field) DETACH DELETE f").consume()
+    params = read_data_dictionary(path)
+    return write_batches(
+        driver, DATA_DICTIONARY_QUERY, params, "Table/Field", batch_size, commit_per_batch
+    )
 
-            zip_code = (r.get("Zip Code") or "").strip()
-            if zip_code:
-                session.run(
-                    "MERGE (z:ZipCode {zipCode: $zipCode}) MERGE (c:Customer {id: $cid}) MERGE (c)-[:IN_ZIPCODE]->(z)",
-                    zipCode=zip_code,
-                    cid=cid,
-                )
-
-            contract = (r.get("Contract") or "").strip()
-            if contract:
-                session.run(
-                    "MERGE (ct:Contract {name: $name}) MERGE (c:Customer {id: $cid}) MERGE (c)-[:HAS_CONTRACT]->(ct)",
-                    name=contract,
-                    cid=cid,
-                )
-
-            offer = (r.get("Offer") or "").strip()
-            if offer and offer.lower() != "none":
-                session.run(
-                    "MERGE (o:Offer {name: $name}) MERGE (c:Customer {id: $cid}) MERGE (c)-[:HAS_OFFER]->(o)",
-                    name=offer,
-                    cid=cid,
-                )
-
-            internet_type = (r.get("Internet Type") or "").strip()
-            if internet_type:
-                session.run(
-                    "MERGE (it:InternetType {name: $name}) MERGE (c:Customer {id: $cid}) MERGE (c)-[:HAS_INTERNET_TYPE]->(it)",
-                    name=internet_type,
-                    cid=cid,
-                )
-
-            payment = (r.get("Payment Method") or "").strip()
-            if payment:
-                session.run(
-                    "MERGE (pm:PaymentMethod {name: $name}) MERGE (c:Customer {id: $cid}) MERGE (c)-[:HAS_PAYMENT_METHOD]->(pm)",
-                    name=payment,
-                    cid=cid,
-                )
-
-            city = (r.get("City") or "").strip()
-            if city:
-                session.run(
-                    "MERGE (city:City {name: $name}) MERGE (c:Customer {id: $cid}) MERGE (c)-[:IN_CITY]->(city)",
-                    name=city,
-                    cid=cid,
-                )
-
-            if (i + 1) % 1000 == 0:
-                print(f"  Customers: {i + 1}...")
-
-    return len(rows)
-
-
-def load_data_dictionary(driver, path: str) -> int:
+
+def read_data_dictionary(path: str) -> list[dict]:
+    """Read data dictionary rows mapped to DATA_DICTIONARY_QUERY parameters."""
     # Data dictionary often uses Windows encoding (CP1252); 0x92 = right single quote
-    try:
-        with open(path, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
-    except UnicodeDecodeError:
-        with open(path, newline="", encoding="cp1252") as f:
-            rows = list(csv.DictReader(f))
-    with driver.session() as session:
-        session.run("MATCH (t:Table) DETACH DELETE t")
-        session.run("MATCH (f:Field) DETACH DELETE f")
-        for r in rows:
-            r = strip_row(r)
-            table = (r.get("Table") or "").strip()
-            field = (r.get("Field") or "").strip()
-            desc = (r.get("Description") or "").strip()
-            if not table or not field:
-                continue
-            session.run(
-                """
-                MERGE (t:Table {name: $table})
-                MERGE (f:Field {name: $field, tableName: $table})
-                SET f.description = $description
-                MERGE (t)-[:HAS_FIELD]->(f)
-                """,
-                table=table,
-                field=field,
-                description=desc or None,
-            )
-    return len(rows)
+    params = []
+    types = {"Description": "str?"}
+    for batch in extract_from_csv(path, types=types, fallback_encoding="cp1252"):
+        for r in batch:
+            table = r.get("Table")
+            field = r.get("Field")
+            if table and field:
+                params.append({"table": table, "field": field, "description": r.get("Description")})
+    return params
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Import IBM Telco CSVs into Neo4j.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows sent per UNWIND statement (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--commit-per-batch",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Commit each batch in its own transaction (default) or use one transaction per file.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel customer writer threads, partitioned by Customer ID hash (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--max-retry-time",
+        type=float,
+        default=30.0,
+        help="Seconds the driver keeps retrying transient/deadlock errors in parallel mode.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only upsert customers whose content hash changed and delete vanished ones (no wipe).",
+    )
+    args = parser.parse_args(argv)
+    if args.workers > 1 and not args.commit_per_batch:
+        # Parallel workers always commit per batch; one transaction per file cannot be split.
+        parser.error("--no-commit-per-batch cannot be combined with --workers > 1")
+    return args
 
 
 def main():
+    args = parse_args()
     settings = load_settings()
     base = SCRIPT_DIR
     churn_path = os.path.join(base, "telecom_customer_churn.csv")
@@ -249,25 +526,41 @@ def main():
             sys.exit(1)
 
     print(f"Connecting to {settings.neo4j_uri} ...")
-    driver = GraphDatabase.driver(
-        settings.neo4j_uri,
-        auth=(settings.neo4j_user, settings.neo4j_password),
-    )
+    client = Neo4jClient.from_settings(settings, max_transaction_retry_time=args.max_retry_time)
+    # The loaders only call .session(); the client's sessions record every
+    # write in its QueryStats (fingerprints, histograms, slow-query log).
+    driver = client
 
     try:
+        print("Applying schema constraints/indexes...")
+        apply_schema(client)
+        drift = schema_drift(client)
+        if drift["missing"] or drift["undeclared"]:
+            print(f"  Schema drift: missing={drift['missing']} undeclared={drift['undeclared']}")
+
         print("Loading zipcode population...")
-        nz = load_zipcodes(driver, zip_path)
+        wipe = not args.incremental
+        nz = load_zipcodes(driver, zip_path, args.batch_size, args.commit_per_batch, wipe)
         print(f"  ZipCode nodes: {nz}")
 
         print("Loading customer churn...")
-        nc = load_customers(driver, churn_path)
+        if args.incremental:
+            counts = load_customers_incremental(
+                driver, churn_path, args.batch_size, args.commit_per_batch
+            )
+            nc = counts["inserted"] + counts["updated"] + counts["unchanged"]
+        elif args.workers > 1:
+            nc = load_customers_parallel(driver, churn_path, args.workers, args.batch_size)
+        else:
+            nc = load_customers(driver, churn_path, args.batch_size, args.commit_per_batch)
         print(f"  Customer nodes: {nc}")
 
         print("Loading data dictionary...")
-        nd = load_data_dictionary(driver, dict_path)
+        nd = load_data_dictionary(driver, dict_path, args.batch_size, args.commit_per_batch, wipe)
         print(f"  Table/Field rows: {nd}")
+        print(f"  Graph write generation: {bump_write_generation(client)}")
     finally:
-        driver.close()
+        client.close()
 
     print("Done. All three datasets imported into Neo4j.")
 
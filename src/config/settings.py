@@ -1,6 +1,8 @@
 """Env, model keys, Neo4j config. Load from .env via pydantic-settings."""
 
 from functools import lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +17,21 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = ""
+    neo4j_max_connection_pool_size: int = 100
+    neo4j_connection_acquisition_timeout: float = 60.0
+    neo4j_max_connection_lifetime: float = 3600.0
+    neo4j_liveness_check_timeout: Optional[float] = None
+    neo4j_keep_alive: bool = True
+    # Read-through query cache (0 disables); invalidated by the graph write generation
+    neo4j_query_cache_size: int = 0
+    neo4j_query_cache_ttl: Optional[float] = 300.0
+    neo4j_generation_check_interval: float = 1.0
+    # Query instrumentation: latency histograms per fingerprint, slow-query log, stats dump
+    neo4j_query_stats: bool = True
+    neo4j_slow_query_ms: Optional[float] = 500.0
+    neo4j_slow_query_log: str = ""
+    neo4j_profile_sample_rate: float = 0.0
+    neo4j_query_stats_dump: str = ""
 
     # LLM
     openai_api_key: str = ""
@@ -1,18 +1,557 @@
 """Pull from source DB / CSV / API into raw structures."""
 
-from typing import Any
+import asyncio
+import csv
+import queue
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence
 
+DEFAULT_BATCH_SIZE = 10_000
 
-def extract_from_csv(path: str, **kwargs: Any) -> list[dict]:
-    """Extract rows from a CSV file. Stub."""
-    raise NotImplementedError("Implement CSV extraction (e.g. with pandas or csv).")
 
+def safe_float(s: Any) -> Optional[float]:
+    if s is None or (isinstance(s, str) and not s.strip()):
+        return None
+    try:
+        return float(s)
+    except (ValueError, TypeError):
+        return None
 
-def extract_from_db(uri: str, query: str, **kwargs: Any) -> list[dict]:
-    """Extract rows from a database. Stub."""
-    raise NotImplementedError("Implement DB extraction.")
 
+def safe_int(s: Any) -> Optional[int]:
+    if s is None or (isinstance(s, str) and not s.strip()):
+        return None
+    try:
+        return int(float(s))
+    except (ValueError, TypeError):
+        return None
 
-def extract_from_api(base_url: str, endpoint: str, **kwargs: Any) -> list[dict]:
-    """Extract from an API. Stub."""
-    raise NotImplementedError("Implement API extraction.")
+
+def _float_column(values: tuple) -> list:
+    # Clean columns convert at C speed; blanks/garbage fall back per value.
+    try:
+        return list(map(float, values))
+    except ValueError:
+        return [safe_float(v) for v in values]
+
+
+def _int_column(values: tuple) -> list:
+    try:
+        return list(map(int, values))
+    except ValueError:
+        return [safe_int(v) for v in values]
+
+
+# Column type name -> converter applied to a whole column of raw strings.
+# "str" strips whitespace, "str?" additionally turns empty strings into None.
+COLUMN_TYPES: dict[str, Callable[[tuple], list]] = {
+    "str": lambda values: list(map(str.strip, values)),
+    "str?": lambda values: [v or None for v in map(str.strip, values)],
+    "int": _int_column,
+    "float": _float_column,
+}
+
+
+def _read_batches(
+    path: str,
+    types: dict[str, str],
+    columns: Optional[list[str]],
+    batch_size: int,
+    encoding: str,
+    skip: int,
+    reader_kwargs: dict[str, Any],
+) -> Iterator[list[dict]]:
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, **reader_kwargs)
+        header = [h.strip() for h in next(reader, [])]
+        if not header:
+            return
+        width = len(header)
+        wanted = [i for i, name in enumerate(header) if columns is None or name in columns]
+        names = [header[i] for i in wanted]
+        converters = [COLUMN_TYPES[types.get(name, "str")] for name in names]
+        if skip:
+            for _ in islice(reader, skip):
+                pass
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                return
+            # Short rows are padded like csv.DictReader's restval; extra cells are dropped.
+            rows = [r if len(r) == width else (r + [""] * width)[:width] for r in rows]
+            cols = list(zip(*rows))
+            converted = [conv(cols[i]) for conv, i in zip(converters, wanted)]
+            yield [dict(zip(names, values)) for values in zip(*converted)]
+
+
+def extract_from_csv(
+    path: str,
+    types: Optional[dict[str, str]] = None,
+    columns: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    encoding: str = "utf-8",
+    fallback_encoding: Optional[str] = None,
+    **kwargs: Any,
+) -> Iterator[list[dict]]:
+    """Stream a CSV file as batches of at most batch_size row dicts.
+
+    `types` maps column name -> COLUMN_TYPES key (default "str"); conversion
+    runs once per column per batch. `columns` restricts the output to those
+    columns. If decoding fails with `encoding` and `fallback_encoding` is set
+    (e.g. "cp1252" for Windows exports), reading resumes with the fallback
+    after the rows already yielded. Extra kwargs go to csv.reader.
+    """
+    types = types or {}
+    for name, kind in types.items():
+        if kind not in COLUMN_TYPES:
+            raise ValueError(f"Unknown column type {kind!r} for {name!r}")
+    encodings = [encoding] + ([fallback_encoding] if fallback_encoding else [])
+    yielded = 0
+    for attempt, enc in enumerate(encodings):
+        try:
+            for batch in _read_batches(
+                path, types, columns, max(1, batch_size), enc, yielded, kwargs
+            ):
+                yielded += len(batch)
+                yield batch
+            return
+        except UnicodeDecodeError:
+            if attempt == len(encodings) - 1:
+                raise
+
+
+class ConnectionPool:
+    """Small thread-safe pool of DB-API connections created on demand."""
+
+    def __init__(self, connect: Callable[[], Any], max_size: int = 4):
+        self._connect = connect
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, max_size))
+        self.max_size = max(1, max_size)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_POOLS: dict[tuple[str, int], ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _connect_factory(uri: str) -> Callable[[], Any]:
+    if uri.startswith("sqlite:///"):
+        path = uri[len("sqlite:///"):]
+        # Pool connections are handed to partition worker threads.
+        return lambda: sqlite3.connect(path, check_same_thread=False)
+    raise ValueError(f"Unsupported database URI {uri!r}; pass connect=<DB-API connect callable>.")
+
+
+def get_pool(
+    uri: str,
+    connect: Optional[Callable[[], Any]] = None,
+    max_size: int = 4,
+) -> ConnectionPool:
+    """Return the shared connection pool for (uri, max_size), creating it on first use.
+
+    Pools are keyed by size as well, so a caller asking for more connections
+    (e.g. more partitions) never silently gets an earlier, smaller pool.
+    """
+    key = (uri, max(1, max_size))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ConnectionPool(connect or _connect_factory(uri), max_size)
+            _POOLS[key] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """Close idle connections of every shared pool (e.g. at process shutdown)."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close()
+        _POOLS.clear()
+
+
+def _fetch_batches(
+    pool: ConnectionPool, query: str, params: Sequence[Any], batch_size: int
+) -> Iterator[list[dict]]:
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, tuple(params))
+            names = [d[0] for d in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield [dict(zip(names, row)) for row in rows]
+        finally:
+            cursor.close()
+
+
+def _partition_bounds(lo: Any, hi: Any, partitions: int) -> list[tuple[Any, Any, bool]]:
+    """Split [lo, hi] into (start, end, inclusive_end) ranges.
+
+    Keys must support subtraction and scaling (int, float, Decimal, date,
+    datetime); text keys are split by _quantile_bounds instead.
+    """
+    if lo is None or hi is None:
+        return []
+    if isinstance(lo, int) and isinstance(hi, int):
+        step = max(1, -(-(hi - lo + 1) // partitions))
+        edges = list(range(lo, hi + 1, step)) + [hi + 1]
+        return [(a, b, False) for a, b in zip(edges, edges[1:])]
+    try:
+        step = (hi - lo) / partitions
+        edges = [lo + i * step for i in range(partitions)] + [hi]
+    except TypeError:
+        raise ValueError(
+            f"Cannot range-partition keys of type {type(lo).__name__}; "
+            "use a numeric, date or text partition column"
+        ) from None
+    if not step:
+        return [(lo, hi, True)]
+    return [(a, b, i == partitions - 1) for i, (a, b) in enumerate(zip(edges, edges[1:]))]
+
+
+def _quantile_bounds(
+    pool: ConnectionPool,
+    query: str,
+    params: Sequence[Any],
+    column: str,
+    lo: Any,
+    hi: Any,
+    keyed: int,
+    partitions: int,
+    placeholder: str,
+) -> list[tuple[Any, Any, bool]]:
+    """Split [lo, hi] at the column's quantiles, for keys without arithmetic (text).
+
+    Each inner boundary is the key at offset k * keyed / partitions in key
+    order; repeated boundaries (skewed keys) collapse into one range.
+    """
+    bounds_query = (
+        f"SELECT {column} FROM ({query}) AS src WHERE {column} IS NOT NULL "
+        f"ORDER BY {column} LIMIT 1 OFFSET {placeholder}"
+    )
+    edges = [lo]
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            for k in range(1, partitions):
+                cursor.execute(bounds_query, (*params, k * keyed // partitions))
+                row = cursor.fetchone()
+                if row and edges[-1] < row[0] < hi:
+                    edges.append(row[0])
+        finally:
+            cursor.close()
+    edges.append(hi)
+    last = len(edges) - 2
+    return [(a, b, i == last) for i, (a, b) in enumerate(zip(edges, edges[1:]))]
+
+
+def _extract_partitioned(
+    pool: ConnectionPool,
+    query: str,
+    params: Sequence[Any],
+    batch_size: int,
+    column: str,
+    partitions: int,
+    placeholder: str,
+) -> Iterator[list[dict]]:
+    if not _IDENTIFIER.match(column):
+        raise ValueError(f"Invalid partition column {column!r}")
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"SELECT MIN({column}), MAX({column}), COUNT({column}), COUNT(*) - COUNT({column}) "
+                f"FROM ({query}) AS src",
+                tuple(params),
+            )
+            lo, hi, keyed, nulls = cursor.fetchone()
+        finally:
+            cursor.close()
+    ranges: list[Optional[tuple[Any, Any, bool]]]
+    if isinstance(lo, (str, bytes)):
+        ranges = list(
+            _quantile_bounds(pool, query, params, column, lo, hi, keyed, partitions, placeholder)
+        )
+    else:
+        ranges = list(_partition_bounds(lo, hi, partitions))
+    if nulls:
+        # Range predicates never match NULL keys; they get a partition of their own.
+        ranges.append(None)
+    if not ranges:
+        return
+
+    results: queue.Queue = queue.Queue(maxsize=2 * len(ranges))
+    stop = threading.Event()
+    done = object()
+
+    def offer(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker(bounds: Optional[tuple[Any, Any, bool]]) -> None:
+        if bounds is None:
+            where, bound_params = f"{column} IS NULL", []
+        else:
+            start, end, inclusive = bounds
+            op = "<=" if inclusive else "<"
+            where = f"{column} >= {placeholder} AND {column} {op} {placeholder}"
+            bound_params = [start, end]
+        part_query = f"SELECT * FROM ({query}) AS src WHERE {where}"
+        try:
+            for batch in _fetch_batches(pool, part_query, [*params, *bound_params], batch_size):
+                if not offer(batch):
+                    return
+        except Exception as exc:  # surfaced to the consumer below
+            offer(exc)
+        finally:
+            offer(done)
+
+    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="extract") as executor:
+        for bounds in ranges:
+            executor.submit(worker, bounds)
+        try:
+            remaining = len(ranges)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+
+
+def extract_from_db(
+    uri: str,
+    query: str,
+    params: Optional[Sequence[Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    partition_column: Optional[str] = None,
+    partitions: int = 1,
+    connect: Optional[Callable[[], Any]] = None,
+    pool_size: int = 4,
+    placeholder: str = "?",
+) -> Iterator[list[dict]]:
+    """Stream query results as batches of at most batch_size row dicts.
+
+    Rows are pulled with cursor.fetchmany, so the full result set is never
+    materialized. Connections come from a per-URI, per-size pool (sqlite:///path
+    is built in; other databases pass a DB-API `connect` callable and their
+    `placeholder`). With partition_column and partitions > 1, the
+    column's MIN..MAX range is split (evenly for numeric and date keys, at
+    quantiles for text keys) and each range (plus one for NULL keys,
+    if any) is fetched on its own pooled connection in parallel; batches
+    arrive in completion order.
+    """
+    pool = get_pool(uri, connect, max(pool_size, partitions))
+    params = list(params or [])
+    if partition_column and partitions > 1:
+        yield from _extract_partitioned(
+            pool, query, params, max(1, batch_size), partition_column, partitions, placeholder
+        )
+        return
+    yield from _fetch_batches(pool, query, params, max(1, batch_size))
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+async def _get_page(
+    client: Any,
+    url: str,
+    params: dict[str, Any],
+    bucket: Optional[TokenBucket],
+    max_retries: int,
+    backoff: float,
+) -> Any:
+    import httpx
+
+    for attempt in range(max_retries + 1):
+        if bucket:
+            await bucket.acquire()
+        try:
+            response = await client.get(url, params=params)
+        except httpx.TransportError:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(backoff * 2**attempt)
+            continue
+        if response.status_code in RETRY_STATUS and attempt < max_retries:
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else backoff * 2**attempt
+            await asyncio.sleep(delay)
+            continue
+        response.raise_for_status()
+        return response.json()
+    raise RuntimeError("unreachable")
+
+
+async def aextract_from_api(
+    base_url: str,
+    endpoint: str,
+    params: Optional[dict[str, Any]] = None,
+    items_key: str = "items",
+    total_pages_key: str = "total_pages",
+    page_param: str = "page",
+    page_size_param: str = "page_size",
+    page_size: int = 100,
+    start_page: int = 1,
+    concurrency: int = 4,
+    rate_limit: Optional[float] = None,
+    max_retries: int = 5,
+    backoff: float = 0.5,
+    timeout: float = 30.0,
+    headers: Optional[dict[str, str]] = None,
+) -> AsyncIterator[list[dict]]:
+    """Fetch a paginated endpoint with `concurrency` requests in flight.
+
+    Each page's items (the JSON list itself, or `items_key` of a JSON object)
+    are yielded as one batch, in completion order. The page count comes from
+    `total_pages_key` on the first page when present; otherwise pages are
+    fetched until an empty one. Requests pass through a token bucket
+    (`rate_limit` per second) and 429/5xx/transport errors are retried with
+    exponential backoff (honouring Retry-After).
+    """
+    import httpx
+
+    url = base_url.rstrip("/") + "/" + endpoint.lstrip("/")
+    base_params = dict(params or {})
+    if page_size_param:
+        base_params[page_size_param] = page_size
+    bucket = TokenBucket(rate_limit) if rate_limit else None
+
+    def items_of(payload: Any) -> list[dict]:
+        if isinstance(payload, list):
+            return payload
+        return list(payload.get(items_key) or [])
+
+    async with httpx.AsyncClient(timeout=timeout, headers=headers) as client:
+
+        async def fetch(page: int) -> Any:
+            return await _get_page(
+                client, url, {**base_params, page_param: page}, bucket, max_retries, backoff
+            )
+
+        first = await fetch(start_page)
+        first_items = items_of(first)
+        if not first_items:
+            return
+        yield first_items
+        last_page = float("inf")
+        if isinstance(first, dict) and first.get(total_pages_key) is not None:
+            last_page = start_page + int(first[total_pages_key]) - 1
+
+        next_page = start_page + 1
+        results: asyncio.Queue = asyncio.Queue(maxsize=2 * max(1, concurrency))
+        done = object()
+
+        async def worker() -> None:
+            nonlocal next_page, last_page
+            try:
+                while next_page <= last_page:
+                    page = next_page
+                    next_page += 1
+                    items = items_of(await fetch(page))
+                    if not items:
+                        # Without a known page count an empty page marks the end.
+                        last_page = min(last_page, page - 1)
+                        continue
+                    await results.put(items)
+            except Exception as exc:  # surfaced to the consumer
+                await results.put(exc)
+                return
+            await results.put(done)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await results.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def extract_from_api(base_url: str, endpoint: str, **kwargs: Any) -> Iterator[list[dict]]:
+    """Synchronous wrapper around aextract_from_api; yields page batches as they arrive."""
+    loop = asyncio.new_event_loop()
+    agen = aextract_from_api(base_url, endpoint, **kwargs)
+    try:
+        while True:
+            try:
+                batch = loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+            yield batch
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
@@ -1,15 +1,178 @@
 """Write nodes and edges to Neo4j."""
 
-from typing import Any
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
-from .schemas import NodeBase, EdgeBase
+from .schemas import NodeBase, EdgeBase, NodeBatch, EdgeBatch
 
+DEFAULT_BATCH_SIZE = 1000
 
-def load_nodes(driver: Any, nodes: list[NodeBase], label: str = "Node") -> int:
-    """Upsert nodes into Neo4j. Returns count. Stub."""
-    raise NotImplementedError("Implement Neo4j node load (MERGE).")
 
+def quote_identifier(name: str) -> str:
+    """Backtick-quote a label / relationship type for interpolation into Cypher."""
+    if not name:
+        raise ValueError("Label / relationship type must be non-empty.")
+    return "`" + name.replace("`", "``") + "`"
 
-def load_edges(driver: Any, edges: list[EdgeBase], rel_type: str | None = None) -> int:
-    """Upsert edges into Neo4j. Returns count. Stub."""
-    raise NotImplementedError("Implement Neo4j edge load (MERGE).")
+
+def node_query(label: str, key: str = "id") -> str:
+    return (
+        "UNWIND $rows AS row\n"
+        f"MERGE (n:{quote_identifier(label)} {{{quote_identifier(key)}: row.id}})\n"
+        "SET n += row.properties"
+    )
+
+
+def _endpoints(
+    source_label: Optional[str],
+    target_label: Optional[str],
+    key: str,
+    source_key: Optional[str],
+    target_key: Optional[str],
+) -> tuple[str, str, str, str]:
+    # Without labels the endpoint lookup cannot use an index; pass them when known.
+    src = f":{quote_identifier(source_label)}" if source_label else ""
+    dst = f":{quote_identifier(target_label)}" if target_label else ""
+    return src, dst, quote_identifier(source_key or key), quote_identifier(target_key or key)
+
+
+def edge_query(
+    rel_type: str,
+    source_label: Optional[str] = None,
+    target_label: Optional[str] = None,
+    key: str = "id",
+    source_key: Optional[str] = None,
+    target_key: Optional[str] = None,
+) -> str:
+    src, dst, sk, tk = _endpoints(source_label, target_label, key, source_key, target_key)
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (a{src} {{{sk}: row.source_id}})\n"
+        f"MATCH (b{dst} {{{tk}: row.target_id}})\n"
+        f"MERGE (a)-[r:{quote_identifier(rel_type)}]->(b)\n"
+        "SET r += row.properties"
+    )
+
+
+def _row_properties(columns: dict[str, list], length: int) -> Iterator[dict[str, Any]]:
+    """Zip columnar properties into one map per row, dropping null cells.
+
+    Columns are padded with null where a row lacks the key; like `SET n += row`
+    on row-shaped input, those cells must leave the stored property alone, so
+    they are left out of the map rather than guarded in Cypher.
+    """
+    items = list(columns.items())
+    for i in range(length):
+        yield {name: values[i] for name, values in items if values[i] is not None}
+
+
+class _GroupedWriter:
+    """Buffer rows per group key and flush each full buffer as one UNWIND write."""
+
+    def __init__(self, session: Any, query_for: Callable[[str], str], batch_size: int):
+        self.session = session
+        self.query_for = query_for
+        self.batch_size = max(1, batch_size)
+        self.buffers: dict[str, list[dict]] = {}
+        self.queries: dict[str, str] = {}
+        self.stats: dict[str, dict[str, Any]] = {}
+
+    def add(self, group: str, row: dict) -> None:
+        buf = self.buffers.setdefault(group, [])
+        buf.append(row)
+        if len(buf) >= self.batch_size:
+            self.flush(group)
+
+    def flush(self, group: str) -> None:
+        rows = self.buffers.get(group)
+        if not rows:
+            return
+        if group not in self.queries:
+            self.queries[group] = self.query_for(group)
+            self.stats[group] = {"count": 0, "batches": 0, "seconds": 0.0}
+        query = self.queries[group]
+        started = time.perf_counter()
+        self.session.execute_write(lambda tx: tx.run(query, rows=rows).consume())
+        stat = self.stats[group]
+        stat["seconds"] += time.perf_counter() - started
+        stat["count"] += len(rows)
+        stat["batches"] += 1
+        self.buffers[group] = []
+
+    def close(self) -> dict[str, dict[str, Any]]:
+        for group in list(self.buffers):
+            self.flush(group)
+        return self.stats
+
+
+def load_nodes(
+    driver: Any,
+    nodes: Iterable[Union[NodeBase, NodeBatch]],
+    label: str = "Node",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    key: str = "id",
+) -> dict[str, dict[str, Any]]:
+    """Upsert nodes with one MERGE ... UNWIND statement per label per batch.
+
+    `nodes` may be any iterable (e.g. a generator over extract batches) of
+    NodeBase items or columnar NodeBatch objects; batches are zipped into
+    per-row property maps (null cells dropped) and share the same `SET n +=`
+    write. Items with an empty label use `label`. Returns {label: {"count",
+    "batches", "seconds"}}.
+    """
+    with driver.session() as session:
+        writer = _GroupedWriter(session, lambda lbl: node_query(lbl, key), batch_size)
+        for node in nodes:
+            if isinstance(node, NodeBatch):
+                group = node.label or label
+                for node_id, props in zip(node.ids, _row_properties(node.columns, len(node))):
+                    writer.add(group, {"id": node_id, "properties": props})
+                continue
+            writer.add(node.label or label, {"id": node.id, "properties": node.properties})
+        return writer.close()
+
+
+def load_edges(
+    driver: Any,
+    edges: Iterable[Union[EdgeBase, EdgeBatch]],
+    rel_type: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    source_label: Optional[str] = None,
+    target_label: Optional[str] = None,
+    key: str = "id",
+    source_key: Optional[str] = None,
+    target_key: Optional[str] = None,
+) -> dict[str, dict[str, Any]]:
+    """Upsert edges with one UNWIND ... MERGE statement per relation type per batch.
+
+    Accepts EdgeBase items and columnar EdgeBatch objects. `rel_type`
+    overrides each edge's relation_type. Endpoints are matched on `key`
+    (or source_key / target_key), restricted to source_label / target_label
+    when given so the lookup is index-backed. Returns {rel_type: {"count",
+    "batches", "seconds"}}.
+    """
+    endpoint_args = (source_label, target_label, key, source_key, target_key)
+
+    def query_for(group: str) -> str:
+        return edge_query(group, *endpoint_args)
+
+    with driver.session() as session:
+        writer = _GroupedWriter(session, query_for, batch_size)
+        for edge in edges:
+            if isinstance(edge, EdgeBatch):
+                group = rel_type or edge.relation_type
+                props = _row_properties(edge.columns, len(edge))
+                for source_id, target_id, row in zip(edge.source_ids, edge.target_ids, props):
+                    writer.add(
+                        group, {"source_id": source_id, "target_id": target_id, "properties": row}
+                    )
+                continue
+            writer.add(
+                rel_type or edge.relation_type,
+                {
+                    "source_id": edge.source_id,
+                    "target_id": edge.target_id,
+                    "properties": edge.properties,
+                },
+            )
+        return writer.close()
@@ -1,7 +1,12 @@
-"""Node and edge models for the graph (Pydantic)."""
+"""Node and edge models for the graph (Pydantic).
 
-from pydantic import BaseModel, Field
-from typing import Optional
+NodeBase/EdgeBase describe one item each; NodeBatch/EdgeBatch hold many
+items column-wise and are validated per column, which is what the bulk
+transform/load path uses.
+"""
+
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Optional
 
 
 class NodeBase(BaseModel):
@@ -22,3 +27,77 @@ class EdgeBase(BaseModel):
 class CausalEdge(EdgeBase):
     """Causal edge: source -> target (source causes target)."""
     relation_type: str = "CAUSES"
+
+
+# Scalar property types Neo4j stores natively; a column may mix int/float.
+_SCALAR_TYPES = {str, int, float, bool}
+
+
+def _check_column(name: str, values: list, length: int) -> None:
+    """Validate one property column as a whole (length + homogeneous scalar type)."""
+    if len(values) != length:
+        raise ValueError(f"Column {name!r} has {len(values)} values, expected {length}")
+    kinds = set(map(type, values))
+    kinds.discard(type(None))
+    if not kinds:
+        return
+    if not kinds <= _SCALAR_TYPES:
+        bad = sorted(k.__name__ for k in kinds - _SCALAR_TYPES)
+        raise ValueError(f"Column {name!r} holds unsupported types: {bad}")
+    if len(kinds) > 1 and not kinds <= {int, float}:
+        raise ValueError(f"Column {name!r} mixes types: {sorted(k.__name__ for k in kinds)}")
+
+
+class NodeBatch(BaseModel):
+    """Columnar batch of nodes sharing one label: ids plus one list per property.
+
+    A None cell leaves the stored property unchanged when loaded.
+    """
+    label: str
+    ids: list[str]
+    columns: dict[str, list[Any]] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _validate_columns(self) -> "NodeBatch":
+        if not all(self.ids):
+            raise ValueError("Node ids must be non-empty")
+        for name, values in self.columns.items():
+            _check_column(name, values, len(self.ids))
+        return self
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def slice(self, start: int, stop: int) -> "NodeBatch":
+        return NodeBatch.model_construct(
+            label=self.label,
+            ids=self.ids[start:stop],
+            columns={k: v[start:stop] for k, v in self.columns.items()},
+        )
+
+
+class EdgeBatch(BaseModel):
+    """Columnar batch of edges sharing one relation type."""
+    relation_type: str
+    source_ids: list[str]
+    target_ids: list[str]
+    columns: dict[str, list[Any]] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _validate_columns(self) -> "EdgeBatch":
+        if len(self.source_ids) != len(self.target_ids):
+            raise ValueError("source_ids and target_ids must have the same length")
+        for name, values in self.columns.items():
+            _check_column(name, values, len(self.source_ids))
+        return self
+
+    def __len__(self) -> int:
+        return len(self.source_ids)
+
+    def slice(self, start: int, stop: int) -> "EdgeBatch":
+        return EdgeBatch.model_construct(
+            relation_type=self.relation_type,
+            source_ids=self.source_ids[start:stop],
+            target_ids=self.target_ids[start:stop],
+            columns={k: v[start:stop] for k, v in self.columns.items()},
+        )
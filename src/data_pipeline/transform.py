@@ -1,13 +1,98 @@
 """Map raw data to graph model (nodes/edges)."""
 
-from .schemas import NodeBase, EdgeBase
+import hashlib
+import json
+from typing import Iterable, Optional
 
+from .schemas import NodeBase, EdgeBase, NodeBatch, EdgeBatch
 
-def to_nodes(raw: list[dict], id_field: str = "id", label_field: str = "label") -> list[NodeBase]:
-    """Map raw records to node models. Stub."""
-    raise NotImplementedError("Implement mapping to NodeBase.")
 
+def content_hash(props: dict, links: dict) -> str:
+    """Stable digest of a node's properties and {relationship: [target keys]} links.
 
-def to_edges(raw: list[dict], source_key: str, target_key: str, relation_type: str) -> list[EdgeBase]:
-    """Map raw records to edge models. Stub."""
-    raise NotImplementedError("Implement mapping to EdgeBase.")
+    Stored as `contentHash` by the telecom importer and mapping loads so
+    incremental runs can skip unchanged rows; both must hash the same payload.
+    """
+    payload = json.dumps([props, links], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _columns(rows: list[dict], exclude: set[str]) -> dict[str, list]:
+    names: dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+    return {
+        name: [row.get(name) for row in rows]
+        for name in names
+        if name not in exclude
+    }
+
+
+def to_nodes(
+    raw: Iterable[dict],
+    id_field: str = "id",
+    label_field: str = "label",
+    label: Optional[str] = None,
+) -> list[NodeBatch]:
+    """Map raw records to one columnar NodeBatch per label.
+
+    The label comes from `label` when given, else from each record's
+    `label_field`. Every other field except the id becomes a property column.
+    """
+    groups: dict[str, list[dict]] = {}
+    for row in raw:
+        row_label = label or row.get(label_field)
+        if not row_label:
+            raise ValueError(f"Record {row.get(id_field)!r} has no label")
+        groups.setdefault(row_label, []).append(row)
+    batches = []
+    for group_label, rows in groups.items():
+        exclude = {id_field} if label else {id_field, label_field}
+        batches.append(
+            NodeBatch(
+                label=group_label,
+                ids=[str(row[id_field]) for row in rows],
+                columns=_columns(rows, exclude),
+            )
+        )
+    return batches
+
+
+def to_edges(raw: Iterable[dict], source_key: str, target_key: str, relation_type: str) -> EdgeBatch:
+    """Map raw records to a columnar EdgeBatch; remaining fields become edge properties."""
+    rows = list(raw)
+    return EdgeBatch(
+        relation_type=relation_type,
+        source_ids=[str(row[source_key]) for row in rows],
+        target_ids=[str(row[target_key]) for row in rows],
+        columns=_columns(rows, {source_key, target_key}),
+    )
+
+
+def to_node_models(
+    raw: Iterable[dict], id_field: str = "id", label_field: str = "label"
+) -> list[NodeBase]:
+    """Per-record NodeBase mapping (reference path for small inputs and benchmarks)."""
+    return [
+        NodeBase(
+            id=str(row[id_field]),
+            label=row[label_field],
+            properties={k: v for k, v in row.items() if k not in (id_field, label_field)},
+        )
+        for row in raw
+    ]
+
+
+def to_edge_models(
+    raw: Iterable[dict], source_key: str, target_key: str, relation_type: str
+) -> list[EdgeBase]:
+    """Per-record EdgeBase mapping (reference path for small inputs and benchmarks)."""
+    return [
+        EdgeBase(
+            source_id=str(row[source_key]),
+            target_id=str(row[target_key]),
+            relation_type=relation_type,
+            properties={k: v for k, v in row.items() if k not in (source_key, target_key)},
+        )
+        for row in raw
+    ]
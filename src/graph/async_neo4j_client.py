@@ -0,0 +1,193 @@
+"""Asyncio counterpart of Neo4jClient built on the neo4j async driver."""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase, RoutingControl
+
+from .columnar import empty_columns, finalize_columns
+from .causal_paths import (
+    DEFAULT_COUNT_CAP,
+    DEFAULT_PATH_LIMIT,
+    apage_paths,
+    count_paths_query,
+    first_depth_query,
+    paths_at_depth_query,
+)
+from .neo4j_client import DEFAULT_FETCH_SIZE, _ClientBase, is_write_query
+from .query_stats import QueryStats
+
+
+class AsyncNeo4jClient(_ClientBase):
+    """Async Neo4j driver wrapper with the same query API as Neo4jClient.
+
+    One client (and its connection pool) serves any number of concurrent
+    coroutines on the event loop it was first used on.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        stats: Optional[QueryStats] = None,
+        stats_dump_path: Optional[str] = None,
+        **driver_config: Any,
+    ):
+        self.uri = uri
+        self.user = user
+        self.password = password
+        self.driver_config = driver_config
+        self._driver: Any = None
+        self._init_base(stats, stats_dump_path)
+
+    def connect(self) -> None:
+        """Create driver (no-op if already connected; sockets open lazily)."""
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                **self.driver_config,
+            )
+
+    @property
+    def driver(self) -> Any:
+        """Underlying async neo4j driver (created on first access)."""
+        if self._driver is None:
+            self.connect()
+        return self._driver
+
+    async def close(self) -> None:
+        """Close driver (and write query stats to stats_dump_path if set)."""
+        if self._driver:
+            driver, self._driver = self._driver, None
+            await driver.close()
+        self._dump_stats()
+
+    async def __aenter__(self) -> "AsyncNeo4jClient":
+        self.connect()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def _borrow(self) -> AsyncIterator[Any]:
+        driver = self.driver
+        self._enter_call()
+        try:
+            yield driver
+        finally:
+            self._exit_call()
+
+    async def run_cypher(self, query: str, parameters: Optional[dict] = None) -> list[dict]:
+        """Execute Cypher and return records as list of dicts (reads via execute_query)."""
+        async with self._borrow() as driver:
+            with self._observe(query) as obs:
+                if not is_write_query(query):
+                    records, obs["summary"], _ = await driver.execute_query(
+                        self._profiled(query), parameters or {}, routing_=RoutingControl.READ
+                    )
+                    obs["records"] = len(records)
+                    return [dict(record) for record in records]
+                async with driver.session() as session:
+                    result = await session.run(query, parameters or {})
+                    rows = [dict(record) async for record in result]
+                    obs["records"] = len(rows)
+                    obs["summary"] = await result.consume()
+                    return rows
+
+    async def run_cypher_iter(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """Stream records lazily as dicts (or lists of up to batch_size dicts)."""
+        access_mode = WRITE_ACCESS if is_write_query(query) else READ_ACCESS
+        async with self._borrow() as driver:
+            with self._observe(query) as obs:
+                async with driver.session(
+                    fetch_size=max(1, int(fetch_size)), default_access_mode=access_mode
+                ) as session:
+                    result = await session.run(query, parameters or {})
+                    batch: list[dict] = []
+                    async for record in result:
+                        obs["records"] += 1
+                        if not batch_size:
+                            yield dict(record)
+                            continue
+                        batch.append(dict(record))
+                        if len(batch) >= batch_size:
+                            yield batch
+                            batch = []
+                    if batch:
+                        yield batch
+                    obs["summary"] = await result.consume()
+
+    async def run_cypher_columns(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        as_numpy: Optional[bool] = None,
+    ) -> dict[str, Any]:
+        """Execute Cypher and return {column: list | numpy array}."""
+        access_mode = WRITE_ACCESS if is_write_query(query) else READ_ACCESS
+        async with self._borrow() as driver:
+            with self._observe(query) as obs:
+                async with driver.session(
+                    fetch_size=max(1, int(fetch_size)), default_access_mode=access_mode
+                ) as session:
+                    result = await session.run(query, parameters or {})
+                    keys = list(result.keys())
+                    columns = empty_columns(keys, as_numpy)
+                    appenders = [columns[key].append for key in keys]
+                    async for record in result:
+                        obs["records"] += 1
+                        for append, value in zip(appenders, record):
+                            append(value)
+                    obs["summary"] = await result.consume()
+                    return finalize_columns(columns, as_numpy)
+
+    async def causal_path_page(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 5,
+        limit: Optional[int] = DEFAULT_PATH_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """One page of simple CAUSES paths, shortest first (see Neo4jClient.causal_path_page)."""
+
+        async def fetch(depth: int, skip: int, limit: int) -> list[list[str]]:
+            query, params = paths_at_depth_query(self.resolver, source_id, target_id, depth)
+            rows = await self.run_cypher(query, {**params, "skip": skip, "limit": limit})
+            return [r.get("pathIds") or [] for r in rows]
+
+        async def probe(depth: int, max_depth: int) -> Optional[int]:
+            query, params = first_depth_query(self.resolver, source_id, target_id, depth, max_depth)
+            rows = await self.run_cypher(query, params)
+            return rows[0]["depth"] if rows else None
+
+        return await apage_paths(fetch, probe, max_depth, limit, cursor)
+
+    async def count_causal_paths(
+        self, source_id: str, target_id: str, max_depth: int = 5, cap: int = DEFAULT_COUNT_CAP
+    ) -> dict[str, Any]:
+        """Number of simple CAUSES paths (counting stops at cap)."""
+        query, params = count_paths_query(self.resolver, source_id, target_id, max_depth)
+        rows = await self.run_cypher(query, {**params, "cap": int(cap)})
+        n = int(rows[0]["n"]) if rows else 0
+        return {"count": n, "capped": n >= cap}
+
+    async def causal_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 5,
+        limit: Optional[int] = DEFAULT_PATH_LIMIT,
+    ) -> list[dict]:
+        """Return up to `limit` shortest causal paths from source to target."""
+        return (await self.causal_path_page(source_id, target_id, max_depth, limit))["paths"]
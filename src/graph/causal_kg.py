@@ -1,6 +1,18 @@
 """Causal edges, interventions API for the knowledge graph."""
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
+
+from .columnar import records_to_columns
+from .identity import resolver_for
+
+CUSTOMER_NUMERIC_PROPERTIES = (
+    "age",
+    "tenureMonths",
+    "monthlyCharge",
+    "totalCharges",
+    "totalRevenue",
+    "numberOfReferrals",
+)
 
 
 def _node_identity(record: dict, key: str = "node") -> str:
@@ -16,68 +28,106 @@ def _node_identity(record: dict, key: str = "node") -> str:
     return ""
 
 
-def get_causal_children(client: Any, node_id: str, depth: int = 1) -> list[dict]:
-    """Return nodes that are causally downstream of node_id (traverse CAUSES edges from node_id)."""
-    d = max(1, min(int(depth), 20))
-    rows = client.run_cypher(
-        f"""
-        MATCH (n)
-        WHERE n.id = $node_id OR n.name = $node_id
-        MATCH (n)-[:CAUSES*1..{d}]->(x)
+def _depth(depth: int) -> int:
+    return max(1, min(int(depth), 20))
+
+
+def _children_query(client: Any, node_id: str, depth: int) -> tuple[str, dict]:
+    anchor, params = resolver_for(client).match("n", node_id, "node_id")
+    return f"""
+        {anchor}
+        MATCH (n)-[:CAUSES*1..{_depth(depth)}]->(x)
         RETURN DISTINCT x, labels(x)[0] AS label
-        """,
-        {"node_id": node_id},
-    )
+        """, params
+
+
+def _parents_query(client: Any, node_id: str, depth: int) -> tuple[str, dict]:
+    anchor, params = resolver_for(client).match("n", node_id, "node_id")
+    return f"""
+        {anchor}
+        MATCH (x)-[:CAUSES*1..{_depth(depth)}]->(n)
+        RETURN DISTINCT x, labels(x)[0] AS label
+        """, params
+
+
+def _related(rows: list[dict]) -> list[dict]:
     return [
         {"id": _node_identity(r, "x"), "label": r.get("label")}
         for r in rows
     ]
 
 
+def get_causal_children(client: Any, node_id: str, depth: int = 1) -> list[dict]:
+    """Return nodes that are causally downstream of node_id (traverse CAUSES edges from node_id)."""
+    native = getattr(client, "causal_children", None)
+    if native is not None:
+        return native(node_id, depth)
+    return _related(client.run_cypher(*_children_query(client, node_id, depth)))
+
+
 def get_causal_parents(client: Any, node_id: str, depth: int = 1) -> list[dict]:
     """Return nodes that are causally upstream of node_id (traverse CAUSES edges to node_id)."""
-    d = max(1, min(int(depth), 20))
-    rows = client.run_cypher(
-        f"""
-        MATCH (n)
-        WHERE n.id = $node_id OR n.name = $node_id
-        MATCH (x)-[:CAUSES*1..{d}]->(n)
-        RETURN DISTINCT x, labels(x)[0] AS label
-        """,
-        {"node_id": node_id},
-    )
-    return [
-        {"id": _node_identity(r, "x"), "label": r.get("label")}
-        for r in rows
-    ]
+    native = getattr(client, "causal_parents", None)
+    if native is not None:
+        return native(node_id, depth)
+    return _related(client.run_cypher(*_parents_query(client, node_id, depth)))
 
 
-def intervention_effect(client: Any, intervention_node_id: str, outcome_node_id: str) -> Optional[dict]:
-    """Estimate intervention impact via graph-distance heuristic.
+async def aget_causal_children(client: Any, node_id: str, depth: int = 1) -> list[dict]:
+    """Async get_causal_children for an AsyncNeo4jClient."""
+    return _related(await client.run_cypher(*_children_query(client, node_id, depth)))
 
-    This is an intentionally simple baseline until do-calculus / statistical
-    estimation is introduced. Shorter causal distance implies stronger expected
-    effect.
-    """
-    # Backward-compatible behavior for tests and dry-run callers that
-    # intentionally pass no client.
-    if client is None:
-        return {"estimated_effect": None}
 
-    rows = client.run_cypher(
-        """
-        MATCH (intervention), (outcome)
-        WHERE (intervention.id = $intervention_node_id OR intervention.name = $intervention_node_id)
-          AND (outcome.id = $outcome_node_id OR outcome.name = $outcome_node_id)
+async def aget_causal_parents(client: Any, node_id: str, depth: int = 1) -> list[dict]:
+    """Async get_causal_parents for an AsyncNeo4jClient."""
+    return _related(await client.run_cypher(*_parents_query(client, node_id, depth)))
+
+
+def _intervention_query(
+    client: Any, intervention_node_id: str, outcome_node_id: str
+) -> tuple[str, dict]:
+    resolver = resolver_for(client)
+    intervention, params = resolver.match(
+        "intervention", intervention_node_id, "intervention_node_id"
+    )
+    outcome, outcome_params = resolver.match("outcome", outcome_node_id, "outcome_node_id")
+    params.update(outcome_params)
+    return f"""
+        {intervention}
+        {outcome}
         OPTIONAL MATCH p = shortestPath((intervention)-[:CAUSES*1..20]->(outcome))
+        WITH p, relationships(p)[0] AS first
         RETURN p IS NOT NULL AS has_path,
-               CASE WHEN p IS NULL THEN NULL ELSE length(p) END AS path_length
-        """,
-        {
-            "intervention_node_id": intervention_node_id,
-            "outcome_node_id": outcome_node_id,
-        },
-    )
+               CASE WHEN p IS NULL THEN NULL ELSE length(p) END AS path_length,
+               first.churnRate AS churn_rate, first.baseRate AS base_rate,
+               first.support AS support, first.lift AS lift
+        """, params
+
+
+# Support at which segment-lift confidence reaches 0.5 (shrinks small segments).
+SEGMENT_SUPPORT_PRIOR = 30
+
+
+def _segment_effect(row: dict) -> dict:
+    churn_rate = float(row["churn_rate"])
+    base_rate = float(row["base_rate"])
+    support = int(row.get("support") or 0)
+    lift = row.get("lift")
+    excess = churn_rate - base_rate
+    return {
+        "estimated_effect": round(max(0.0, excess), 4),
+        "direction": "risk_decrease_if_mitigated" if excess > 0 else "unknown",
+        "confidence": round(support / (support + SEGMENT_SUPPORT_PRIOR), 4),
+        "method": "segment_lift",
+        "rationale": (
+            f"Segment churn rate {churn_rate:.3f} vs base rate {base_rate:.3f}"
+            f"{f' (lift {float(lift):.2f})' if lift is not None else ''} over {support} churned customers; "
+            "effect is the excess churn rate if the factor's risk were mitigated."
+        ),
+    }
+
+
+def _effect_from_rows(rows: list[dict]) -> dict:
     row = rows[0] if rows else {}
     has_path = bool(row.get("has_path"))
     path_length = row.get("path_length")
@@ -90,6 +140,9 @@ def intervention_effect(client: Any, intervention_node_id: str, outcome_node_id:
             "rationale": "No CAUSES path detected between intervention and outcome.",
         }
 
+    if row.get("churn_rate") is not None and row.get("base_rate") is not None:
+        return _segment_effect(row)
+
     distance = float(path_length)
     estimated_effect = round(1.0 / distance, 4)
     confidence = round(max(0.2, min(1.0, 1.0 / distance + 0.2)), 4)
@@ -100,3 +153,186 @@ def intervention_effect(client: Any, intervention_node_id: str, outcome_node_id:
         "method": "graph_distance_heuristic",
         "rationale": f"Shortest causal path length={path_length}; shorter paths are scored higher.",
     }
+
+
+def intervention_effect(client: Any, intervention_node_id: str, outcome_node_id: str) -> Optional[dict]:
+    """Estimate intervention impact from the shortest CAUSES path.
+
+    On the segment overlay the first edge carries churn statistics and the
+    effect is the factor's excess churn rate (`segment_lift`). On the
+    per-customer overlay edges are unweighted and the graph-distance heuristic
+    applies: shorter causal distance implies stronger expected effect. Both
+    are baselines until do-calculus / statistical estimation is introduced.
+    """
+    # Backward-compatible behavior for tests and dry-run callers that
+    # intentionally pass no client.
+    if client is None:
+        return {"estimated_effect": None}
+
+    # In-process clients (e.g. SnapshotCausalClient) answer the shortest path directly.
+    native = getattr(client, "causal_path_summary", None)
+    if native is not None:
+        return _effect_from_rows([native(intervention_node_id, outcome_node_id)])
+    native = getattr(client, "causal_path_length", None)
+    if native is not None:
+        length = native(intervention_node_id, outcome_node_id)
+        return _effect_from_rows([{"has_path": length is not None, "path_length": length}])
+    rows = client.run_cypher(*_intervention_query(client, intervention_node_id, outcome_node_id))
+    return _effect_from_rows(rows)
+
+
+async def aintervention_effect(
+    client: Any, intervention_node_id: str, outcome_node_id: str
+) -> Optional[dict]:
+    """Async intervention_effect for an AsyncNeo4jClient."""
+    if client is None:
+        return {"estimated_effect": None}
+    rows = await client.run_cypher(
+        *_intervention_query(client, intervention_node_id, outcome_node_id)
+    )
+    return _effect_from_rows(rows)
+
+
+# Default hop bound for batched scoring (the single-pair shortestPath allows 20).
+DEFAULT_EFFECT_DEPTH = 5
+
+
+def _candidate_key(resolver: Any, identifier: str) -> str:
+    ref = resolver.resolve(identifier)
+    return str(ref.value) if ref is not None else identifier
+
+
+def _upstream_effects_query(
+    client: Any,
+    outcome_node_id: str,
+    depth: int,
+    candidate_ids: Optional[Sequence[str]],
+) -> tuple[str, dict]:
+    resolver = resolver_for(client)
+    anchor, params = resolver.match("outcome", outcome_node_id, "outcome_node_id")
+    params["candidates"] = (
+        None if candidate_ids is None else [_candidate_key(resolver, c) for c in candidate_ids]
+    )
+    # DISTINCT endpoints let the planner prune the expansion instead of
+    # enumerating every path; each candidate then needs one shortestPath.
+    d = _depth(depth)
+    return f"""
+        {anchor}
+        MATCH (x)-[:CAUSES*1..{d}]->(outcome)
+        WHERE x <> outcome
+          AND ($candidates IS NULL OR coalesce(x.id, x.name) IN $candidates)
+        WITH DISTINCT x, outcome
+        CALL {{
+            WITH x, outcome
+            MATCH p = shortestPath((x)-[:CAUSES*1..{d}]->(outcome))
+            RETURN length(p) AS path_length, relationships(p)[0] AS first
+        }}
+        RETURN x, labels(x)[0] AS label, path_length,
+               first.churnRate AS churn_rate, first.baseRate AS base_rate,
+               first.support AS support, first.lift AS lift
+        ORDER BY path_length
+        """, params
+
+
+def _effects_by_candidate(
+    client: Any, rows: list[dict], candidate_ids: Optional[Sequence[str]]
+) -> dict[str, dict]:
+    effects: dict[str, dict] = {}
+    for row in rows:
+        node_id = row.get("id") or _node_identity(row, "x")
+        if node_id and node_id not in effects:
+            effects[node_id] = _effect_from_rows([{**row, "has_path": True}])
+    if candidate_ids is None:
+        return effects
+    resolver = resolver_for(client)
+    return {
+        c: effects.get(_candidate_key(resolver, c)) or _effect_from_rows([])
+        for c in candidate_ids
+    }
+
+
+def intervention_effects(
+    client: Any,
+    candidate_ids: Optional[Sequence[str]],
+    outcome_node_id: str,
+    depth: int = DEFAULT_EFFECT_DEPTH,
+) -> dict[str, dict]:
+    """Score many interventions on one outcome in a single query.
+
+    Upstream nodes are found once (distinct, not per path) and each gets one
+    shortestPath to the outcome, so returns {candidate_id: effect} with the
+    same effect shape as intervention_effect, from the shortest path within
+    `depth` hops. `candidate_ids=None` scores every upstream node of the outcome (in
+    order of distance), which is how suggest_interventions discovers and
+    ranks candidates in one round-trip.
+    """
+    if client is None:
+        return {c: {"estimated_effect": None} for c in candidate_ids or ()}
+    native = getattr(client, "causal_upstream", None)
+    if native is not None:
+        rows = native(outcome_node_id, depth)
+    else:
+        rows = client.run_cypher(
+            *_upstream_effects_query(client, outcome_node_id, depth, candidate_ids)
+        )
+    return _effects_by_candidate(client, rows, candidate_ids)
+
+
+async def aintervention_effects(
+    client: Any,
+    candidate_ids: Optional[Sequence[str]],
+    outcome_node_id: str,
+    depth: int = DEFAULT_EFFECT_DEPTH,
+) -> dict[str, dict]:
+    """Async intervention_effects for an AsyncNeo4jClient."""
+    if client is None:
+        return {c: {"estimated_effect": None} for c in candidate_ids or ()}
+    rows = await client.run_cypher(
+        *_upstream_effects_query(client, outcome_node_id, depth, candidate_ids)
+    )
+    return _effects_by_candidate(client, rows, candidate_ids)
+
+
+def _customer_columns_query(properties: Sequence[str]) -> str:
+    fields = ",\n               ".join(
+        "c.`{0}` AS `{0}`".format(p.replace("`", "``")) for p in properties
+    )
+    return f"""
+        MATCH (c:Customer)
+        WHERE $status IS NULL OR c.customerStatus = $status
+        RETURN c.id AS id, c.customerStatus AS customerStatus{"," if fields else ""}
+               {fields}
+        """
+
+
+def customer_columns(
+    client: Any,
+    properties: Sequence[str] = CUSTOMER_NUMERIC_PROPERTIES,
+    status: Optional[str] = None,
+    as_numpy: Optional[bool] = None,
+) -> dict[str, Any]:
+    """Pull Customer id, status and properties column-wise for estimation/exploration.
+
+    Returns {"id": ..., "customerStatus": ..., <property>: ...} as lists or
+    NumPy arrays (numeric dtypes inferred). `status` filters customerStatus.
+    """
+    query = _customer_columns_query(properties)
+    params = {"status": status}
+    run_columns = getattr(client, "run_cypher_columns", None)
+    if run_columns is not None:
+        return run_columns(query, params, as_numpy=as_numpy)
+    keys = ["id", "customerStatus", *properties]
+    rows = client.run_cypher(query, params)
+    return records_to_columns(keys, ([r.get(k) for k in keys] for r in rows), as_numpy=as_numpy)
+
+
+async def acustomer_columns(
+    client: Any,
+    properties: Sequence[str] = CUSTOMER_NUMERIC_PROPERTIES,
+    status: Optional[str] = None,
+    as_numpy: Optional[bool] = None,
+) -> dict[str, Any]:
+    """Async customer_columns for an AsyncNeo4jClient."""
+    return await client.run_cypher_columns(
+        _customer_columns_query(properties), {"status": status}, as_numpy=as_numpy
+    )
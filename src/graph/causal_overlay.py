@@ -0,0 +1,331 @@
+"""Build the causal overlay (ChurnOutcome nodes + CAUSES edges) in two modes.
+
+- customer: one `ChurnOutcome {id: 'churn:<customerId>', scope: 'customer'}`
+  per churned customer, linked by HAS_OUTCOME, with an unweighted CAUSES
+  edge from each of the customer's factor nodes. Edge count grows with the
+  number of churned customers.
+- segment: one `ChurnOutcome {id: 'churn:all', scope: 'segment'}` holding the
+  population churn rate, with one weighted CAUSES edge per factor value
+  (support, total, churnRate, baseRate, lift). Edge count grows with the
+  number of distinct factor values only.
+
+Factors come from an OverlaySpec (see specs/overlays/): relationship factors
+name a dimension the customer links to (HAS_CONTRACT -> Contract), binned
+factors bucket a numeric Customer property into shared `FactorBin` nodes.
+Every factor is evaluated in the same customer scan, so adding factors does
+not add passes over the graph.
+
+The modes coexist: each build only touches outcomes of its own scope, and
+both update the overlay in place rather than deleting and recreating it.
+See docs/causal_overlay_schema.md.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import uuid
+from pathlib import Path
+from typing import Annotated, Any, Literal, Optional, Union
+
+import yaml
+from pydantic import BaseModel, Field, field_validator
+
+SEGMENT_OUTCOME_ID = "churn:all"
+OVERLAY_MODES = ("customer", "segment")
+
+# Customers per write transaction in the chunked customer overlay sync.
+DEFAULT_CHUNK_SIZE = 1000
+
+DEFAULT_SPEC_PATH = Path(__file__).resolve().parents[1] / "specs" / "overlays" / "churn_factors.yml"
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _identifier(value: str) -> str:
+    """Names are interpolated into Cypher, so only plain identifiers are accepted."""
+    if not _IDENTIFIER.match(value):
+        raise ValueError(f"{value!r} is not a valid Cypher identifier")
+    return value
+
+
+class RelationshipFactor(BaseModel):
+    """Dimension nodes a customer links to, e.g. (c)-[:HAS_CONTRACT]->(:Contract)."""
+    kind: Literal["relationship"] = "relationship"
+    relationship: str
+    label: str
+
+    @field_validator("relationship", "label")
+    @classmethod
+    def _names(cls, value: str) -> str:
+        return _identifier(value)
+
+    @property
+    def name(self) -> str:
+        return self.label
+
+    def collect(self, var: str) -> str:
+        return (
+            f"COLLECT {{ MATCH ({var})-[:{self.relationship}]->(f:{self.label}) "
+            f"RETURN f ORDER BY coalesce(f.id, f.name) }}"
+        )
+
+
+class BinnedFactor(BaseModel):
+    """A numeric Customer property bucketed by ascending bin edges.
+
+    Edges [0, 12, 24] give bins `tenureMonths:0-12`, `tenureMonths:12-24` and
+    the open `tenureMonths:24+`; values below the first edge get no bin.
+    """
+    kind: Literal["binned"]
+    property: str
+    bins: list[float] = Field(min_length=1)
+
+    @field_validator("property")
+    @classmethod
+    def _name(cls, value: str) -> str:
+        return _identifier(value)
+
+    @property
+    def name(self) -> str:
+        return self.property
+
+    @field_validator("bins")
+    @classmethod
+    def _ascending(cls, value: list[float]) -> list[float]:
+        if any(b <= a for a, b in zip(value, value[1:])):
+            raise ValueError("bin edges must be strictly increasing")
+        return value
+
+    def _bounds(self) -> list[tuple[float, Optional[float]]]:
+        return list(zip(self.bins, [*self.bins[1:], None]))
+
+    def bin_id(self, lower: float, upper: Optional[float]) -> str:
+        if upper is None:
+            return f"{self.property}:{lower:g}+"
+        return f"{self.property}:{lower:g}-{upper:g}"
+
+    def bin_for(self, value: Any) -> Optional[str]:
+        """Bin id for a property value (same rule as the Cypher CASE)."""
+        if value is None or value < self.bins[0]:
+            return None
+        for lower, upper in self._bounds():
+            if upper is None or value < upper:
+                return self.bin_id(lower, upper)
+        return None
+
+    def bin_rows(self) -> list[dict[str, Any]]:
+        return [
+            {"id": self.bin_id(lower, upper), "property": self.property, "lower": lower, "upper": upper}
+            for lower, upper in self._bounds()
+        ]
+
+    def collect(self, var: str) -> str:
+        prop = f"{var}.`{self.property}`"
+        bounds = self._bounds()
+        branches = " ".join(
+            f"WHEN {prop} < {upper!r} THEN '{self.bin_id(lower, upper)}'"
+            for lower, upper in bounds[:-1]
+        )
+        case = (
+            f"CASE WHEN {prop} IS NULL OR {prop} < {self.bins[0]!r} THEN NULL "
+            f"{branches} ELSE '{self.bin_id(*bounds[-1])}' END"
+        )
+        return f"COLLECT {{ MATCH (f:FactorBin {{id: {case}}}) RETURN f }}"
+
+
+Factor = Annotated[Union[RelationshipFactor, BinnedFactor], Field(discriminator="kind")]
+
+
+class OverlaySpec(BaseModel):
+    name: str = "overlay"
+    factors: list[Factor] = Field(min_length=1)
+
+    @property
+    def binned(self) -> list[BinnedFactor]:
+        return [f for f in self.factors if isinstance(f, BinnedFactor)]
+
+    def fingerprint(self) -> str:
+        """Short digest of the factor definitions (part of the customer watermark)."""
+        return hashlib.sha1(self.model_dump_json().encode("utf-8")).hexdigest()[:12]
+
+    def factors_expression(self, var: str = "c") -> str:
+        """Cypher list of every factor node of customer `var`, in spec order."""
+        return "\n                + ".join(f.collect(var) for f in self.factors)
+
+
+DEFAULT_OVERLAY_SPEC = OverlaySpec(
+    name="default",
+    factors=[
+        RelationshipFactor(relationship="HAS_CONTRACT", label="Contract"),
+        RelationshipFactor(relationship="HAS_OFFER", label="Offer"),
+    ],
+)
+
+
+def load_overlay_spec(path: Path | str = DEFAULT_SPEC_PATH) -> OverlaySpec:
+    """Load and validate an overlay factor YAML file."""
+    data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    return OverlaySpec.model_validate(data)
+
+
+MERGE_BINS_QUERY = """
+    UNWIND $bins AS b
+    MERGE (n:FactorBin {id: b.id})
+    SET n.name = b.id, n.property = b.property, n.lower = b.lower, n.upper = b.upper
+    """
+
+
+def ensure_bins(client: Any, spec: OverlaySpec) -> int:
+    """Create the spec's FactorBin nodes (idempotent); returns how many it defines."""
+    rows = [row for factor in spec.binned for row in factor.bin_rows()]
+    if rows:
+        client.run_cypher(MERGE_BINS_QUERY, {"bins": rows})
+    return len(rows)
+
+
+def _customer_sync_query(spec: OverlaySpec, chunk_size: int) -> str:
+    return f"""
+        MATCH (c:Customer)
+        WHERE $full OR c.contentHash IS NULL OR c.overlayHash IS NULL
+              OR c.overlayHash <> c.contentHash + '@' + $spec
+        CALL {{
+            WITH c
+            WITH c, {spec.factors_expression("c")} AS factors
+            WITH c, factors, reduce(
+                key = coalesce(c.customerStatus, ''), f IN factors |
+                key + '|' + labels(f)[0] + ':' + coalesce(f.id, f.name)
+            ) AS key
+            SET c.overlayHash = c.contentHash + '@' + $spec
+            WITH c, factors, key
+            WHERE $full OR c.overlayKey IS NULL OR c.overlayKey <> key
+            CALL {{
+                WITH c, factors
+                WITH c, factors WHERE c.customerStatus = 'Churned'
+                MERGE (co:ChurnOutcome {{id: 'churn:' + c.id}})
+                SET co.customerId = c.id, co.scope = 'customer'
+                MERGE (c)-[:HAS_OUTCOME]->(co)
+                WITH co, factors
+                OPTIONAL MATCH (stale)-[old:CAUSES]->(co)
+                WHERE NOT stale IN factors
+                DELETE old
+                WITH DISTINCT co, factors
+                FOREACH (f IN factors | MERGE (f)-[:CAUSES]->(co))
+            }}
+            CALL {{
+                WITH c
+                WITH c WHERE coalesce(c.customerStatus, '') <> 'Churned'
+                OPTIONAL MATCH (c)-[:HAS_OUTCOME]->(co:ChurnOutcome)
+                DETACH DELETE co
+            }}
+            SET c.overlayKey = key
+            RETURN count(*) AS changed
+        }} IN TRANSACTIONS OF {int(chunk_size)} ROWS
+        RETURN coalesce(sum(changed), 0) AS changed
+    """
+
+
+def _orphan_sweep_query(chunk_size: int) -> str:
+    return f"""
+        MATCH (co:ChurnOutcome)
+        WHERE coalesce(co.scope, 'customer') = 'customer'
+          AND NOT EXISTS {{ MATCH (:Customer {{customerStatus: 'Churned'}})-[:HAS_OUTCOME]->(co) }}
+        CALL {{ WITH co DETACH DELETE co }} IN TRANSACTIONS OF {int(chunk_size)} ROWS
+        RETURN count(*) AS removed
+    """
+
+
+def build_customer_overlay(
+    client: Any,
+    full: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    spec: OverlaySpec = DEFAULT_OVERLAY_SPEC,
+) -> dict[str, int]:
+    """Per-customer outcomes, updated in place in chunks of `chunk_size` customers.
+
+    Each Customer remembers the contentHash and spec fingerprint it was last
+    synced at (`overlayHash`) and its overlay inputs (`overlayKey`: status
+    plus factor values). Only customers whose hash moved are inspected, and
+    only those whose key changed are rewritten: their outcome and CAUSES
+    edges are reconciled (or removed once they no longer churn) in the same
+    chunk transaction, so readers never see a customer without its overlay.
+    `full=True` ignores both watermarks and reconciles every customer, which
+    repairs a damaged or legacy overlay without emptying it first. Outcomes
+    of vanished or non-churned customers are swept either way.
+    """
+    ensure_bins(client, spec)
+    rows = client.run_cypher(
+        _customer_sync_query(spec, chunk_size), {"full": bool(full), "spec": spec.fingerprint()}
+    )
+    changed = int((rows[0].get("changed") if rows else None) or 0)
+    rows = client.run_cypher(_orphan_sweep_query(chunk_size))
+    removed = int((rows[0].get("removed") if rows else None) or 0)
+    return {"changed": changed, "removed": removed, **overlay_counts(client, "customer")}
+
+
+def _segment_edges_query(spec: OverlaySpec) -> str:
+    return f"""
+        MATCH (co:ChurnOutcome {{id: $id}})
+        WHERE co.baseRate > 0
+        MATCH (c:Customer)
+        WITH co, CASE WHEN c.customerStatus = 'Churned' THEN 1 ELSE 0 END AS churned,
+             {spec.factors_expression("c")} AS factors
+        UNWIND factors AS f
+        WITH co, f, count(*) AS total, sum(churned) AS support
+        WITH co, f, total, support, toFloat(support) / total AS churnRate
+        WHERE support >= $min_support AND churnRate >= $min_lift * co.baseRate
+        MERGE (f)-[r:CAUSES]->(co)
+        SET r.scope = 'segment', r.support = support, r.total = total,
+            r.churnRate = churnRate, r.baseRate = co.baseRate,
+            r.lift = churnRate / co.baseRate, r.buildId = $build_id
+    """
+
+
+def build_segment_overlay(
+    client: Any,
+    min_support: int = 1,
+    min_lift: float = 1.0,
+    spec: OverlaySpec = DEFAULT_OVERLAY_SPEC,
+) -> dict[str, int]:
+    """Aggregated outcome with one weighted CAUSES edge per factor value.
+
+    Only factor values with at least `min_support` churned customers and a
+    churn rate of at least `min_lift` times the population rate get an edge.
+    All factors are aggregated in one customer scan. Edges are upserted in
+    place and tagged with a build id; edges left over from earlier builds
+    are removed last, so the outcome never loses its causes.
+    """
+    build_id = uuid.uuid4().hex
+    ensure_bins(client, spec)
+    client.run_cypher("""
+        MATCH (c:Customer)
+        WITH count(c) AS total,
+             sum(CASE WHEN c.customerStatus = 'Churned' THEN 1 ELSE 0 END) AS churned
+        WHERE total > 0
+        MERGE (co:ChurnOutcome {id: $id})
+        SET co.scope = 'segment', co.customers = total, co.churned = churned,
+            co.baseRate = toFloat(churned) / total
+    """, {"id": SEGMENT_OUTCOME_ID})
+    client.run_cypher(_segment_edges_query(spec), {
+        "id": SEGMENT_OUTCOME_ID,
+        "min_support": int(min_support),
+        "min_lift": float(min_lift),
+        "build_id": build_id,
+    })
+    client.run_cypher("""
+        MATCH ()-[r:CAUSES]->(:ChurnOutcome {id: $id})
+        WHERE r.buildId IS NULL OR r.buildId <> $build_id
+        DELETE r
+    """, {"id": SEGMENT_OUTCOME_ID, "build_id": build_id})
+    return overlay_counts(client, "segment")
+
+
+def overlay_counts(client: Any, scope: str) -> dict[str, int]:
+    rows = client.run_cypher("""
+        MATCH (co:ChurnOutcome)
+        WHERE coalesce(co.scope, 'customer') = $scope
+        OPTIONAL MATCH (f)-[r:CAUSES]->(co)
+        RETURN count(DISTINCT co) AS outcomes, count(r) AS causes
+    """, {"scope": scope})
+    row = rows[0] if rows else {}
+    return {"outcomes": int(row.get("outcomes") or 0), "causes": int(row.get("causes") or 0)}
@@ -0,0 +1,184 @@
+"""Bounded, shortest-first causal path enumeration with cursor pagination.
+
+Paths are produced one depth at a time (1 hop, then 2, ...), ordered by their
+node ids within a depth, so the first page holds the shortest (and, under the
+distance heuristic, most confident) paths and SKIP offsets address the same
+rows on every call. A deeper depth is only touched to fill the page or, when a
+page fills exactly at a depth boundary, by one existence probe that returns the
+first deeper depth holding a path. A cursor is an opaque token for (depth,
+offset) of the next page.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, Awaitable, Callable, Generator, Optional, Union
+
+from .identity import IdentityResolver
+
+DEFAULT_PATH_LIMIT = 25
+MAX_PATH_LIMIT = 1000
+DEFAULT_COUNT_CAP = 10_000
+MAX_DEPTH = 20
+
+# Simple paths only: no node repeats along the path.
+_SIMPLE = "all(i IN range(0, size(nodes(path)) - 2) WHERE NOT nodes(path)[i] IN nodes(path)[i + 1..])"
+
+
+def encode_cursor(depth: int, offset: int) -> str:
+    raw = json.dumps({"d": depth, "o": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> tuple[int, int]:
+    if not cursor:
+        return 1, 0
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        depth, offset = int(data["d"]), int(data["o"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid path cursor {cursor!r}") from exc
+    if depth < 1 or offset < 0:
+        raise ValueError(f"Invalid path cursor {cursor!r}")
+    return depth, offset
+
+
+def _bounds(max_depth: int, limit: Optional[int]) -> tuple[int, int]:
+    depth = max(1, min(int(max_depth), MAX_DEPTH))
+    return depth, max(1, min(int(limit or DEFAULT_PATH_LIMIT), MAX_PATH_LIMIT))
+
+
+def _anchors(resolver: IdentityResolver, source_id: str, target_id: str) -> tuple[str, dict]:
+    source, params = resolver.match("source", source_id, "source_id")
+    target, target_params = resolver.match("target", target_id, "target_id")
+    params.update(target_params)
+    return f"{source}\n        {target}", params
+
+
+def paths_at_depth_query(
+    resolver: IdentityResolver, source_id: str, target_id: str, depth: int
+) -> tuple[str, dict]:
+    """Simple paths of exactly `depth` hops ordered by node ids, paged by $skip/$limit."""
+    anchors, params = _anchors(resolver, source_id, target_id)
+    return f"""
+        {anchors}
+        MATCH path = (source)-[:CAUSES*{depth}..{depth}]->(target)
+        WHERE {_SIMPLE}
+        WITH [node IN nodes(path) | coalesce(node.id, node.name)] AS pathIds
+        RETURN pathIds
+        ORDER BY pathIds
+        SKIP $skip LIMIT $limit
+        """, params
+
+
+def first_depth_query(
+    resolver: IdentityResolver, source_id: str, target_id: str, depth: int, max_depth: int
+) -> tuple[str, dict]:
+    """Smallest d in depth..max_depth with a simple path of exactly d hops (null if none).
+
+    The CASE branches are tried in order and stop at the first depth with a
+    path, so a deeper depth is only expanded when every shallower one is empty.
+    """
+    anchors, params = _anchors(resolver, source_id, target_id)
+    d = max(1, min(int(max_depth), MAX_DEPTH))
+    branches = "\n".join(
+        f"            WHEN EXISTS {{ MATCH path = (source)-[:CAUSES*{k}..{k}]->(target) WHERE {_SIMPLE} }}"
+        f" THEN {k}"
+        for k in range(depth, d + 1)
+    )
+    return f"""
+        {anchors}
+        WITH CASE
+{branches}
+        END AS depth
+        RETURN min(depth) AS depth
+        """, params
+
+
+def count_paths_query(
+    resolver: IdentityResolver, source_id: str, target_id: str, max_depth: int
+) -> tuple[str, dict]:
+    """Count simple paths of 1..max_depth hops, stopping at $cap."""
+    anchors, params = _anchors(resolver, source_id, target_id)
+    d = max(1, min(int(max_depth), MAX_DEPTH))
+    return f"""
+        {anchors}
+        MATCH path = (source)-[:CAUSES*1..{d}]->(target)
+        WHERE {_SIMPLE}
+        WITH path LIMIT $cap
+        RETURN count(path) AS n
+        """, params
+
+
+def _page(paths: list[list[str]], next_at: Optional[tuple[int, int]]) -> dict[str, Any]:
+    next_cursor = encode_cursor(*next_at) if next_at else None
+    return {
+        "paths": [{"path": p, "length": len(p) - 1} for p in paths],
+        "next_cursor": next_cursor,
+        "truncated": next_cursor is not None,
+    }
+
+
+_Pager = Generator[tuple, Union[list[list[str]], Optional[int]], dict[str, Any]]
+
+
+def _pager(max_depth: int, limit: Optional[int], cursor: Optional[str]) -> _Pager:
+    """Paging state machine: yields ("fetch", depth, skip, limit) and
+    ("probe", depth, max_depth) requests, returns the page."""
+    max_depth, limit = _bounds(max_depth, limit)
+    depth, offset = decode_cursor(cursor)
+    paths: list[list[str]] = []
+    while depth <= max_depth and len(paths) < limit:
+        want = limit - len(paths)
+        got = yield "fetch", depth, offset, want + 1  # one extra row: does this depth have more?
+        if len(got) > want:
+            paths.extend(got[:want])
+            return _page(paths, (depth, offset + want))
+        paths.extend(got)
+        depth, offset = depth + 1, 0
+    # Filled exactly at a depth boundary: truncated only if some deeper path exists.
+    if len(paths) >= limit and depth <= max_depth:
+        found = yield "probe", depth, max_depth
+        if found is not None:
+            return _page(paths, (found, 0))
+    return _page(paths, None)
+
+
+def page_paths(
+    fetch: Callable[[int, int, int], list[list[str]]],
+    probe: Callable[[int, int], Optional[int]],
+    max_depth: int = 5,
+    limit: Optional[int] = DEFAULT_PATH_LIMIT,
+    cursor: Optional[str] = None,
+) -> dict[str, Any]:
+    """Fill one page from fetch(depth, skip, limit) -> path id lists, shortest first.
+
+    probe(depth, max_depth) returns the first depth in that range with a path, or None.
+    """
+    handlers = {"fetch": fetch, "probe": probe}
+    pager = _pager(max_depth, limit, cursor)
+    try:
+        kind, *args = next(pager)
+        while True:
+            kind, *args = pager.send(handlers[kind](*args))
+    except StopIteration as done:
+        return done.value
+
+
+async def apage_paths(
+    fetch: Callable[[int, int, int], Awaitable[list[list[str]]]],
+    probe: Callable[[int, int], Awaitable[Optional[int]]],
+    max_depth: int = 5,
+    limit: Optional[int] = DEFAULT_PATH_LIMIT,
+    cursor: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async page_paths for an awaitable fetch and probe."""
+    handlers = {"fetch": fetch, "probe": probe}
+    pager = _pager(max_depth, limit, cursor)
+    try:
+        kind, *args = next(pager)
+        while True:
+            kind, *args = pager.send(await handlers[kind](*args))
+    except StopIteration as done:
+        return done.value
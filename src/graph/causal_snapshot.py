@@ -0,0 +1,405 @@
+"""In-process CSR snapshot of the CAUSES subgraph.
+
+The causal overlay is small (a few dimension nodes fanning into outcome
+nodes), so traversals are cheaper as array walks than as Neo4j round-trips.
+`load_snapshot` pulls every CAUSES edge once into forward and reverse CSR
+adjacency (offsets + targets in compact `array('i')` buffers) with an
+id-to-index map; segment-overlay edge weights (support, churnRate, baseRate,
+lift) are kept per edge. `SnapshotCausalClient` answers the causal helper API
+(children, parents, paged paths, shortest path) from the snapshot and reloads it
+when the graph write generation changes; built from an edge list it needs no
+Neo4j at all, which makes offline tests possible.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+from .causal_paths import DEFAULT_COUNT_CAP, DEFAULT_PATH_LIMIT, page_paths
+from .identity import IdentityResolver
+from .query_cache import GRAPH_META_KEY, WRITE_GENERATION_QUERY
+
+CAUSES_EDGES_QUERY = """
+    MATCH (a)-[r:CAUSES]->(b)
+    RETURN coalesce(a.id, a.name) AS source, labels(a)[0] AS sourceLabel,
+           coalesce(b.id, b.name) AS target, labels(b)[0] AS targetLabel,
+           r.support AS support, r.churnRate AS churnRate, r.baseRate AS baseRate, r.lift AS lift
+    """
+
+MAX_DEPTH = 20
+
+# Weight properties written on segment-overlay CAUSES edges.
+EDGE_WEIGHTS = ("support", "churnRate", "baseRate", "lift")
+
+
+def _csr(n: int, pairs: list[tuple[int, int]]) -> tuple[array, array]:
+    offsets = array("i", [0] * (n + 1))
+    for src, _ in pairs:
+        offsets[src + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array("i", [0] * len(pairs))
+    cursor = array("i", offsets[:-1])
+    for src, dst in pairs:
+        targets[cursor[src]] = dst
+        cursor[src] += 1
+    return offsets, targets
+
+
+class CausalSnapshot:
+    """Immutable forward/reverse CSR adjacency over CAUSES edges."""
+
+    def __init__(self, edges: Iterable[dict], generation: Optional[int] = None):
+        self.generation = generation
+        self.ids: list[str] = []
+        self.labels: list[Optional[str]] = []
+        self._index: dict[tuple[Optional[str], str], int] = {}
+        self._by_id: dict[str, list[int]] = {}
+        self._weights: dict[tuple[int, int], dict[str, Any]] = {}
+        pairs: set[tuple[int, int]] = set()
+        for e in edges:
+            if e.get("source") is None or e.get("target") is None:
+                continue
+            src = self._node(e.get("sourceLabel"), str(e["source"]))
+            dst = self._node(e.get("targetLabel"), str(e["target"]))
+            pairs.add((src, dst))
+            weights = {k: e[k] for k in EDGE_WEIGHTS if e.get(k) is not None}
+            if weights:
+                self._weights[(src, dst)] = weights
+        ordered = sorted(pairs)
+        n = len(self.ids)
+        self.forward_offsets, self.forward_targets = _csr(n, ordered)
+        self.reverse_offsets, self.reverse_targets = _csr(n, sorted((d, s) for s, d in ordered))
+
+    def _node(self, label: Optional[str], node_id: str) -> int:
+        key = (label, node_id)
+        idx = self._index.get(key)
+        if idx is None:
+            idx = self._index[key] = len(self.ids)
+            self.ids.append(node_id)
+            self.labels.append(label)
+            self._by_id.setdefault(node_id, []).append(idx)
+        return idx
+
+    @property
+    def node_count(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.forward_targets)
+
+    def lookup(self, identifier: str, resolver: Optional[IdentityResolver] = None) -> list[int]:
+        """Node indices for an identifier (label-exact when the resolver knows it)."""
+        ref = resolver.resolve(identifier) if resolver else None
+        if ref is not None:
+            idx = self._index.get((ref.label, str(ref.value)))
+            return [] if idx is None else [idx]
+        return list(self._by_id.get(identifier, ()))
+
+    def _neighbors(self, idx: int, reverse: bool = False):
+        offsets = self.reverse_offsets if reverse else self.forward_offsets
+        targets = self.reverse_targets if reverse else self.forward_targets
+        return range(offsets[idx], offsets[idx + 1]), targets
+
+    def reachable(self, starts: list[int], depth: int, reverse: bool = False) -> list[int]:
+        """Nodes reachable in 1..depth hops (BFS, first-seen order)."""
+        depth = max(1, min(int(depth), MAX_DEPTH))
+        seen: set[int] = set()
+        found: list[int] = []
+        frontier = list(dict.fromkeys(starts))
+        for _ in range(depth):
+            nxt = []
+            for idx in frontier:
+                positions, targets = self._neighbors(idx, reverse)
+                for pos in positions:
+                    t = targets[pos]
+                    if t not in seen:
+                        seen.add(t)
+                        found.append(t)
+                        nxt.append(t)
+            if not nxt:
+                break
+            frontier = nxt
+        return found
+
+    def upstream(self, targets: list[int], depth: int) -> list[tuple[int, int, int]]:
+        """(node, hops, next node on a shortest path) for every node reaching targets in 1..depth hops."""
+        depth = max(1, min(int(depth), MAX_DEPTH))
+        seen = set(targets)
+        found: list[tuple[int, int, int]] = []
+        frontier = list(dict.fromkeys(targets))
+        for hops in range(1, depth + 1):
+            nxt = []
+            for idx in frontier:
+                positions, sources = self._neighbors(idx, reverse=True)
+                for pos in positions:
+                    s = sources[pos]
+                    if s not in seen:
+                        seen.add(s)
+                        found.append((s, hops, idx))
+                        nxt.append(s)
+            if not nxt:
+                break
+            frontier = nxt
+        return found
+
+    def edge_weights(self, src: int, dst: int) -> dict[str, Any]:
+        """Segment-overlay weights of the src -> dst edge ({} when unweighted)."""
+        return dict(self._weights.get((src, dst), {}))
+
+    def shortest_path(self, sources: list[int], targets: list[int], max_depth: int = MAX_DEPTH) -> Optional[list[int]]:
+        """Node indices of a fewest-hop CAUSES path from any source to any target, or None."""
+        goal = set(targets)
+        queue = deque((s, 0) for s in dict.fromkeys(sources))
+        parent: dict[int, Optional[int]] = {s: None for s in dict.fromkeys(sources)}
+        while queue:
+            idx, dist = queue.popleft()
+            if dist >= max_depth:
+                continue
+            positions, tgts = self._neighbors(idx)
+            for pos in positions:
+                t = tgts[pos]
+                if t in goal:
+                    path = [t, idx]
+                    while parent[path[-1]] is not None:
+                        path.append(parent[path[-1]])
+                    return path[::-1]
+                if t not in parent:
+                    parent[t] = idx
+                    queue.append((t, dist + 1))
+        return None
+
+    def shortest_path_length(self, sources: list[int], targets: list[int], max_depth: int = MAX_DEPTH) -> Optional[int]:
+        """Fewest CAUSES hops from any source to any target (>= 1), or None."""
+        path = self.shortest_path(sources, targets, max_depth)
+        return None if path is None else len(path) - 1
+
+    def _hops_to(self, targets: list[int], max_depth: int) -> dict[int, int]:
+        """Fewest hops from each node to any target within max_depth (reverse BFS)."""
+        hops = {t: 0 for t in targets}
+        frontier = list(hops)
+        for dist in range(1, max_depth + 1):
+            nxt = []
+            for idx in frontier:
+                positions, srcs = self._neighbors(idx, reverse=True)
+                for pos in positions:
+                    s = srcs[pos]
+                    if s not in hops:
+                        hops[s] = dist
+                        nxt.append(s)
+            frontier = nxt
+        return hops
+
+    def _walk(self, sources: list[int], targets: list[int], max_depth: int, exact: bool = False):
+        """Yield simple paths (node index lists) of 1..max_depth hops, depth-first.
+
+        Branches that cannot reach a target in the hops left are never entered;
+        with `exact`, only paths of exactly max_depth hops are yielded.
+        """
+        goal = set(targets)
+        hops_to = self._hops_to(targets, max_depth)
+
+        def walk(trail: list[int], on_trail: set[int]):
+            left = max_depth - len(trail)  # hops remaining after the next step
+            positions, tgts = self._neighbors(trail[-1])
+            for pos in positions:
+                t = tgts[pos]
+                if t in on_trail or hops_to.get(t, max_depth + 1) > left:
+                    continue
+                trail.append(t)
+                if t in goal and (not exact or left == 0):
+                    yield list(trail)
+                if left > 0:
+                    on_trail.add(t)
+                    yield from walk(trail, on_trail)
+                    on_trail.discard(t)
+                trail.pop()
+
+        for s in dict.fromkeys(sources):
+            yield from walk([s], {s})
+
+    def paths_at_depth(self, sources: list[int], targets: list[int], depth: int) -> Iterator[list[str]]:
+        """Lazily yield simple paths of exactly `depth` hops as id lists, in CSR order."""
+        for p in self._walk(sources, targets, depth, exact=True):
+            yield [self.ids[i] for i in p]
+
+    def count_paths(self, sources: list[int], targets: list[int], max_depth: int, cap: int) -> int:
+        n = 0
+        for _ in self._walk(sources, targets, max(1, min(int(max_depth), MAX_DEPTH))):
+            n += 1
+            if n >= cap:
+                break
+        return n
+
+
+def load_snapshot(client: Any) -> CausalSnapshot:
+    """Pull all CAUSES edges from Neo4j (streamed when the client supports it)."""
+    generation = read_generation(client)
+    iter_rows = getattr(client, "run_cypher_iter", None)
+    rows = iter_rows(CAUSES_EDGES_QUERY) if iter_rows else client.run_cypher(CAUSES_EDGES_QUERY)
+    return CausalSnapshot(rows, generation=generation)
+
+
+def read_generation(client: Any) -> int:
+    rows = client.run_cypher(WRITE_GENERATION_QUERY, {"key": GRAPH_META_KEY})
+    return int((rows[0].get("generation") if rows else None) or 0)
+
+
+class SnapshotCausalClient:
+    """Causal helper API served from a CausalSnapshot.
+
+    With a `source` Neo4jClient the snapshot is loaded lazily and reloaded
+    when the write generation changes (checked at most every
+    refresh_interval seconds); other Cypher is delegated to the source.
+    `from_edges` builds a static, Neo4j-free client.
+    """
+
+    def __init__(
+        self,
+        source: Any = None,
+        snapshot: Optional[CausalSnapshot] = None,
+        refresh_interval: float = 5.0,
+        resolver: Optional[IdentityResolver] = None,
+    ):
+        if source is None and snapshot is None:
+            raise ValueError("SnapshotCausalClient needs a source client or a snapshot")
+        self.source = source
+        self.refresh_interval = refresh_interval
+        self.resolver = resolver or getattr(source, "resolver", None) or IdentityResolver()
+        self._snapshot = snapshot
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[dict], **kwargs: Any) -> "SnapshotCausalClient":
+        return cls(snapshot=CausalSnapshot(edges), **kwargs)
+
+    @property
+    def snapshot(self) -> CausalSnapshot:
+        if self.source is None:
+            return self._snapshot
+        now = time.monotonic()
+        with self._lock:
+            stale = self._checked_at is None or now - self._checked_at >= self.refresh_interval
+            if self._snapshot is None:
+                self._snapshot = load_snapshot(self.source)
+            elif stale and read_generation(self.source) != self._snapshot.generation:
+                self._snapshot = load_snapshot(self.source)
+            if stale:
+                self._checked_at = now
+            return self._snapshot
+
+    def refresh(self) -> CausalSnapshot:
+        """Reload the snapshot now."""
+        with self._lock:
+            self._snapshot = load_snapshot(self.source)
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def run_cypher(self, query: str, parameters: Optional[dict] = None) -> list[dict]:
+        if self.source is None:
+            raise RuntimeError("Offline snapshot client cannot run Cypher")
+        return self.source.run_cypher(query, parameters)
+
+    def _related(self, node_id: str, depth: int, reverse: bool) -> list[dict]:
+        snap = self.snapshot
+        found = snap.reachable(snap.lookup(node_id, self.resolver), depth, reverse=reverse)
+        return [{"id": snap.ids[i], "label": snap.labels[i]} for i in found]
+
+    def causal_children(self, node_id: str, depth: int = 1) -> list[dict]:
+        return self._related(node_id, depth, reverse=False)
+
+    def causal_parents(self, node_id: str, depth: int = 1) -> list[dict]:
+        return self._related(node_id, depth, reverse=True)
+
+    def causal_path_length(self, source_id: str, target_id: str, max_depth: int = MAX_DEPTH) -> Optional[int]:
+        snap = self.snapshot
+        return snap.shortest_path_length(
+            snap.lookup(source_id, self.resolver), snap.lookup(target_id, self.resolver), max_depth
+        )
+
+    def causal_path_summary(self, source_id: str, target_id: str, max_depth: int = MAX_DEPTH) -> dict[str, Any]:
+        """Shortest-path row as returned by causal_kg's intervention query."""
+        snap = self.snapshot
+        path = snap.shortest_path(
+            snap.lookup(source_id, self.resolver), snap.lookup(target_id, self.resolver), max_depth
+        )
+        if path is None:
+            return {"has_path": False, "path_length": None}
+        weights = snap.edge_weights(path[0], path[1])
+        return {
+            "has_path": True,
+            "path_length": len(path) - 1,
+            "churn_rate": weights.get("churnRate"),
+            "base_rate": weights.get("baseRate"),
+            "support": weights.get("support"),
+            "lift": weights.get("lift"),
+        }
+
+    def causal_upstream(self, node_id: str, depth: int = MAX_DEPTH) -> list[dict[str, Any]]:
+        """Every upstream node with its shortest distance and first-edge weights (one BFS)."""
+        snap = self.snapshot
+        rows = []
+        for idx, hops, nxt in snap.upstream(snap.lookup(node_id, self.resolver), depth):
+            weights = snap.edge_weights(idx, nxt)
+            rows.append({
+                "id": snap.ids[idx],
+                "label": snap.labels[idx],
+                "path_length": hops,
+                "churn_rate": weights.get("churnRate"),
+                "base_rate": weights.get("baseRate"),
+                "support": weights.get("support"),
+                "lift": weights.get("lift"),
+            })
+        return rows
+
+    def causal_path_page(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 5,
+        limit: Optional[int] = DEFAULT_PATH_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        snap = self.snapshot
+        sources = snap.lookup(source_id, self.resolver)
+        targets = snap.lookup(target_id, self.resolver)
+
+        # One lazy walk per depth, shared by the page fetch and the boundary probe.
+        levels: dict[int, tuple[Iterator[list[str]], list[list[str]]]] = {}
+
+        def fetch(depth: int, skip: int, limit: int) -> list[list[str]]:
+            if depth not in levels:
+                levels[depth] = (snap.paths_at_depth(sources, targets, depth), [])
+            walk, found = levels[depth]
+            found.extend(islice(walk, max(0, skip + limit - len(found))))
+            return found[skip:skip + limit]
+
+        def probe(depth: int, max_depth: int) -> Optional[int]:
+            return next((d for d in range(depth, max_depth + 1) if fetch(d, 0, 1)), None)
+
+        return page_paths(fetch, probe, max_depth, limit, cursor)
+
+    def count_causal_paths(
+        self, source_id: str, target_id: str, max_depth: int = 5, cap: int = DEFAULT_COUNT_CAP
+    ) -> dict[str, Any]:
+        snap = self.snapshot
+        n = snap.count_paths(
+            snap.lookup(source_id, self.resolver), snap.lookup(target_id, self.resolver), max_depth, cap
+        )
+        return {"count": n, "capped": n >= cap}
+
+    def causal_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 5,
+        limit: Optional[int] = DEFAULT_PATH_LIMIT,
+    ) -> list[dict]:
+        return self.causal_path_page(source_id, target_id, max_depth, limit)["paths"]
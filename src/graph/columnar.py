@@ -0,0 +1,74 @@
+"""Column-oriented Cypher results with optional NumPy dtype inference."""
+
+from math import nan
+from typing import Any, Iterable, Optional, Sequence
+
+try:  # optional: pip install ".[analytics]"
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def infer_array(values: list) -> Any:
+    """Convert a column to a typed NumPy array when its values allow it.
+
+    bool -> bool, int -> int64, int/float (None as NaN) -> float64;
+    anything else (strings, lists, nodes) is returned unchanged.
+    """
+    if np is None or not values:
+        return values
+    kinds = set()
+    for v in values:
+        if v is None:
+            kinds.add("null")
+        elif isinstance(v, bool):
+            kinds.add("bool")
+        elif isinstance(v, int):
+            kinds.add("int")
+        elif isinstance(v, float):
+            kinds.add("float")
+        else:
+            return values
+    if kinds == {"bool"}:
+        return np.array(values, dtype=bool)
+    if kinds == {"int"}:
+        return np.array(values, dtype=np.int64)
+    if "bool" in kinds or kinds == {"null"}:
+        return values
+    return np.array([nan if v is None else v for v in values], dtype=np.float64)
+
+
+def empty_columns(keys: Sequence[str], as_numpy: Optional[bool] = None) -> dict[str, list]:
+    """Per-column lists to append into; fails early if NumPy is required but missing."""
+    if as_numpy and np is None:
+        raise ImportError("NumPy is required for as_numpy=True; install the 'analytics' extra.")
+    return {key: [] for key in keys}
+
+
+def finalize_columns(columns: dict[str, list], as_numpy: Optional[bool] = None) -> dict[str, Any]:
+    """Apply dtype inference to filled columns unless as_numpy is False."""
+    if as_numpy is False or np is None:
+        return columns
+    return {key: infer_array(values) for key, values in columns.items()}
+
+
+def records_to_columns(
+    keys: Sequence[str],
+    records: Iterable[Sequence[Any]],
+    as_numpy: Optional[bool] = None,
+) -> dict[str, Any]:
+    """Append each record's values straight into per-column lists (no per-row dicts).
+
+    `records` yields value sequences in `keys` order (neo4j Records are
+    tuples). as_numpy=None converts when NumPy is installed; True requires it.
+    """
+    columns = empty_columns(keys, as_numpy)
+    appenders = [columns[key].append for key in keys]
+    for record in records:
+        for append, value in zip(appenders, record):
+            append(value)
+    return finalize_columns(columns, as_numpy)
@@ -0,0 +1,145 @@
+"""Resolve node identifiers (`churn:0004-TLHLJ`, `Month-to-Month`, ...) to indexed lookups.
+
+The causal helpers accept bare identifiers. Matching them with
+`MATCH (n) WHERE n.id = $x OR n.name = $x` scans every node, so identifiers are
+resolved to a (label, key) pair instead:
+
+1. rules: the `churn:` prefix, an explicit `Label:value` prefix for any
+   schema label, and the Telco customer-id pattern;
+2. a name lookup table of small dimension labels (Contract, Offer, ...),
+   loaded once per resolver with `load_names`;
+3. anything still unresolved becomes a `CALL { ... UNION ... }` over every
+   single-property uniqueness key in graph.schema, so each branch is an
+   index seek and latency does not grow with the graph. Only when no branch
+   matches (a label outside SCHEMA) does it fall back to an `id`/`name` scan.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .schema import SCHEMA
+
+
+def _quote(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+@dataclass(frozen=True)
+class NodeRef:
+    """A node addressed by label and unique key property."""
+
+    label: str
+    key: str
+    value: Any
+
+    def pattern(self, var: str, param: str) -> str:
+        return f"({var}:{_quote(self.label)} {{{_quote(self.key)}: ${param}}})"
+
+
+# label -> unique key property, from the declared single-property constraints.
+IDENTITY_KEYS: dict[str, str] = {
+    item.label: item.properties[0]
+    for item in SCHEMA
+    if item.kind == "unique" and len(item.properties) == 1 and item.label != "GraphMeta"
+}
+
+# Dimension labels whose (few) names are worth caching in the lookup table.
+NAME_LABELS = ("Contract", "Offer", "InternetType", "PaymentMethod", "FactorBin")
+
+CUSTOMER_ID = re.compile(r"^\d{4}-[A-Z]{5}$")
+
+
+class IdentityResolver:
+    """Maps identifiers to NodeRefs via prefix rules and a cached name table."""
+
+    def __init__(self, keys: Optional[dict[str, str]] = None):
+        self.keys = dict(keys or IDENTITY_KEYS)
+        self._names: dict[str, NodeRef] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, identifier: str) -> Optional[NodeRef]:
+        """NodeRef for `identifier`, or None when only the UNION lookup can find it."""
+        if identifier.startswith("churn:") and "ChurnOutcome" in self.keys:
+            return NodeRef("ChurnOutcome", self.keys["ChurnOutcome"], identifier)
+        label, sep, value = identifier.partition(":")
+        if sep and label in self.keys and value:
+            return NodeRef(label, self.keys[label], value)
+        if CUSTOMER_ID.match(identifier) and "Customer" in self.keys:
+            return NodeRef("Customer", self.keys["Customer"], identifier)
+        with self._lock:
+            return self._names.get(identifier)
+
+    def register(self, identifier: str, label: str, value: Any = None) -> None:
+        """Pin an identifier to a label (e.g. for names outside NAME_LABELS)."""
+        with self._lock:
+            self._names[identifier] = NodeRef(label, self.keys[label], identifier if value is None else value)
+
+    def names_query(self, labels: tuple[str, ...] = NAME_LABELS) -> str:
+        return "\nUNION ALL\n".join(
+            f"MATCH (n:{_quote(label)}) RETURN {label!r} AS label, n.{_quote(self.keys[label])} AS value"
+            for label in labels
+            if label in self.keys
+        )
+
+    def set_names(self, rows: list[dict]) -> int:
+        """Replace the lookup table from {"label", "value"} rows; returns its size."""
+        names = {
+            str(r["value"]): NodeRef(r["label"], self.keys[r["label"]], r["value"])
+            for r in rows
+            if r.get("value") is not None
+        }
+        with self._lock:
+            self._names = names
+        return len(names)
+
+    def load_names(self, client: Any, labels: tuple[str, ...] = NAME_LABELS) -> int:
+        """Fill the name table from the graph (one small read per call)."""
+        return self.set_names(client.run_cypher(self.names_query(labels)))
+
+    async def aload_names(self, client: Any, labels: tuple[str, ...] = NAME_LABELS) -> int:
+        """Async load_names for an AsyncNeo4jClient."""
+        return self.set_names(await client.run_cypher(self.names_query(labels)))
+
+    def union_lookup(self, var: str, param: str) -> str:
+        """CALL subquery that binds `var` via an index seek on every identity key.
+
+        Nodes whose label has no identity key (not declared in SCHEMA) are
+        found by a final `id`/`name` scan that runs only if every seek missed.
+        """
+        branches = "\n        UNION\n".join(
+            f"        MATCH (m:{_quote(label)} {{{_quote(key)}: ${param}}}) RETURN m"
+            for label, key in self.keys.items()
+        )
+        return (
+            "CALL {\n"
+            f"    CALL {{\n{branches}\n    }}\n"
+            "    WITH collect(m) AS hits\n"
+            "    CALL {\n"
+            "        WITH hits\n"
+            "        UNWIND CASE WHEN size(hits) = 0 THEN [1] ELSE [] END AS scan\n"
+            f"        MATCH (m) WHERE m.id = ${param} OR m.name = ${param}\n"
+            "        RETURN collect(m) AS scanned\n"
+            "    }\n"
+            f"    UNWIND hits + scanned AS {var}\n"
+            f"    RETURN {var}\n"
+            "}"
+        )
+
+    def match(self, var: str, identifier: str, param: str) -> tuple[str, dict[str, Any]]:
+        """Cypher clause binding `var` to the node named by identifier, plus its params."""
+        ref = self.resolve(identifier)
+        if ref is not None:
+            return f"MATCH {ref.pattern(var, param)}", {param: ref.value}
+        return self.union_lookup(var, param), {param: identifier}
+
+
+DEFAULT_RESOLVER = IdentityResolver()
+
+
+def resolver_for(client: Any) -> IdentityResolver:
+    """The client's resolver (shares its name table) or the rules-only default."""
+    return getattr(client, "resolver", None) or DEFAULT_RESOLVER
@@ -1,51 +1,403 @@
 """Cypher helpers and causal query helpers for Neo4j."""
 
-from typing import Any, Optional
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
 
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, GraphDatabase, RoutingControl
 
+from .causal_paths import (
+    DEFAULT_COUNT_CAP,
+    DEFAULT_PATH_LIMIT,
+    count_paths_query,
+    first_depth_query,
+    page_paths,
+    paths_at_depth_query,
+)
+from .columnar import records_to_columns
+from .identity import IdentityResolver
+from .observed_session import ObservedSession
+from .query_cache import GRAPH_META_KEY, WRITE_GENERATION_QUERY, QueryCache, cache_key
+from .query_stats import QueryStats, configure_slow_query_log
 
-class Neo4jClient:
-    """Neo4j driver wrapper with Cypher and causal query helpers."""
+DEFAULT_FETCH_SIZE = 1000
 
-    def __init__(self, uri: str, user: str, password: str):
+# Clauses that make a statement a write; string literals are stripped first.
+_WRITE_CLAUSE = re.compile(
+    r"\b(CREATE|MERGE|DELETE|DETACH|SET|REMOVE|DROP|FOREACH|LOAD\s+CSV|IN\s+TRANSACTIONS)\b"
+    r"|\bCALL\s+[A-Za-z_][\w.]*\s*\(",
+    re.IGNORECASE,
+)
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+
+
+def is_write_query(query: str) -> bool:
+    """Conservatively classify Cypher as a write (procedure calls count as writes)."""
+    return bool(_WRITE_CLAUSE.search(_STRING_LITERAL.sub("''", query)))
+
+
+def driver_config_from_settings(settings: Any) -> dict[str, Any]:
+    """Map Settings pool/keep-alive fields to neo4j driver keyword arguments."""
+    config = {
+        "max_connection_pool_size": settings.neo4j_max_connection_pool_size,
+        "connection_acquisition_timeout": settings.neo4j_connection_acquisition_timeout,
+        "max_connection_lifetime": settings.neo4j_max_connection_lifetime,
+        "keep_alive": settings.neo4j_keep_alive,
+    }
+    if settings.neo4j_liveness_check_timeout is not None:
+        config["liveness_check_timeout"] = settings.neo4j_liveness_check_timeout
+    return config
+
+
+class _ClientBase:
+    """Pool usage counters, query stats and settings wiring shared by both clients."""
+
+    driver_config: dict[str, Any]
+
+    def _init_base(
+        self, stats: Optional[QueryStats] = None, stats_dump_path: Optional[str] = None
+    ) -> None:
+        self.resolver = IdentityResolver()
+        self._usage_lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._calls = 0
+        self.stats = stats
+        self.stats_dump_path = stats_dump_path
+
+    @contextmanager
+    def _observe(self, query: str) -> Iterator[dict[str, Any]]:
+        """Time one query; callers fill obs["records"] and obs["summary"]."""
+        obs: dict[str, Any] = {"records": 0, "summary": None}
+        if self.stats is None:
+            yield obs
+            return
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield obs
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.stats.record(
+                query, time.perf_counter() - started, obs["records"], obs["summary"], error
+            )
+
+    def _profiled(self, query: str) -> str:
+        if self.stats is not None and self.stats.should_profile():
+            return "PROFILE " + query
+        return query
+
+    def _dump_stats(self) -> None:
+        if self.stats is not None and self.stats_dump_path:
+            self.stats.dump(self.stats_dump_path)
+
+    def _enter_call(self) -> None:
+        with self._usage_lock:
+            self._in_flight += 1
+            self._calls += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _exit_call(self) -> None:
+        with self._usage_lock:
+            self._in_flight -= 1
+
+    def inflight_stats(self) -> dict[str, Any]:
+        """Concurrent query calls made through this client (not driver pool metrics).
+
+        `in_flight` counts run_cypher/run_cypher_iter calls and session()
+        blocks currently holding a session or execute_query; sessions opened
+        directly on `driver` are not seen. Compare `peak_in_flight` with `max_connection_pool_size` to judge
+        whether the pool could be the bottleneck.
+        """
+        max_size = int(self.driver_config.get("max_connection_pool_size", 100))
+        with self._usage_lock:
+            return {
+                "max_connection_pool_size": max_size,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "calls": self._calls,
+            }
+
+    @classmethod
+    def from_settings(cls, settings: Any = None, **overrides: Any):
+        """Build a client from config.settings (credentials, pool tuning, query stats)."""
+        if settings is None:
+            from config.settings import get_settings
+
+            settings = get_settings()
+        config = driver_config_from_settings(settings)
+        if settings.neo4j_query_stats and "stats" not in overrides:
+            config["stats"] = QueryStats(
+                slow_query_ms=settings.neo4j_slow_query_ms,
+                profile_sample_rate=settings.neo4j_profile_sample_rate,
+            )
+            config["stats_dump_path"] = settings.neo4j_query_stats_dump or None
+            if settings.neo4j_slow_query_log:
+                configure_slow_query_log(settings.neo4j_slow_query_log)
+        config.update(overrides)
+        return cls(settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password, **config)
+
+
+class Neo4jClient(_ClientBase):
+    """Neo4j driver wrapper with Cypher and causal query helpers.
+
+    Safe to share across threads: the driver is created once under a lock and
+    every call borrows a pooled connection for its own session/transaction.
+    With a QueryCache, read results are served from memory until the graph
+    write generation changes (checked at most every generation_check_interval
+    seconds) or this client runs a write.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        cache: Optional[QueryCache] = None,
+        generation_check_interval: float = 1.0,
+        stats: Optional[QueryStats] = None,
+        stats_dump_path: Optional[str] = None,
+        **driver_config: Any,
+    ):
         self.uri = uri
         self.user = user
         self.password = password
+        self.driver_config = driver_config
+        self.cache = cache
+        self.generation_check_interval = generation_check_interval
+        self._generation_checked_at: Optional[float] = None
         self._driver: Any = None
+        self._lock = threading.Lock()
+        self._init_base(stats, stats_dump_path)
+
+    @classmethod
+    def from_settings(cls, settings: Any = None, **overrides: Any) -> "Neo4jClient":
+        """Build a client from config.settings, with a QueryCache if neo4j_query_cache_size > 0."""
+        if settings is None:
+            from config.settings import get_settings
+
+            settings = get_settings()
+        if "cache" not in overrides and settings.neo4j_query_cache_size > 0:
+            overrides["cache"] = QueryCache(
+                max_entries=settings.neo4j_query_cache_size,
+                ttl_seconds=settings.neo4j_query_cache_ttl,
+            )
+            overrides.setdefault(
+                "generation_check_interval", settings.neo4j_generation_check_interval
+            )
+        return super().from_settings(settings, **overrides)
 
     def connect(self) -> None:
-        """Create driver connection."""
-        self._driver = GraphDatabase.driver(
-            self.uri,
-            auth=(self.user, self.password),
-        )
+        """Create driver connection (no-op if already connected)."""
+        with self._lock:
+            if self._driver is None:
+                self._driver = GraphDatabase.driver(
+                    self.uri,
+                    auth=(self.user, self.password),
+                    **self.driver_config,
+                )
+
+    @property
+    def driver(self) -> Any:
+        """Underlying neo4j driver (connects on first access)."""
+        if self._driver is None:
+            self.connect()
+        return self._driver
 
     def close(self) -> None:
-        """Close driver."""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """Close driver (and write query stats to stats_dump_path if set)."""
+        with self._lock:
+            if self._driver:
+                self._driver.close()
+                self._driver = None
+        self._dump_stats()
+
+    @contextmanager
+    def _borrow(self) -> Iterator[Any]:
+        """Track a pooled connection being in use for the duration of one call."""
+        driver = self.driver
+        self._enter_call()
+        try:
+            yield driver
+        finally:
+            self._exit_call()
+
+    @contextmanager
+    def session(self, **kwargs: Any) -> Iterator[Any]:
+        """Driver session whose queries are recorded in `stats`, like run_cypher.
+
+        For bulk writers that manage their own transactions (pass the client
+        where a driver is expected). The query cache is cleared on close.
+        """
+        try:
+            with self._borrow() as driver, driver.session(**kwargs) as session:
+                yield session if self.stats is None else ObservedSession(session, self.stats)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit/miss/eviction counters of the query cache ({} when caching is off)."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def _refresh_generation(self) -> None:
+        now = time.monotonic()
+        checked = self._generation_checked_at
+        if checked is not None and now - checked < self.generation_check_interval:
+            return
+        with self._borrow() as driver, self._observe(WRITE_GENERATION_QUERY) as obs:
+            records, obs["summary"], _ = driver.execute_query(
+                WRITE_GENERATION_QUERY, {"key": GRAPH_META_KEY}, routing_=RoutingControl.READ
+            )
+            obs["records"] = len(records)
+        generation = records[0]["generation"] if records else None
+        self.cache.observe_generation(int(generation or 0))
+        self._generation_checked_at = now
 
     def run_cypher(self, query: str, parameters: Optional[dict] = None) -> list[dict]:
-        """Execute Cypher and return records as list of dicts."""
-        if not self._driver:
-            self.connect()
-        with self._driver.session() as session:
-            result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
-
-    def causal_paths(self, source_id: str, target_id: str, max_depth: int = 5) -> list[dict]:
-        """Return causal paths from source to target (variable-length CAUSES traversal)."""
-        d = max(1, min(int(max_depth), 20))
-        rows = self.run_cypher(
-            f"""
-            MATCH (source), (target)
-            WHERE (source.id = $source_id OR source.name = $source_id)
-              AND (target.id = $target_id OR target.name = $target_id)
-            MATCH path = (source)-[:CAUSES*1..{d}]->(target)
-            RETURN [node IN nodes(path) | coalesce(node.id, node.name)] AS pathIds
-            """,
-            {"source_id": source_id, "target_id": target_id},
-        )
-        return [{"path": r.get("pathIds") or []} for r in rows]
+        """Execute Cypher and return records as list of dicts.
+
+        Reads go through driver.execute_query (managed, retried, routed to
+        readers) and the query cache when configured; writes run as
+        auto-commit so schema commands and CALL { ... } IN TRANSACTIONS keep
+        working, and clear the cache.
+        """
+        if is_write_query(query):
+            try:
+                with self._borrow() as driver, self._observe(query) as obs:
+                    with driver.session() as session:
+                        result = session.run(query, parameters or {})
+                        rows = [dict(record) for record in result]
+                        obs["records"] = len(rows)
+                        obs["summary"] = result.consume()
+                        return rows
+            finally:
+                if self.cache is not None:
+                    self.cache.invalidate()
+        if self.cache is None:
+            return self._read(query, parameters)
+        self._refresh_generation()
+        key = cache_key(query, parameters)
+        hit, rows = self.cache.get(key)
+        if not hit:
+            epoch = self.cache.epoch
+            rows = self._read(query, parameters)
+            self.cache.put(key, rows, epoch=epoch)
+        return [dict(row) for row in rows]
+
+    def _read(self, query: str, parameters: Optional[dict]) -> list[dict]:
+        with self._borrow() as driver, self._observe(query) as obs:
+            records, obs["summary"], _ = driver.execute_query(
+                self._profiled(query), parameters or {}, routing_=RoutingControl.READ
+            )
+            obs["records"] = len(records)
+            return [dict(record) for record in records]
+
+    def run_cypher_iter(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Stream records lazily as dicts (or lists of up to batch_size dicts).
+
+        Records are pulled from the server fetch_size at a time, so memory
+        stays flat for large scans. The session (and its pooled connection)
+        is held only while the iterator is consumed; exhaust or close() it.
+        """
+        access_mode = WRITE_ACCESS if is_write_query(query) else READ_ACCESS
+        with self._borrow() as driver, self._observe(query) as obs:
+            with driver.session(
+                fetch_size=max(1, int(fetch_size)), default_access_mode=access_mode
+            ) as session:
+                result = session.run(query, parameters or {})
+                batch: list[dict] = []
+                for record in result:
+                    obs["records"] += 1
+                    if not batch_size:
+                        yield dict(record)
+                        continue
+                    batch.append(dict(record))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+                obs["summary"] = result.consume()
+
+    def run_cypher_columns(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        as_numpy: Optional[bool] = None,
+    ) -> dict[str, Any]:
+        """Execute Cypher and return {column: list | numpy array} for analytic pulls.
+
+        Values are appended per column straight from the record stream, and
+        numeric columns become int64/float64 arrays when NumPy is installed.
+        """
+        access_mode = WRITE_ACCESS if is_write_query(query) else READ_ACCESS
+        with self._borrow() as driver, self._observe(query) as obs:
+            with driver.session(
+                fetch_size=max(1, int(fetch_size)), default_access_mode=access_mode
+            ) as session:
+                result = session.run(query, parameters or {})
+                columns = records_to_columns(result.keys(), result, as_numpy=as_numpy)
+                obs["records"] = len(next(iter(columns.values()), ()))
+                obs["summary"] = result.consume()
+                return columns
+
+    def causal_path_page(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 5,
+        limit: Optional[int] = DEFAULT_PATH_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """One page of simple CAUSES paths, shortest first.
+
+        Returns {"paths": [{"path", "length"}], "next_cursor", "truncated"};
+        pass next_cursor back to continue. Paths within a depth are ordered by
+        node ids; when the page fills exactly at a depth boundary, one query
+        finds the next depth that has a path.
+        """
+
+        def fetch(depth: int, skip: int, limit: int) -> list[list[str]]:
+            query, params = paths_at_depth_query(self.resolver, source_id, target_id, depth)
+            rows = self.run_cypher(query, {**params, "skip": skip, "limit": limit})
+            return [r.get("pathIds") or [] for r in rows]
+
+        def probe(depth: int, max_depth: int) -> Optional[int]:
+            query, params = first_depth_query(self.resolver, source_id, target_id, depth, max_depth)
+            rows = self.run_cypher(query, params)
+            return rows[0]["depth"] if rows else None
+
+        return page_paths(fetch, probe, max_depth, limit, cursor)
+
+    def count_causal_paths(
+        self, source_id: str, target_id: str, max_depth: int = 5, cap: int = DEFAULT_COUNT_CAP
+    ) -> dict[str, Any]:
+        """Number of simple CAUSES paths (counting stops at cap)."""
+        query, params = count_paths_query(self.resolver, source_id, target_id, max_depth)
+        rows = self.run_cypher(query, {**params, "cap": int(cap)})
+        n = int(rows[0]["n"]) if rows else 0
+        return {"count": n, "capped": n >= cap}
+
+    def causal_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 5,
+        limit: Optional[int] = DEFAULT_PATH_LIMIT,
+    ) -> list[dict]:
+        """Return up to `limit` shortest causal paths from source to target."""
+        return self.causal_path_page(source_id, target_id, max_depth, limit)["paths"]
@@ -0,0 +1,104 @@
+"""Session / transaction proxies that record every query in a QueryStats.
+
+Bulk writers (scripts/import_telecom_data.py, data_pipeline.load_neo4j)
+manage their own transactions on a driver session; Neo4jClient.session()
+hands them these proxies so their queries get the same fingerprints,
+latency histograms and slow-query log entries as run_cypher.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from .query_stats import QueryStats
+
+
+class ObservedResult:
+    """Result proxy; the query is recorded once, when it is consumed or exhausted.
+
+    A result dropped unconsumed (left for the session to discard) is not recorded.
+    """
+
+    def __init__(self, result: Any, finish: Callable[[int, Any, Optional[BaseException]], None]):
+        self._result = result
+        self._finish = finish
+        self._records = 0
+        self._done = False
+
+    def __iter__(self) -> Iterator[Any]:
+        for record in self._result:
+            self._records += 1
+            yield record
+        self.consume()
+
+    def consume(self) -> Any:
+        try:
+            summary = self._result.consume()
+        except BaseException as exc:
+            self._record(None, exc)
+            raise
+        self._record(summary, None)
+        return summary
+
+    def _record(self, summary: Any, error: Optional[BaseException]) -> None:
+        if not self._done:
+            self._done = True
+            self._finish(self._records, summary, error)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._result, name)
+
+
+def _run_observed(
+    runner: Any, stats: QueryStats, query: str, parameters: Optional[dict], kwargs: dict
+) -> ObservedResult:
+    started = time.perf_counter()
+
+    def finish(records: int, summary: Any, error: Optional[BaseException]) -> None:
+        stats.record(query, time.perf_counter() - started, records, summary, error)
+
+    try:
+        result = runner.run(query, parameters, **kwargs)
+    except BaseException as exc:
+        finish(0, None, exc)
+        raise
+    return ObservedResult(result, finish)
+
+
+class ObservedTransaction:
+    def __init__(self, tx: Any, stats: QueryStats):
+        self._tx = tx
+        self._stats = stats
+
+    def run(self, query: str, parameters: Optional[dict] = None, **kwargs: Any) -> ObservedResult:
+        return _run_observed(self._tx, self._stats, query, parameters, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tx, name)
+
+
+class ObservedSession:
+    """Session proxy: run, begin_transaction and execute_read/execute_write are observed."""
+
+    def __init__(self, session: Any, stats: QueryStats):
+        self._session = session
+        self._stats = stats
+
+    def run(self, query: str, parameters: Optional[dict] = None, **kwargs: Any) -> ObservedResult:
+        return _run_observed(self._session, self._stats, query, parameters, kwargs)
+
+    def begin_transaction(self, *args: Any, **kwargs: Any) -> ObservedTransaction:
+        return ObservedTransaction(self._session.begin_transaction(*args, **kwargs), self._stats)
+
+    def _wrap(self, work: Callable[..., Any]) -> Callable[..., Any]:
+        return lambda tx, *args, **kwargs: work(ObservedTransaction(tx, self._stats), *args, **kwargs)
+
+    def execute_read(self, work: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self._session.execute_read(self._wrap(work), *args, **kwargs)
+
+    def execute_write(self, work: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self._session.execute_write(self._wrap(work), *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
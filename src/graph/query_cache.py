@@ -0,0 +1,137 @@
+"""Read-through cache for Cypher results, invalidated by the graph write generation.
+
+Writers (the importer, the causal overlay, mapping loads) bump a counter on a
+single `(:GraphMeta {key: 'graph'})` node after they change the graph. Cached
+entries remember the generation they were read at and are dropped as soon as
+the client observes a newer one, so every process sharing the database sees
+fresh results after a load without coordinating directly.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+GRAPH_META_KEY = "graph"
+
+WRITE_GENERATION_QUERY = (
+    "MATCH (m:GraphMeta {key: $key}) RETURN m.writeGeneration AS generation"
+)
+BUMP_WRITE_GENERATION_QUERY = """
+    MERGE (m:GraphMeta {key: $key})
+    SET m.writeGeneration = coalesce(m.writeGeneration, 0) + 1,
+        m.updatedAt = datetime()
+    RETURN m.writeGeneration AS generation
+    """
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so formatting differences share one cache entry."""
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def cache_key(query: str, parameters: Optional[dict] = None) -> Hashable:
+    return (
+        normalize_query(query),
+        json.dumps(parameters or {}, sort_keys=True, default=str),
+    )
+
+
+def bump_write_generation(client: Any) -> int:
+    """Advance the graph write generation; call after any bulk write."""
+    rows = client.run_cypher(BUMP_WRITE_GENERATION_QUERY, {"key": GRAPH_META_KEY})
+    return int(rows[0]["generation"]) if rows else 0
+
+
+class QueryCache:
+    """Thread-safe LRU + TTL store of query results tagged with a write generation."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def observe_generation(self, generation: int) -> None:
+        """Drop every entry if the graph has been written since it was cached."""
+        with self._lock:
+            if self._generation is not None and generation != self._generation:
+                self._entries.clear()
+                self.invalidations += 1
+            self._generation = generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            stored_at, generation, value = entry
+            expired = self.ttl_seconds is not None and self.clock() - stored_at > self.ttl_seconds
+            if expired or generation != self._generation:
+                del self._entries[key]
+                self.expirations += expired
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    @property
+    def epoch(self) -> int:
+        """Counter advanced by every invalidation; capture it before a read."""
+        with self._lock:
+            return self.invalidations
+
+    def put(self, key: Hashable, value: Any, epoch: Optional[int] = None) -> None:
+        """Store value unless the cache was invalidated since `epoch` was captured.
+
+        A read that overlaps a write (or a generation change) may have seen the
+        old graph; passing the epoch from before the read keeps it out.
+        """
+        with self._lock:
+            if epoch is not None and epoch != self.invalidations:
+                return
+            self._entries[key] = (self.clock(), self._generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "generation": self._generation,
+            }
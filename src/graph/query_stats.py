@@ -0,0 +1,228 @@
+"""Per-query latency histograms, summary counters and a slow-query log.
+
+Queries are grouped by a fingerprint (literals replaced by `?`, whitespace
+collapsed), so the same Cypher with different parameters or depths shares one
+histogram. Stats dump as JSON or Prometheus text exposition.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+from typing import Any, Optional
+
+slow_query_logger = logging.getLogger("graph.slow_query")
+# Silent until configure_slow_query_log is called; without a handler the
+# records would reach logging.lastResort and be printed to stderr.
+slow_query_logger.addHandler(logging.NullHandler())
+slow_query_logger.propagate = False
+
+# Prometheus-style upper bounds in seconds (the +Inf bucket is implicit).
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+SUMMARY_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+    "indexes_added",
+    "indexes_removed",
+    "constraints_added",
+    "constraints_removed",
+)
+
+_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def configure_slow_query_log(path: str) -> None:
+    """Append slow-query JSON lines to `path` (idempotent per path) and let them propagate."""
+    target = os.path.abspath(path)
+    for handler in slow_query_logger.handlers:
+        if getattr(handler, "baseFilename", None) == target:
+            return
+    handler = logging.FileHandler(target, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.propagate = True
+
+
+def fingerprint_text(query: str) -> str:
+    """Query text with literals replaced by `?` and whitespace collapsed."""
+    return _WHITESPACE.sub(" ", _LITERAL.sub("?", query)).strip()
+
+
+def fingerprint(query: str) -> str:
+    return hashlib.sha1(fingerprint_text(query).encode("utf-8")).hexdigest()[:12]
+
+
+def summary_counters(summary: Any) -> dict[str, int]:
+    """Non-zero update counters from a neo4j ResultSummary (or {} without one)."""
+    counters = getattr(summary, "counters", None)
+    if counters is None:
+        return {}
+    values = {name: int(getattr(counters, name, 0) or 0) for name in SUMMARY_COUNTERS}
+    return {name: value for name, value in values.items() if value}
+
+
+def profile_db_hits(profile: Optional[dict]) -> int:
+    """Total dbHits over a PROFILE plan tree."""
+    if not profile:
+        return 0
+    own = int(profile.get("dbHits") or profile.get("args", {}).get("DbHits") or 0)
+    return own + sum(profile_db_hits(child) for child in profile.get("children") or [])
+
+
+class QueryStats:
+    """Thread-safe aggregation of per-fingerprint query timings and counters."""
+
+    def __init__(
+        self,
+        slow_query_ms: Optional[float] = 500.0,
+        profile_sample_rate: float = 0.0,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.profile_sample_rate = profile_sample_rate
+        self.buckets = buckets
+        self._by_fingerprint: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def should_profile(self) -> bool:
+        return self.profile_sample_rate > 0 and random.random() < self.profile_sample_rate
+
+    def record(
+        self,
+        query: str,
+        seconds: float,
+        records: int = 0,
+        summary: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        fp = fingerprint(query)
+        counters = summary_counters(summary)
+        db_hits = profile_db_hits(getattr(summary, "profile", None))
+        with self._lock:
+            entry = self._by_fingerprint.get(fp)
+            if entry is None:
+                entry = self._by_fingerprint[fp] = {
+                    "fingerprint": fp,
+                    "query": fingerprint_text(query),
+                    "count": 0,
+                    "errors": 0,
+                    "seconds_total": 0.0,
+                    "seconds_max": 0.0,
+                    "records_total": 0,
+                    "db_hits_total": 0,
+                    "profiled": 0,
+                    "buckets": [0] * len(self.buckets),
+                    "counters": {},
+                }
+            entry["count"] += 1
+            entry["errors"] += error is not None
+            entry["seconds_total"] += seconds
+            entry["seconds_max"] = max(entry["seconds_max"], seconds)
+            entry["records_total"] += records
+            if db_hits:
+                entry["db_hits_total"] += db_hits
+                entry["profiled"] += 1
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    entry["buckets"][i] += 1
+                    break
+            for name, value in counters.items():
+                entry["counters"][name] = entry["counters"].get(name, 0) + value
+
+        if self.slow_query_ms is not None and seconds * 1000 >= self.slow_query_ms:
+            slow_query_logger.warning(json.dumps({
+                "fingerprint": fp,
+                "ms": round(seconds * 1000, 3),
+                "records": records,
+                "db_hits": db_hits or None,
+                "error": type(error).__name__ if error else None,
+                "query": fingerprint_text(query),
+            }))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._by_fingerprint.clear()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Per-fingerprint stats, slowest total time first."""
+        with self._lock:
+            entries = [
+                {**e, "buckets": list(e["buckets"]), "counters": dict(e["counters"])}
+                for e in self._by_fingerprint.values()
+            ]
+        for e in entries:
+            e["seconds_avg"] = e["seconds_total"] / e["count"] if e["count"] else 0.0
+        return sorted(entries, key=lambda e: e["seconds_total"], reverse=True)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(
+            {"buckets": list(self.buckets), "queries": self.snapshot()}, indent=indent
+        )
+
+    def to_prometheus(self, prefix: str = "neo4j_query") -> str:
+        """Prometheus text exposition: duration histogram plus record/db-hit/counter totals."""
+        entries = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_info Normalized Cypher text per fingerprint.",
+            f"# TYPE {prefix}_info gauge",
+        ]
+        for e in entries:
+            lines.append(
+                f'{prefix}_info{{fingerprint="{e["fingerprint"]}",query="{_escape(e["query"])}"}} 1'
+            )
+        lines += [
+            f"# HELP {prefix}_duration_seconds Cypher wall time by query fingerprint.",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        for e in entries:
+            label = f'fingerprint="{e["fingerprint"]}"'
+            cumulative = 0
+            for bound, n in zip(self.buckets, e["buckets"]):
+                cumulative += n
+                lines.append(f'{prefix}_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_duration_seconds_bucket{{{label},le="+Inf"}} {e["count"]}')
+            lines.append(f"{prefix}_duration_seconds_sum{{{label}}} {e['seconds_total']}")
+            lines.append(f"{prefix}_duration_seconds_count{{{label}}} {e['count']}")
+        for metric, field, help_text in (
+            ("records_total", "records_total", "Records returned."),
+            ("errors_total", "errors", "Failed executions."),
+            ("db_hits_total", "db_hits_total", "Database hits on PROFILE-sampled executions."),
+        ):
+            lines += [
+                f"# HELP {prefix}_{metric} {help_text}",
+                f"# TYPE {prefix}_{metric} counter",
+            ]
+            for e in entries:
+                lines.append(f'{prefix}_{metric}{{fingerprint="{e["fingerprint"]}"}} {e[field]}')
+        lines += [
+            f"# HELP {prefix}_updates_total Result summary update counters.",
+            f"# TYPE {prefix}_updates_total counter",
+        ]
+        for e in entries:
+            for name, value in sorted(e["counters"].items()):
+                lines.append(
+                    f'{prefix}_updates_total{{fingerprint="{e["fingerprint"]}",counter="{name}"}} {value}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Write stats to `path`: Prometheus text for *.prom / *.txt, JSON otherwise."""
+        text = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json()
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
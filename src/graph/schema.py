@@ -0,0 +1,120 @@
+"""Declared Neo4j constraints and indexes; idempotent apply and drift report."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SchemaItem:
+    """A uniqueness constraint or range index on node properties."""
+
+    name: str
+    kind: str  # "unique" or "index"
+    label: str
+    properties: tuple[str, ...]
+
+    @property
+    def signature(self) -> tuple[str, str, tuple[str, ...]]:
+        return (self.kind, self.label, self.properties)
+
+    def create_statement(self) -> str:
+        if len(self.properties) == 1:
+            props = f"n.{self.properties[0]}"
+        else:
+            props = "(" + ", ".join(f"n.{p}" for p in self.properties) + ")"
+        if self.kind == "unique":
+            return (
+                f"CREATE CONSTRAINT {self.name} IF NOT EXISTS "
+                f"FOR (n:{self.label}) REQUIRE {props} IS UNIQUE"
+            )
+        on = ", ".join(f"n.{p}" for p in self.properties)
+        return f"CREATE INDEX {self.name} IF NOT EXISTS FOR (n:{self.label}) ON ({on})"
+
+
+# Every MERGE key used by the loaders and the causal overlay is backed by a
+# uniqueness constraint (which also creates the lookup index).
+SCHEMA: tuple[SchemaItem, ...] = (
+    SchemaItem("customer_id", "unique", "Customer", ("id",)),
+    SchemaItem("churn_outcome_id", "unique", "ChurnOutcome", ("id",)),
+    SchemaItem("contract_name", "unique", "Contract", ("name",)),
+    SchemaItem("offer_name", "unique", "Offer", ("name",)),
+    SchemaItem("internet_type_name", "unique", "InternetType", ("name",)),
+    SchemaItem("payment_method_name", "unique", "PaymentMethod", ("name",)),
+    SchemaItem("city_name", "unique", "City", ("name",)),
+    SchemaItem("zipcode_zip_code", "unique", "ZipCode", ("zipCode",)),
+    SchemaItem("factor_bin_id", "unique", "FactorBin", ("id",)),
+    SchemaItem("table_name", "unique", "Table", ("name",)),
+    SchemaItem("field_name_table", "unique", "Field", ("name", "tableName")),
+    SchemaItem("graph_meta_key", "unique", "GraphMeta", ("key",)),
+    SchemaItem("customer_status", "index", "Customer", ("customerStatus",)),
+    SchemaItem("churn_outcome_customer", "index", "ChurnOutcome", ("customerId",)),
+)
+
+
+def apply_schema(client: Any, items: tuple[SchemaItem, ...] = SCHEMA) -> list[str]:
+    """Create declared constraints/indexes that do not exist yet. Returns created names.
+
+    Items whose signature is already live (see actual_schema) are skipped; the
+    rest still use IF NOT EXISTS, so concurrent loaders are safe. A uniqueness
+    constraint fails to create if the graph already holds duplicate keys.
+    """
+    live = actual_schema(client)
+    created = []
+    for item in items:
+        if item.signature in live:
+            continue
+        client.run_cypher(item.create_statement())
+        created.append(item.name)
+    return created
+
+
+def _signature(kind: str, row: dict) -> tuple[str, str, tuple[str, ...]] | None:
+    labels = row.get("labelsOrTypes") or []
+    props = row.get("properties") or []
+    if len(labels) != 1 or not props:
+        return None
+    return (kind, labels[0], tuple(props))
+
+
+def actual_schema(client: Any) -> dict[tuple[str, str, tuple[str, ...]], str]:
+    """Return the live node uniqueness constraints and range indexes keyed by signature."""
+    found: dict[tuple[str, str, tuple[str, ...]], str] = {}
+    for row in client.run_cypher(
+        "SHOW CONSTRAINTS YIELD name, type, entityType, labelsOrTypes, properties"
+    ):
+        ctype = str(row.get("type") or "")
+        if row.get("entityType", "NODE") != "NODE":
+            continue
+        if "UNIQUENESS" not in ctype and "NODE_KEY" not in ctype:
+            continue
+        sig = _signature("unique", row)
+        if sig:
+            found[sig] = row.get("name") or ""
+    for row in client.run_cypher(
+        "SHOW INDEXES YIELD name, type, entityType, labelsOrTypes, properties, owningConstraint"
+    ):
+        # Constraint-backing and token lookup indexes are not declared separately.
+        if row.get("owningConstraint") or row.get("type") != "RANGE":
+            continue
+        if row.get("entityType", "NODE") != "NODE":
+            continue
+        sig = _signature("index", row)
+        if sig:
+            found[sig] = row.get("name") or ""
+    return found
+
+
+def schema_drift(client: Any, items: tuple[SchemaItem, ...] = SCHEMA) -> dict[str, list[str]]:
+    """Compare declared items with the live schema.
+
+    Returns `missing` (declared names not present) and `undeclared` (live
+    constraint/index names the project does not declare).
+    """
+    live = actual_schema(client)
+    declared = {item.signature for item in items}
+    return {
+        "missing": [item.name for item in items if item.signature not in live],
+        "undeclared": sorted(name for sig, name in live.items() if sig not in declared),
+    }
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from graph.causal_kg import intervention_effect
+from graph.causal_kg import aintervention_effects, intervention_effects
 from orchestration.causal_schema import CausalMechanism, InterventionOption
 
 
@@ -26,14 +26,7 @@ def _build_mechanism(path: list[str]) -> str:
     )
 
 
-def explain_causal_paths(
-    source_id: str,
-    target_id: str,
-    client: Any,
-    max_depth: int = 5,
-) -> list[CausalMechanism]:
-    """Return graph-derived causal paths with structured explanations."""
-    paths = client.causal_paths(source_id=source_id, target_id=target_id, max_depth=max_depth)
+def _mechanisms(paths: list[dict]) -> list[CausalMechanism]:
     explanations: list[CausalMechanism] = []
     for item in paths:
         path = [p for p in (item.get("path") or []) if p]
@@ -53,49 +46,87 @@ def explain_causal_paths(
     return explanations
 
 
-def suggest_interventions(
-    node_id: str,
+def _path_args(source_id: str, target_id: str, max_depth: int, limit: int | None) -> dict:
+    args = {"source_id": source_id, "target_id": target_id, "max_depth": max_depth}
+    if limit is not None:
+        args["limit"] = limit
+    return args
+
+
+def explain_causal_paths(
+    source_id: str,
+    target_id: str,
     client: Any,
-    depth: int = 2,
-    limit: int = 5,
-) -> list[InterventionOption]:
-    """Suggest interventions by scoring upstream causes of an outcome node."""
-    rows = client.run_cypher(
-        f"""
-        MATCH (n)
-        WHERE n.id = $node_id OR n.name = $node_id
-        MATCH (x)-[:CAUSES*1..{max(1, min(int(depth), 20))}]->(n)
-        RETURN DISTINCT x, labels(x)[0] AS label
-        """,
-        {"node_id": node_id},
+    max_depth: int = 5,
+    limit: int | None = None,
+) -> list[CausalMechanism]:
+    """Return graph-derived causal paths with structured explanations.
+
+    `limit` keeps only the top-k shortest (highest-confidence) paths; by
+    default the client's own cap applies.
+    """
+    paths = client.causal_paths(**_path_args(source_id, target_id, max_depth, limit))
+    return _mechanisms(paths)
+
+
+async def aexplain_causal_paths(
+    source_id: str,
+    target_id: str,
+    client: Any,
+    max_depth: int = 5,
+    limit: int | None = None,
+) -> list[CausalMechanism]:
+    """Async explain_causal_paths for an AsyncNeo4jClient."""
+    paths = await client.causal_paths(**_path_args(source_id, target_id, max_depth, limit))
+    return _mechanisms(paths)
+
+
+def _option(candidate_id: str, node_id: str, effect: dict) -> InterventionOption:
+    score = float(effect.get("estimated_effect") or 0.0)
+    confidence = float(effect.get("confidence") or 0.0)
+    return InterventionOption(
+        node_id=candidate_id,
+        recommendation=f"Prioritize mitigation on '{candidate_id}' to influence '{node_id}'.",
+        expected_direction=str(effect.get("direction") or "unknown"),
+        expected_effect_score=score,
+        confidence=confidence,
+        caveats=[
+            "Effect size is heuristic until statistical causal estimation is added.",
+            str(effect.get("rationale") or "No rationale provided."),
+        ],
     )
-    candidates: list[InterventionOption] = []
-    for row in rows:
-        node = row.get("x")
-        if not node:
-            continue
-        candidate_id = node.get("id") or node.get("name")
-        if not candidate_id:
-            continue
-        effect = intervention_effect(client, candidate_id, node_id) or {}
-        score = float(effect.get("estimated_effect") or 0.0)
-        confidence = float(effect.get("confidence") or 0.0)
-        candidates.append(
-            InterventionOption(
-                node_id=candidate_id,
-                recommendation=f"Prioritize mitigation on '{candidate_id}' to influence '{node_id}'.",
-                expected_direction=str(effect.get("direction") or "unknown"),
-                expected_effect_score=score,
-                confidence=confidence,
-                caveats=[
-                    "Effect size is heuristic until statistical causal estimation is added.",
-                    str(effect.get("rationale") or "No rationale provided."),
-                ],
-            )
-        )
+
+
+def _rank(candidates: list[InterventionOption], limit: int) -> list[InterventionOption]:
     ranked = sorted(
         candidates,
         key=lambda x: (x["expected_effect_score"], x["confidence"]),
         reverse=True,
     )
     return ranked[: max(1, limit)]
+
+
+def suggest_interventions(
+    node_id: str,
+    client: Any,
+    depth: int = 2,
+    limit: int = 5,
+) -> list[InterventionOption]:
+    """Suggest interventions by scoring upstream causes of an outcome node.
+
+    Candidates and their effects come from one batched traversal
+    (intervention_effects), so ranking is a single round-trip.
+    """
+    effects = intervention_effects(client, None, node_id, depth=depth)
+    return _rank([_option(cid, node_id, effect) for cid, effect in effects.items()], limit)
+
+
+async def asuggest_interventions(
+    node_id: str,
+    client: Any,
+    depth: int = 2,
+    limit: int = 5,
+) -> list[InterventionOption]:
+    """Async suggest_interventions for an AsyncNeo4jClient."""
+    effects = await aintervention_effects(client, None, node_id, depth=depth)
+    return _rank([_option(cid, node_id, effect) for cid, effect in effects.items()], limit)
@@ -1,10 +1,20 @@
 """ETL and graph querying agent."""
 
+import asyncio
+import threading
+import weakref
 from typing import Any
 
-from config.settings import get_settings
+from graph.async_neo4j_client import AsyncNeo4jClient
 from graph.neo4j_client import Neo4jClient
 
+_shared_client: Neo4jClient | None = None
+_shared_lock = threading.Lock()
+# Async drivers are bound to the event loop they were first used on.
+_shared_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncNeo4jClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def run_etl_step(config: dict[str, Any]) -> dict[str, Any]:
     """Run extract/transform/load step. Stub."""
@@ -12,14 +22,42 @@ def run_etl_step(config: dict[str, Any]) -> dict[str, Any]:
 
 
 def _client_from_env() -> Neo4jClient:
-    settings = get_settings()
-    client = Neo4jClient(
-        uri=settings.neo4j_uri,
-        user=settings.neo4j_user,
-        password=settings.neo4j_password,
-    )
-    client.connect()
-    return client
+    """Process-wide client built from settings; its driver pool is reused across calls."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = Neo4jClient.from_settings()
+            _shared_client.connect()
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the process-wide client (e.g. on application shutdown)."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+def _async_client_from_env() -> AsyncNeo4jClient:
+    """Shared async client for the running event loop, built from settings on first use."""
+    loop = asyncio.get_running_loop()
+    with _shared_lock:
+        client = _shared_async_clients.get(loop)
+        if client is None:
+            client = AsyncNeo4jClient.from_settings()
+            client.connect()
+            _shared_async_clients[loop] = client
+        return client
+
+
+async def aclose_shared_client() -> None:
+    """Close the running loop's shared async client (e.g. on application shutdown)."""
+    with _shared_lock:
+        client = _shared_async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
 
 
 def query_graph(
@@ -27,11 +65,16 @@ def query_graph(
     params: dict[str, Any] | None = None,
     client: Neo4jClient | None = None,
 ) -> list[dict]:
-    """Execute Cypher and return results."""
-    owns_client = client is None
+    """Execute Cypher and return results (on the shared client when none is given)."""
     active_client = client or _client_from_env()
-    try:
-        return active_client.run_cypher(cypher, params or {})
-    finally:
-        if owns_client:
-            active_client.close()
+    return active_client.run_cypher(cypher, params or {})
+
+
+async def aquery_graph(
+    cypher: str,
+    params: dict[str, Any] | None = None,
+    client: AsyncNeo4jClient | None = None,
+) -> list[dict]:
+    """Async query_graph (on the loop's shared client when none is given)."""
+    active_client = client or _async_client_from_env()
+    return await active_client.run_cypher(cypher, params or {})
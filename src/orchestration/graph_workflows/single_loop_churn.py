@@ -6,8 +6,13 @@ from typing import Any, TypedDict
 
 from langgraph.graph import END, StateGraph
 
-from orchestration.agents.causal_agent import explain_causal_paths, suggest_interventions
-from orchestration.agents.data_agent import query_graph
+from orchestration.agents.causal_agent import (
+    aexplain_causal_paths,
+    asuggest_interventions,
+    explain_causal_paths,
+    suggest_interventions,
+)
+from orchestration.agents.data_agent import aquery_graph, query_graph
 from orchestration.tools.llm_tools import assemble_causal_context, render_why_aware_prompt
 
 
@@ -25,11 +30,16 @@ class SingleLoopState(TypedDict, total=False):
 
 
 def build_single_loop_graph(config: dict[str, Any] | None = None):
-    """Build a minimal facts -> causality -> response LangGraph pipeline."""
+    """Build a minimal facts -> causality -> response LangGraph pipeline.
+
+    config: client, max_depth, intervention_limit, and path_limit (top-k
+    shortest causal paths explained; client default cap when unset).
+    """
     cfg = config or {}
     client = cfg.get("client")
     max_depth = int(cfg.get("max_depth", 5))
     intervention_limit = int(cfg.get("intervention_limit", 5))
+    path_limit = cfg.get("path_limit")
 
     def retrieve_facts(state: SingleLoopState) -> dict[str, Any]:
         cypher = state.get("cypher")
@@ -49,6 +59,7 @@ def build_single_loop_graph(config: dict[str, Any] | None = None):
             target_id=target_id,
             client=client,
             max_depth=max_depth,
+            limit=path_limit,
         )
         return {"causal_explanations": explanations}
 
@@ -63,23 +74,76 @@ def build_single_loop_graph(config: dict[str, Any] | None = None):
         )
         return {"interventions": ranked}
 
-    def compose_node(state: SingleLoopState) -> dict[str, Any]:
-        context = assemble_causal_context(
-            query=state.get("query", ""),
-            what_evidence=state.get("data") or [],
-            why_hypotheses=state.get("causal_explanations") or [],
-            interventions=state.get("interventions") or [],
-        )
-        return {"response": render_why_aware_prompt(context)}
+    return _compile(retrieve_facts, explain_node, intervention_node)
+
+
+def _compose_node(state: SingleLoopState) -> dict[str, Any]:
+    context = assemble_causal_context(
+        query=state.get("query", ""),
+        what_evidence=state.get("data") or [],
+        why_hypotheses=state.get("causal_explanations") or [],
+        interventions=state.get("interventions") or [],
+    )
+    return {"response": render_why_aware_prompt(context)}
+
 
+def _compile(retrieve_facts, explain_node, intervention_node):
     graph = StateGraph(SingleLoopState)
     graph.add_node("retrieve_facts", retrieve_facts)
     graph.add_node("explain_causality", explain_node)
     graph.add_node("rank_interventions", intervention_node)
-    graph.add_node("compose_response", compose_node)
+    graph.add_node("compose_response", _compose_node)
     graph.set_entry_point("retrieve_facts")
     graph.add_edge("retrieve_facts", "explain_causality")
     graph.add_edge("explain_causality", "rank_interventions")
     graph.add_edge("rank_interventions", "compose_response")
     graph.add_edge("compose_response", END)
     return graph.compile()
+
+
+def build_async_single_loop_graph(config: dict[str, Any] | None = None):
+    """Async variant of build_single_loop_graph; run with `await graph.ainvoke(state)`.
+
+    `config["client"]` should be an AsyncNeo4jClient shared by all requests,
+    so concurrent why-questions multiplex over one connection pool.
+    """
+    cfg = config or {}
+    client = cfg.get("client")
+    max_depth = int(cfg.get("max_depth", 5))
+    intervention_limit = int(cfg.get("intervention_limit", 5))
+    path_limit = cfg.get("path_limit")
+
+    async def retrieve_facts(state: SingleLoopState) -> dict[str, Any]:
+        cypher = state.get("cypher")
+        if not cypher:
+            return {"data": []}
+        params = state.get("params") or {}
+        rows = await aquery_graph(cypher=cypher, params=params, client=client)
+        return {"data": rows}
+
+    async def explain_node(state: SingleLoopState) -> dict[str, Any]:
+        source_id = state.get("source_id")
+        target_id = state.get("target_id")
+        if not (source_id and target_id and client):
+            return {"causal_explanations": []}
+        explanations = await aexplain_causal_paths(
+            source_id=source_id,
+            target_id=target_id,
+            client=client,
+            max_depth=max_depth,
+            limit=path_limit,
+        )
+        return {"causal_explanations": explanations}
+
+    async def intervention_node(state: SingleLoopState) -> dict[str, Any]:
+        target_id = state.get("target_id")
+        if not (target_id and client):
+            return {"interventions": []}
+        ranked = await asuggest_interventions(
+            node_id=target_id,
+            client=client,
+            limit=intervention_limit,
+        )
+        return {"interventions": ranked}
+
+    return _compile(retrieve_facts, explain_node, intervention_node)
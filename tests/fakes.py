@@ -0,0 +1,52 @@
+"""Fake Neo4j driver/session/transaction that record write queries for loader tests."""
+
+
+class FakeResult(list):
+    def consume(self):
+        return None
+
+
+class FakeTx:
+    def __init__(self, calls, commits=None):
+        self.calls = calls
+        self.commits = commits
+
+    def run(self, query, parameters=None, **params):
+        self.calls.append((query, {**(parameters or {}), **params}))
+        return FakeResult()
+
+    def commit(self):
+        self.commits.append(len(self.calls))
+
+    def rollback(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, calls, commits=None):
+        self.calls = calls
+        self.commits = commits
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, fn, *args):
+        return fn(FakeTx(self.calls), *args)
+
+    def begin_transaction(self):
+        return FakeTx(self.calls, self.commits)
+
+    def run(self, query, parameters=None, **params):
+        return FakeTx(self.calls).run(query, parameters, **params)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+        self.commits = []
+
+    def session(self, **kwargs):
+        return FakeSession(self.calls, self.commits)
@@ -0,0 +1,212 @@
+"""Tests for graph.async_neo4j_client and the async causal helpers."""
+
+import asyncio
+
+from graph import causal_kg
+from graph.async_neo4j_client import AsyncNeo4jClient
+
+
+class FakeAsyncResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def keys(self):
+        return list(self.rows[0]) if self.rows else []
+
+    async def consume(self):
+        return None
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for row in self.rows:
+            await asyncio.sleep(0)
+            yield FakeRecord(row)
+
+
+class FakeRecord(dict):
+    def __iter__(self):
+        return iter(self.values())
+
+    def keys(self):
+        return dict.keys(self)
+
+
+class FakeAsyncSession:
+    def __init__(self, driver, **config):
+        self.driver = driver
+        self.config = config
+
+    async def __aenter__(self):
+        self.driver.open_sessions += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        self.driver.open_sessions -= 1
+        return False
+
+    async def run(self, query, params):
+        self.driver.calls.append(("session", query, params, self.config))
+        return FakeAsyncResult(self.driver.rows)
+
+
+class FakeAsyncDriver:
+    def __init__(self, rows=None):
+        self.calls = []
+        self.rows = rows or []
+        self.open_sessions = 0
+        self.closed = False
+
+    async def execute_query(self, query, params, routing_=None):
+        self.calls.append(("execute_query", query, params, routing_))
+        await asyncio.sleep(0)
+        return [FakeRecord(r) for r in self.rows], None, None
+
+    def session(self, **config):
+        return FakeAsyncSession(self, **config)
+
+    async def close(self):
+        self.closed = True
+
+
+def _client(monkeypatch, rows):
+    import graph.async_neo4j_client as mod
+
+    driver = FakeAsyncDriver(rows)
+    monkeypatch.setattr(mod.AsyncGraphDatabase, "driver", lambda *a, **k: driver)
+    return AsyncNeo4jClient("bolt://x", "u", "p"), driver
+
+
+def test_async_run_cypher_routes_reads_and_writes(monkeypatch):
+    from neo4j import RoutingControl
+
+    client, driver = _client(monkeypatch, [{"n": 1}])
+
+    async def scenario():
+        async with client:
+            assert await client.run_cypher("RETURN 1 AS n") == [{"n": 1}]
+            assert await client.run_cypher("MERGE (n:A)") == [{"n": 1}]
+
+    asyncio.run(scenario())
+    assert driver.calls[0][0] == "execute_query"
+    assert driver.calls[0][3] == RoutingControl.READ
+    assert driver.calls[1][0] == "session"
+    assert driver.closed
+    assert client.inflight_stats()["calls"] == 2
+
+
+def test_aquery_graph_reuses_shared_client_per_loop(monkeypatch):
+    from orchestration.agents import data_agent
+
+    client, driver = _client(monkeypatch, [{"n": 1}])
+    built = []
+
+    def from_settings():
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(data_agent.AsyncNeo4jClient, "from_settings", staticmethod(from_settings))
+
+    async def scenario():
+        await asyncio.gather(*(data_agent.aquery_graph("RETURN 1 AS n") for _ in range(3)))
+        assert not driver.closed
+        await data_agent.aclose_shared_client()
+
+    asyncio.run(scenario())
+    assert len(built) == 1
+    assert len(driver.calls) == 3
+    assert driver.closed
+
+
+def test_async_iter_and_columns(monkeypatch):
+    client, driver = _client(monkeypatch, [{"id": str(i), "x": i} for i in range(5)])
+
+    async def scenario():
+        rows = [r async for r in client.run_cypher_iter("MATCH (c) RETURN c.id AS id, c.x AS x")]
+        batches = [b async for b in client.run_cypher_iter("MATCH (c) RETURN c", batch_size=2)]
+        cols = await client.run_cypher_columns("MATCH (c) RETURN c.id AS id, c.x AS x", as_numpy=False)
+        return rows, batches, cols
+
+    rows, batches, cols = asyncio.run(scenario())
+    assert rows[0] == {"id": "0", "x": 0}
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert cols == {"id": ["0", "1", "2", "3", "4"], "x": [0, 1, 2, 3, 4]}
+    assert driver.open_sessions == 0
+
+
+def test_async_causal_helpers_share_one_client_concurrently():
+    class AsyncMockClient:
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+
+        async def run_cypher(self, query, params=None):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            if "shortestPath" in query:
+                return [{"has_path": True, "path_length": 1}]
+            return [{"x": {"id": "ct1"}, "label": "Contract"}]
+
+    client = AsyncMockClient()
+
+    async def scenario():
+        parents = await causal_kg.aget_causal_parents(client, "churn:abc")
+        effects = await asyncio.gather(
+            *(causal_kg.aintervention_effect(client, "ct1", "churn:abc") for _ in range(4))
+        )
+        return parents, effects
+
+    parents, effects = asyncio.run(scenario())
+    assert parents == [{"id": "ct1", "label": "Contract"}]
+    assert all(e["estimated_effect"] == 1.0 for e in effects)
+    assert client.peak == 4
+
+
+def test_asuggest_interventions_scores_upstream_in_one_query():
+    from orchestration.agents.causal_agent import asuggest_interventions
+
+    class AsyncMockClient:
+        def __init__(self):
+            self.queries = []
+
+        async def run_cypher(self, query, params=None):
+            self.queries.append(query)
+            return [{"x": {"id": "ct1"}, "label": "Contract", "path_length": 1}]
+
+    client = AsyncMockClient()
+    ranked = asyncio.run(asuggest_interventions("churn:abc", client))
+    assert len(client.queries) == 1 and "CALL {" in client.queries[0]
+    assert ranked[0]["node_id"] == "ct1"
+    assert ranked[0]["expected_effect_score"] == 1.0
+
+
+def test_async_single_loop_graph():
+    from orchestration.graph_workflows.single_loop_churn import build_async_single_loop_graph
+
+    class AsyncMockClient:
+        async def run_cypher(self, query, params=None):
+            if "CALL {" in query:
+                return [{"x": {"id": "Month-to-Month"}, "label": "Contract", "path_length": 2}]
+            if "shortestPath" in query:
+                return [{"has_path": True, "path_length": 2}]
+            if "DISTINCT x" in query:
+                return [{"x": {"id": "Month-to-Month"}, "label": "Contract"}]
+            return [{"customerStatus": "Churned", "cnt": 3}]
+
+        async def causal_paths(self, source_id, target_id, max_depth=5):
+            return [{"path": [source_id, target_id]}]
+
+    graph = build_async_single_loop_graph({"client": AsyncMockClient()})
+    state = asyncio.run(graph.ainvoke({
+        "query": "Why do customers churn?",
+        "cypher": "MATCH (c:Customer) RETURN c.customerStatus AS customerStatus, count(*) AS cnt",
+        "source_id": "Month-to-Month",
+        "target_id": "churn:abc",
+    }))
+    assert state["data"] == [{"customerStatus": "Churned", "cnt": 3}]
+    assert state["causal_explanations"][0]["path"] == ["Month-to-Month", "churn:abc"]
+    assert state["interventions"][0]["expected_effect_score"] == 0.5
+    assert state["response"]
@@ -0,0 +1,103 @@
+"""Tests for graph.causal_estimation (offline, NumPy)."""
+
+import pytest
+from graph import causal_estimation
+from graph.causal_estimation import (
+    FactorMatrix,
+    estimate_effects,
+    estimated_interventions,
+    factor_columns_query,
+    load_factor_matrix,
+)
+from graph.causal_overlay import BinnedFactor, OverlaySpec, RelationshipFactor
+
+np = pytest.importorskip("numpy")
+
+SPEC = OverlaySpec(factors=[
+    RelationshipFactor(relationship="HAS_CONTRACT", label="Contract"),
+    BinnedFactor(kind="binned", property="tenureMonths", bins=[0, 12]),
+])
+
+
+def _confounded_columns():
+    # Short tenure drives both Month-to-Month contracts and churn; within a
+    # tenure bin the contract makes no difference to churn.
+    cols = {"churned": [], "Contract": [], "tenureMonths": []}
+
+    def add(n, contract, tenure, churned):
+        for i in range(n):
+            cols["churned"].append(i < churned)
+            cols["Contract"].append(contract)
+            cols["tenureMonths"].append(tenure)
+
+    add(80, "Month-to-Month", 3, 40)
+    add(20, "Two Year", 3, 10)
+    add(20, "Month-to-Month", 30, 2)
+    add(80, "Two Year", 30, 8)
+    return cols
+
+
+def test_query_has_one_column_per_factor():
+    query = factor_columns_query(SPEC)
+    assert "[(c)-[:HAS_CONTRACT]->(f:Contract) | coalesce(f.id, f.name)][0] AS `Contract`" in query
+    assert "c.`tenureMonths` AS `tenureMonths`" in query
+
+
+def test_encoding_codes_and_bins():
+    cols = {"churned": [True, False, None], "Contract": ["B", None, "A"], "tenureMonths": [5, None, 40.0]}
+    matrix = FactorMatrix.from_columns(cols, SPEC)
+    assert matrix.levels == [["A", "B"], ["tenureMonths:0-12", "tenureMonths:12+"]]
+    assert matrix.codes.tolist() == [[1, 0], [-1, -1], [0, 1]]
+    assert matrix.churned.tolist() == [True, False, False]
+
+
+def test_stratification_removes_confounding():
+    matrix = FactorMatrix.from_columns(_confounded_columns(), SPEC)
+    effects = {(e["factor"], e["node_id"]): e for e in estimate_effects(matrix)}
+    m2m = effects[("Contract", "Month-to-Month")]
+    assert m2m["naive_difference"] == pytest.approx(0.42 - 0.18)
+    assert m2m["risk_difference"] == pytest.approx(0.0)
+    assert m2m["ipw_effect"] == pytest.approx(0.0)
+    assert m2m["overlap"] == 1.0 and m2m["treated"] == 100 and m2m["support"] == 42
+    short = effects[("tenureMonths", "tenureMonths:0-12")]
+    assert short["risk_difference"] == pytest.approx(0.4)
+    # Unadjusted, the contract looks like a driver; adjusting for tenure removes it.
+    assert estimate_effects(matrix, adjust=[])[0]["risk_difference"] == pytest.approx(0.24)
+
+
+def test_estimated_interventions_from_row_client():
+    cols = _confounded_columns()
+    rows = [dict(zip(cols, values)) for values in zip(*cols.values())]
+    client = type("MockClient", (), {"run_cypher": lambda self, q, p=None: rows})()
+    matrix = load_factor_matrix(client, SPEC)
+    assert len(matrix) == 200
+    ranked = estimated_interventions(matrix, min_support=1, limit=2, outcome_id="churn:all")
+    assert ranked[0]["node_id"] == "tenureMonths:0-12"
+    assert ranked[0]["expected_direction"] == "risk_decrease_if_mitigated"
+    assert ranked[0]["expected_effect_score"] == pytest.approx(0.4)
+    assert 0 < ranked[0]["confidence"] <= 1
+    assert set(ranked[0]) == {
+        "node_id", "recommendation", "expected_direction", "expected_effect_score", "confidence", "caveats"
+    }
+    assert estimated_interventions(matrix, min_support=1000) == []
+
+
+def test_ranking_weights_effects_by_confidence_and_drops_poor_overlap(monkeypatch):
+    def effect(node_id, rd, confidence, overlap):
+        return {
+            "node_id": node_id, "factor": "Contract", "risk_difference": rd, "confidence": confidence,
+            "overlap": overlap, "std_error": 0.01, "ipw_effect": rd, "naive_difference": rd,
+            "support": 50, "treated": 100,
+        }
+
+    effects = [
+        effect("big-but-noisy", 0.5, 0.2, 1.0),
+        effect("solid", 0.3, 0.9, 1.0),
+        effect("no-overlap", 0.9, 0.95, 0.3),
+    ]
+    monkeypatch.setattr(causal_estimation, "estimate_effects", lambda *args: effects)
+    matrix = FactorMatrix.from_columns(_confounded_columns(), SPEC)
+    ranked = estimated_interventions(matrix, limit=None)
+    assert [o["node_id"] for o in ranked] == ["solid", "big-but-noisy"]
+    assert [o["node_id"] for o in estimated_interventions(matrix, limit=None, min_overlap=0.0)][0] == "no-overlap"
+    assert estimated_interventions(matrix, limit=0) == []
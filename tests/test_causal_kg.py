@@ -24,3 +24,88 @@ def test_get_causal_parents_with_mock_rows():
 
 def test_intervention_effect_returns_placeholder():
     assert causal_kg.intervention_effect(None, "n1", "n2") == {"estimated_effect": None}
+
+
+def test_customer_columns_uses_columnar_client():
+    calls = []
+
+    class ColumnarClient:
+        def run_cypher_columns(self, query, params, as_numpy=None):
+            calls.append((query, params, as_numpy))
+            return {"id": ["a"], "customerStatus": ["Churned"], "age": [30]}
+
+    cols = causal_kg.customer_columns(ColumnarClient(), ("age",), status="Churned")
+    assert cols["age"] == [30]
+    assert "c.`age` AS `age`" in calls[0][0]
+    assert calls[0][1] == {"status": "Churned"}
+
+
+def test_customer_columns_transposes_row_client():
+    rows = [
+        {"id": "a", "customerStatus": "Stayed", "age": 30, "monthlyCharge": 20.5},
+        {"id": "b", "customerStatus": "Churned", "age": 41, "monthlyCharge": None},
+    ]
+    client = type("MockClient", (), {"run_cypher": lambda self, q, p=None: rows})()
+    cols = causal_kg.customer_columns(client, ("age", "monthlyCharge"), as_numpy=False)
+    assert cols == {
+        "id": ["a", "b"],
+        "customerStatus": ["Stayed", "Churned"],
+        "age": [30, 41],
+        "monthlyCharge": [20.5, None],
+    }
+
+
+def test_intervention_effect_distance_heuristic_on_unweighted_path():
+    row = {"has_path": True, "path_length": 2, "churn_rate": None, "base_rate": None}
+    client = type("MockClient", (), {"run_cypher": lambda self, q, p=None: [row]})()
+    effect = causal_kg.intervention_effect(client, "Contract:Month-to-Month", "churn:abc")
+    assert effect["method"] == "graph_distance_heuristic"
+    assert effect["estimated_effect"] == 0.5
+
+
+def test_intervention_effect_segment_lift_on_weighted_edge():
+    row = {"has_path": True, "path_length": 1, "churn_rate": 0.45, "base_rate": 0.25, "support": 30, "lift": 1.8}
+    queries = []
+
+    class Client:
+        def run_cypher(self, query, params=None):
+            queries.append(query)
+            return [row]
+
+    effect = causal_kg.intervention_effect(Client(), "Contract:Month-to-Month", "churn:all")
+    assert "relationships(p)[0] AS first" in queries[0]
+    assert effect["method"] == "segment_lift"
+    assert effect["estimated_effect"] == 0.2
+    assert effect["confidence"] == 0.5
+    assert effect["direction"] == "risk_decrease_if_mitigated"
+
+
+def test_intervention_effects_scores_all_candidates_in_one_query():
+    rows = [
+        {"x": {"name": "Month-to-Month"}, "label": "Contract", "path_length": 1,
+         "churn_rate": 0.43, "base_rate": 0.27, "support": 90, "lift": 1.6},
+        {"x": {"name": "Price hike"}, "label": "Factor", "path_length": 2},
+    ]
+    calls = []
+
+    class Client:
+        def run_cypher(self, query, params=None):
+            calls.append((query, params))
+            return rows
+
+    effects = causal_kg.intervention_effects(
+        Client(), ["Contract:Month-to-Month", "Price hike", "Offer E"], "churn:all"
+    )
+    assert len(calls) == 1
+    assert calls[0][1]["candidates"] == ["Month-to-Month", "Price hike", "Offer E"]
+    query = calls[0][0]
+    assert "WITH DISTINCT x, outcome" in query
+    assert query.index("DISTINCT x") < query.index("shortestPath((x)-[:CAUSES*1..5]->(outcome))")
+    assert "min(path_length)" not in query
+    assert effects["Contract:Month-to-Month"]["method"] == "segment_lift"
+    assert effects["Price hike"]["estimated_effect"] == 0.5
+    assert effects["Offer E"]["direction"] == "unknown"
+
+    all_upstream = causal_kg.intervention_effects(Client(), None, "churn:all")
+    assert list(all_upstream) == ["Month-to-Month", "Price hike"]
+    assert calls[-1][1]["candidates"] is None
@@ -0,0 +1,101 @@
+"""Tests for graph.causal_overlay (spec parsing and query construction, no Neo4j)."""
+
+import pytest
+from pydantic import ValidationError
+
+from graph.causal_overlay import (
+    DEFAULT_OVERLAY_SPEC,
+    MERGE_BINS_QUERY,
+    SEGMENT_OUTCOME_ID,
+    BinnedFactor,
+    OverlaySpec,
+    build_customer_overlay,
+    build_segment_overlay,
+    load_overlay_spec,
+)
+
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def run_cypher(self, query, params=None):
+        self.calls.append((query, params))
+        if "RETURN count(DISTINCT co)" in query:
+            return [{"outcomes": 1, "causes": 4}]
+        return []
+
+
+def test_customer_overlay_syncs_changed_customers_in_chunks():
+    client = RecordingClient()
+    counts = build_customer_overlay(client, chunk_size=250)
+    assert counts == {"changed": 0, "removed": 0, "outcomes": 1, "causes": 4}
+    sync, params = client.calls[0]
+    assert params == {"full": False, "spec": DEFAULT_OVERLAY_SPEC.fingerprint()}
+    assert "c.overlayHash <> c.contentHash + '@' + $spec" in sync
+    assert "c.overlayKey <> key" in sync
+    assert "IN TRANSACTIONS OF 250 ROWS" in sync
+    assert "COLLECT { MATCH (c)-[:HAS_CONTRACT]->(f:Contract)" in sync
+    sweep = client.calls[1][0]
+    assert "coalesce(co.scope, 'customer') = 'customer'" in sweep
+    assert "IN TRANSACTIONS OF 250 ROWS" in sweep
+    assert client.calls[-1][1] == {"scope": "customer"}
+
+
+def test_full_customer_rebuild_ignores_watermark():
+    client = RecordingClient()
+    build_customer_overlay(client, full=True)
+    assert client.calls[0][1]["full"] is True
+    assert len(client.calls) == 3
+
+
+def test_segment_overlay_aggregates_all_factors_in_one_scan():
+    client = RecordingClient()
+    build_segment_overlay(client, min_support=5, min_lift=1.2)
+    assert client.calls[0][1] == {"id": SEGMENT_OUTCOME_ID}
+    assert "DETACH DELETE" not in client.calls[0][0]
+    edge_queries = [(q, p) for q, p in client.calls if "MERGE (f)-[r:CAUSES]->(co)" in q]
+    assert len(edge_queries) == 1
+    query, params = edge_queries[0]
+    assert query.count("MATCH (c:Customer)") == 1
+    assert "(c)-[:HAS_CONTRACT]->(f:Contract)" in query and "(c)-[:HAS_OFFER]->(f:Offer)" in query
+    assert "r.lift = churnRate / co.baseRate" in query
+    build_id = params.pop("build_id")
+    assert params == {"id": SEGMENT_OUTCOME_ID, "min_support": 5, "min_lift": 1.2}
+    # Stale edges from earlier builds are dropped only after the new ones exist.
+    assert client.calls[-2][1] == {"id": SEGMENT_OUTCOME_ID, "build_id": build_id}
+    assert "r.buildId <> $build_id" in client.calls[-2][0]
+
+
+def test_binned_factor_ids_match_python_and_cypher():
+    factor = BinnedFactor(kind="binned", property="tenureMonths", bins=[0, 12, 24])
+    assert [r["id"] for r in factor.bin_rows()] == ["tenureMonths:0-12", "tenureMonths:12-24", "tenureMonths:24+"]
+    assert factor.bin_for(None) is None and factor.bin_for(-1) is None
+    assert factor.bin_for(0) == "tenureMonths:0-12"
+    assert factor.bin_for(12) == "tenureMonths:12-24"
+    assert factor.bin_for(70) == "tenureMonths:24+"
+    expr = factor.collect("c")
+    assert "WHEN c.`tenureMonths` < 12.0 THEN 'tenureMonths:0-12'" in expr
+    assert "ELSE 'tenureMonths:24+' END" in expr
+
+
+def test_shipped_spec_and_bins_are_created_before_sync():
+    spec = load_overlay_spec()
+    kinds = {f.kind for f in spec.factors}
+    assert kinds == {"relationship", "binned"}
+    client = RecordingClient()
+    build_customer_overlay(client, spec=spec)
+    assert client.calls[0][0] == MERGE_BINS_QUERY
+    assert len(client.calls[0][1]["bins"]) == sum(len(f.bins) for f in spec.binned)
+    assert "HAS_PAYMENT_METHOD" in client.calls[1][0]
+    assert client.calls[1][1]["spec"] == spec.fingerprint() != DEFAULT_OVERLAY_SPEC.fingerprint()
+
+
+@pytest.mark.parametrize("factor", [
+    {"kind": "relationship", "relationship": "HAS_X]->() DETACH DELETE (", "label": "X"},
+    {"kind": "binned", "property": "age", "bins": [10, 5]},
+    {"kind": "cohort", "property": "age"},
+])
+def test_invalid_factor_specs_are_rejected(factor):
+    with pytest.raises(ValidationError):
+        OverlaySpec.model_validate({"factors": [factor]})
@@ -0,0 +1,169 @@
+"""Tests for graph.causal_paths."""
+
+import pytest
+import random
+
+from graph.causal_paths import (
+    decode_cursor,
+    encode_cursor,
+    first_depth_query,
+    page_paths,
+    paths_at_depth_query,
+)
+from graph.identity import IdentityResolver
+from graph.neo4j_client import Neo4jClient
+
+BY_DEPTH = {
+    1: [["a", "z"]],
+    2: [["a", "b", "z"], ["a", "c", "z"], ["a", "d", "z"]],
+    3: [["a", "b", "c", "z"]],
+}
+
+
+def make_fetch(calls):
+    def fetch(depth, skip, limit):
+        calls.append((depth, skip, limit))
+        return BY_DEPTH.get(depth, [])[skip:skip + limit]
+
+    return fetch
+
+
+def make_probe(calls):
+    def probe(depth, max_depth):
+        calls.append(("probe", depth, max_depth))
+        return next((d for d in range(depth, max_depth + 1) if BY_DEPTH.get(d)), None)
+
+    return probe
+
+
+def pages(calls, **kwargs):
+    return page_paths(make_fetch(calls), make_probe(calls), **kwargs)
+
+
+def test_cursor_roundtrip_and_validation():
+    assert decode_cursor(encode_cursor(3, 7)) == (3, 7)
+    assert decode_cursor(None) == (1, 0)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_pages_shortest_first_and_stops_early():
+    calls = []
+    page = pages(calls, max_depth=20, limit=2)
+    assert [p["path"] for p in page["paths"]] == [["a", "z"], ["a", "b", "z"]]
+    assert page["paths"][1]["length"] == 2
+    assert page["truncated"]
+    assert [c[0] for c in calls] == [1, 2]  # deeper levels never queried
+
+    page2 = pages(calls, max_depth=20, limit=2, cursor=page["next_cursor"])
+    assert [p["path"] for p in page2["paths"]] == [["a", "c", "z"], ["a", "d", "z"]]
+
+    page3 = pages([], max_depth=20, limit=10, cursor=page2["next_cursor"])
+    assert [p["path"] for p in page3["paths"]] == [["a", "b", "c", "z"]]
+    assert page3["next_cursor"] is None and not page3["truncated"]
+
+
+def test_page_filled_at_depth_boundary_probes_deeper_depths_once():
+    calls = []
+    page = pages(calls, max_depth=20, limit=4)
+    assert len(page["paths"]) == 4 and page["truncated"]
+    assert decode_cursor(page["next_cursor"]) == (3, 0)
+    assert calls[-1] == ("probe", 3, 20)
+
+    calls = []
+    page = pages(calls, max_depth=2, limit=4)
+    assert len(page["paths"]) == 4
+    assert page["next_cursor"] is None and not page["truncated"]
+    assert [c[0] for c in calls] == [1, 2]
+
+    # Empty depths 4..6 cost one probe, not one round-trip each.
+    calls = []
+    page = pages(calls, max_depth=6, limit=5)
+    assert len(page["paths"]) == 5 and not page["truncated"]
+    assert calls[-1] == ("probe", 4, 6) and sum(c[0] == "probe" for c in calls) == 1
+
+
+def test_probe_cursor_skips_empty_depths():
+    gappy = {1: [["a", "z"]], 4: [["a", "b", "c", "d", "z"]]}
+    calls = []
+    page = page_paths(
+        lambda d, skip, limit: calls.append(d) or gappy.get(d, [])[skip:skip + limit],
+        lambda d, max_d: next((k for k in range(d, max_d + 1) if gappy.get(k)), None),
+        max_depth=6,
+        limit=1,
+    )
+    assert decode_cursor(page["next_cursor"]) == (4, 0)
+    assert calls == [1]
+
+
+def test_max_depth_bounds_enumeration():
+    calls = []
+    page = pages(calls, max_depth=1, limit=10)
+    assert [p["path"] for p in page["paths"]] == [["a", "z"]]
+    assert page["next_cursor"] is None
+    assert [c[0] for c in calls] == [1]
+
+
+def test_depth_query_is_exact_simple_and_paged():
+    query, params = paths_at_depth_query(IdentityResolver(), "Contract:Month-to-Month", "churn:X", 3)
+    assert "[:CAUSES*3..3]" in query
+    assert "NOT nodes(path)[i] IN nodes(path)[i + 1..]" in query
+    assert "ORDER BY pathIds\n        SKIP $skip LIMIT $limit" in query
+    assert params == {"source_id": "Month-to-Month", "target_id": "churn:X"}
+
+
+def test_first_depth_query_tries_depths_in_order():
+    query, params = first_depth_query(IdentityResolver(), "Contract:Month-to-Month", "churn:X", 3, 5)
+    positions = [query.index(f"[:CAUSES*{d}..{d}]") for d in (3, 4, 5)]
+    assert positions == sorted(positions) and "[:CAUSES*6..6]" not in query
+    assert "THEN 3" in query and "RETURN min(depth) AS depth" in query
+    assert params == {"source_id": "Month-to-Month", "target_id": "churn:X"}
+
+
+def test_client_page_and_count(monkeypatch):
+    client = Neo4jClient("bolt://x", "u", "p")
+    seen = []
+
+    def run_cypher(query, params=None):
+        seen.append(params)
+        if "count(path)" in query:
+            return [{"n": params["cap"]}]
+        depth = int(query.split("[:CAUSES*")[1].split("..")[0])
+        return [{"pathIds": p} for p in BY_DEPTH.get(depth, [])[params["skip"]:params["skip"] + params["limit"]]]
+
+    monkeypatch.setattr(client, "run_cypher", run_cypher)
+    assert client.causal_paths("a", "z", max_depth=5, limit=3) == [
+        {"path": ["a", "z"], "length": 1},
+        {"path": ["a", "b", "z"], "length": 2},
+        {"path": ["a", "c", "z"], "length": 2},
+    ]
+    assert seen[-1]["limit"] == 3 and seen[-1]["skip"] == 0
+    assert client.count_causal_paths("a", "z", cap=50) == {"count": 50, "capped": True}
+
+
+def test_client_pages_are_stable_when_traversal_order_changes(monkeypatch):
+    client = Neo4jClient("bolt://x", "u", "p")
+    by_depth = {2: [["a", f"m{i:02d}", "z"] for i in range(23)], 3: [["a", "b", "c", "z"]]}
+    shuffler = random.Random(7)
+
+    def run_cypher(query, params=None):
+        if "RETURN min(depth)" in query:
+            first = int(query.split("[:CAUSES*")[1].split("..")[0])
+            return [{"depth": next((d for d in sorted(by_depth) if d >= first), None)}]
+        depth = int(query.split("[:CAUSES*")[1].split("..")[0])
+        rows = list(by_depth.get(depth, []))
+        shuffler.shuffle(rows)  # the traversal order differs on every call
+        if "ORDER BY pathIds" in query:
+            rows.sort()
+        return [{"pathIds": p} for p in rows[params["skip"]:params["skip"] + params["limit"]]]
+
+    monkeypatch.setattr(client, "run_cypher", run_cypher)
+    seen, cursor = [], None
+    while True:
+        page = client.causal_path_page("a", "z", max_depth=4, limit=5, cursor=cursor)
+        seen.extend(tuple(p["path"]) for p in page["paths"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 24
+    assert set(seen) == {tuple(p) for paths in by_depth.values() for p in paths}
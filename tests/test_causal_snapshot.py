@@ -0,0 +1,127 @@
+"""Tests for graph.causal_snapshot (offline, no Neo4j)."""
+
+from graph import causal_kg
+from graph.causal_snapshot import CAUSES_EDGES_QUERY, CausalSnapshot, SnapshotCausalClient
+from orchestration.agents.causal_agent import explain_causal_paths, suggest_interventions
+
+EDGES = [
+    {"source": "Month-to-Month", "sourceLabel": "Contract", "target": "churn:A", "targetLabel": "ChurnOutcome"},
+    {"source": "Month-to-Month", "sourceLabel": "Contract", "target": "churn:B", "targetLabel": "ChurnOutcome"},
+    {"source": "Offer E", "sourceLabel": "Offer", "target": "churn:A", "targetLabel": "ChurnOutcome"},
+    {"source": "Price hike", "sourceLabel": "Factor", "target": "Month-to-Month", "targetLabel": "Contract"},
+    {"source": "Price hike", "sourceLabel": "Factor", "target": "churn:A", "targetLabel": "ChurnOutcome"},
+]
+
+
+def test_csr_layout():
+    snap = CausalSnapshot(EDGES + EDGES[:1])  # duplicate edges collapse
+    assert snap.node_count == 5 and snap.edge_count == 5
+    assert list(snap.forward_offsets)[-1] == 5 and list(snap.reverse_offsets)[-1] == 5
+
+
+def test_children_parents_and_depth():
+    client = SnapshotCausalClient.from_edges(EDGES)
+    assert causal_kg.get_causal_children(client, "Month-to-Month") == [
+        {"id": "churn:A", "label": "ChurnOutcome"},
+        {"id": "churn:B", "label": "ChurnOutcome"},
+    ]
+    parents = causal_kg.get_causal_parents(client, "churn:A")
+    assert {p["id"] for p in parents} == {"Month-to-Month", "Offer E", "Price hike"}
+    assert {p["id"] for p in causal_kg.get_causal_parents(client, "churn:B", depth=2)} == {
+        "Month-to-Month",
+        "Price hike",
+    }
+    assert causal_kg.get_causal_parents(client, "churn:B", depth=1) == [
+        {"id": "Month-to-Month", "label": "Contract"}
+    ]
+    assert causal_kg.get_causal_children(client, "Contract:Month-to-Month")[0]["id"] == "churn:A"
+    assert causal_kg.get_causal_children(client, "missing") == []
+
+
+def test_paths_and_intervention_effect():
+    client = SnapshotCausalClient.from_edges(EDGES)
+    paths = client.causal_paths("Price hike", "churn:A", max_depth=5)
+    assert [p["path"] for p in paths] == [
+        ["Price hike", "churn:A"],
+        ["Price hike", "Month-to-Month", "churn:A"],
+    ]
+    assert client.causal_paths("Price hike", "churn:A", max_depth=1) == [
+        {"path": ["Price hike", "churn:A"], "length": 1}
+    ]
+    assert client.count_causal_paths("Price hike", "churn:A") == {"count": 2, "capped": False}
+    assert client.count_causal_paths("Price hike", "churn:A", cap=1) == {"count": 1, "capped": True}
+    assert client.causal_path_length("Price hike", "churn:B") == 2
+    effect = causal_kg.intervention_effect(client, "Price hike", "churn:B")
+    assert effect["estimated_effect"] == 0.5
+    assert causal_kg.intervention_effect(client, "churn:B", "Price hike")["direction"] == "unknown"
+
+
+def test_snapshot_path_pages_walk_each_depth_lazily():
+    snap = CausalSnapshot(EDGES)
+    sources = snap.lookup("Price hike")
+    targets = snap.lookup("churn:A")
+    walk = snap.paths_at_depth(sources, targets, 2)
+    assert next(walk) == ["Price hike", "Month-to-Month", "churn:A"]
+    assert next(walk, None) is None
+    assert list(snap.paths_at_depth(sources, snap.lookup("Offer E"), 2)) == []
+
+    client = SnapshotCausalClient.from_edges(EDGES)
+    first = client.causal_path_page("Price hike", "churn:A", max_depth=5, limit=1)
+    assert first["truncated"]
+    rest = client.causal_path_page("Price hike", "churn:A", max_depth=5, limit=1, cursor=first["next_cursor"])
+    assert [p["path"] for p in rest["paths"]] == [["Price hike", "Month-to-Month", "churn:A"]]
+    assert not rest["truncated"]
+
+
+def test_agents_run_on_snapshot_client():
+    client = SnapshotCausalClient.from_edges(EDGES)
+    ranked = suggest_interventions("churn:A", client)
+    assert [r["node_id"] for r in ranked][:3] == ["Month-to-Month", "Offer E", "Price hike"]
+    explained = explain_causal_paths("Price hike", "churn:B", client)
+    assert explained[0]["path"] == ["Price hike", "Month-to-Month", "churn:B"]
+
+
+def test_segment_edges_drive_intervention_effect():
+    segment = [
+        {"source": "Month-to-Month", "sourceLabel": "Contract", "target": "churn:all",
+         "targetLabel": "ChurnOutcome", "support": 90, "churnRate": 0.43, "baseRate": 0.27, "lift": 1.6},
+        {"source": "Offer E", "sourceLabel": "Offer", "target": "churn:all",
+         "targetLabel": "ChurnOutcome", "support": 10, "churnRate": 0.5, "baseRate": 0.27, "lift": 1.85},
+    ]
+    client = SnapshotCausalClient.from_edges(segment + EDGES)
+    assert client.causal_path_summary("Month-to-Month", "churn:all") == {
+        "has_path": True, "path_length": 1, "churn_rate": 0.43, "base_rate": 0.27, "support": 90, "lift": 1.6,
+    }
+    effect = causal_kg.intervention_effect(client, "Month-to-Month", "churn:all")
+    assert effect["method"] == "segment_lift" and effect["estimated_effect"] == 0.16
+    assert causal_kg.intervention_effect(client, "Month-to-Month", "churn:A")["method"] == "graph_distance_heuristic"
+    ranked = suggest_interventions("churn:all", client, depth=1)
+    assert [r["node_id"] for r in ranked] == ["Offer E", "Month-to-Month"]
+    assert ranked[0]["confidence"] < ranked[1]["confidence"]
+    effects = causal_kg.intervention_effects(client, ["Price hike", "Offer E"], "churn:all")
+    assert effects["Price hike"]["method"] == "graph_distance_heuristic"
+    assert effects["Price hike"]["estimated_effect"] == 0.5
+    assert effects["Offer E"]["estimated_effect"] == 0.23
+
+
+def test_reloads_when_write_generation_changes():
+    class Source:
+        generation = 1
+        edges = EDGES[:1]
+        loads = 0
+
+        def run_cypher(self, query, params=None):
+            if "GraphMeta" in query:
+                return [{"generation": self.generation}]
+            assert query == CAUSES_EDGES_QUERY
+            self.loads += 1
+            return list(self.edges)
+
+    source = Source()
+    client = SnapshotCausalClient(source, refresh_interval=0)
+    assert len(client.causal_parents("churn:A")) == 1
+    assert len(client.causal_parents("churn:A")) == 1
+    assert source.loads == 1
+    source.generation, source.edges = 2, EDGES
+    assert len(client.causal_parents("churn:A")) == 3
+    assert source.loads == 2
@@ -0,0 +1,31 @@
+"""Tests for graph.columnar."""
+
+import math
+
+import pytest
+from graph.columnar import infer_array, records_to_columns
+
+np = pytest.importorskip("numpy")
+
+
+def test_records_to_columns_infers_numeric_dtypes():
+    records = [("a", 1, 20.5, True, "x"), ("b", 2, None, False, None)]
+    cols = records_to_columns(["id", "n", "charge", "flag", "tag"], records)
+    assert cols["id"] == ["a", "b"]
+    assert cols["n"].dtype == np.int64 and cols["n"].tolist() == [1, 2]
+    assert cols["charge"].dtype == np.float64
+    assert cols["charge"][0] == 20.5 and math.isnan(cols["charge"][1])
+    assert cols["flag"].dtype == bool
+    assert cols["tag"] == ["x", None]
+
+
+def test_records_to_columns_plain_lists():
+    cols = records_to_columns(["a", "b"], [(1, 2), (3, 4)], as_numpy=False)
+    assert cols == {"a": [1, 3], "b": [2, 4]}
+
+
+def test_infer_array_mixed_int_float_and_untyped():
+    assert infer_array([1, 2.5]).dtype == np.float64
+    assert infer_array([None, None]) == [None, None]
+    assert infer_array([True, None]) == [True, None]
+    assert infer_array([]) == []
@@ -0,0 +1,77 @@
+"""Tests for scripts/export_admin_import.py (no Neo4j required)."""
+
+import csv
+import importlib.util
+import os
+
+_SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+_spec = importlib.util.spec_from_file_location(
+    "export_admin_import", os.path.join(_SCRIPTS, "export_admin_import.py")
+)
+exporter = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(exporter)
+
+CHURN_HEADER = [col for _, col, _ in exporter.CUSTOMER_PROPERTIES]
+
+
+def _write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(path)
+
+
+def _churn_row(cid, **values):
+    row = dict.fromkeys(CHURN_HEADER, "")
+    row.update({"Gender": "Female", "Age": "37", "City": "Frazier Park", "Zip Code": "93225",
+                "Offer": "None", "Contract": "One Year", "Payment Method": "Credit Card",
+                "Monthly Charge": "65.6", "Customer Status": "Stayed"})
+    row.update(values)
+    return [cid] + [row[col] for col in CHURN_HEADER]
+
+
+def test_field_quotes_empty_strings_but_not_none():
+    assert exporter._field(None) == ""
+    assert exporter._field("") == '""'
+    assert exporter._field('say "hi", ok') == '"say ""hi"", ok"'
+    assert exporter._field(1.5) == "1.5"
+
+
+def test_export_round_trips_header_and_rows(tmp_path):
+    churn = _write_csv(tmp_path / "churn.csv", ["Customer ID", *CHURN_HEADER], [
+        _churn_row("0001", **{"Multiple Lines": "", "Internet Type": "Cable"}),
+        _churn_row("0002", **{"Customer Status": "Churned", "Churn Category": "Competitor"}),
+    ])
+    zips = _write_csv(tmp_path / "zip.csv", ["Zip Code", "Population"], [["93225", "4281"]])
+    dictionary = _write_csv(tmp_path / "dict.csv", ["Table", "Field", "Description"], [
+        ["Customer Churn", "Gender", ""],
+        ["Customer Churn", "Age", "Age in years"],
+    ])
+    out = tmp_path / "out"
+    result = exporter.export(churn, zips, dictionary, str(out))
+
+    assert result["counts"]["Customer"] == 2
+    assert result["counts"]["HAS_CONTRACT"] == 2
+    customer_path = str(out / "nodes_customer.csv")
+    with open(customer_path, newline="", encoding="utf-8") as f:
+        header, *rows = list(csv.reader(f))
+    assert header[0] == "id:ID(Customer)"
+    assert header[-2:] == ["contentHash", ":LABEL"]
+    assert "age:int" in header and "monthlyCharge:float" in header
+    first = dict(zip(header, rows[0]))
+    assert first["id:ID(Customer)"] == "0001"
+    assert first["age:int"] == "37"
+    assert first["monthlyCharge:float"] == "65.6"
+    assert rows[1][header.index("churnCategory")] == "Competitor"
+
+    # "str" columns keep "" (quoted), "str?" columns are null (empty cell).
+    with open(customer_path, encoding="utf-8") as f:
+        raw = f.read().splitlines()[1].split(",")
+    assert raw[header.index("multipleLines")] == '""'
+    assert raw[header.index("churnCategory")] == ""
+
+    with open(out / "nodes_field.csv", encoding="utf-8") as f:
+        fields = f.read().splitlines()
+    assert fields[1] == "Customer Churn|Gender,Gender,Customer Churn,,Field"
+    assert fields[2] == "Customer Churn|Age,Age,Customer Churn,Age in years,Field"
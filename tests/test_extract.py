@@ -0,0 +1,256 @@
+"""Tests for data_pipeline.extract."""
+
+import pytest
+from data_pipeline import extract
+
+
+def _write(path, text, encoding="utf-8"):
+    path.write_bytes(text.encode(encoding))
+    return str(path)
+
+
+def test_extract_from_csv_yields_typed_batches(tmp_path):
+    path = _write(
+        tmp_path / "rows.csv",
+        " id , age, charge, offer\n a ,30,1.5,\n b , ,x, Offer A \n c,41.0,2,None\n",
+    )
+    batches = list(extract.extract_from_csv(
+        path,
+        types={"age": "int", "charge": "float", "offer": "str?"},
+        batch_size=2,
+    ))
+    assert [len(b) for b in batches] == [2, 1]
+    rows = [r for b in batches for r in b]
+    assert rows[0] == {"id": "a", "age": 30, "charge": 1.5, "offer": None}
+    assert rows[1] == {"id": "b", "age": None, "charge": None, "offer": "Offer A"}
+    assert rows[2]["age"] == 41
+    assert rows[2]["offer"] == "None"
+
+
+def test_extract_from_csv_selects_columns_and_pads_short_rows(tmp_path):
+    path = _write(tmp_path / "rows.csv", "a,b,c\n1,2\n")
+    rows = next(extract.extract_from_csv(path, columns=["a", "c"]))
+    assert rows == [{"a": "1", "c": ""}]
+
+
+def test_extract_from_csv_falls_back_to_cp1252(tmp_path):
+    path = _write(tmp_path / "dict.csv", "Field,Description\nGender,The customer’s gender\n", "cp1252")
+    rows = next(extract.extract_from_csv(path, fallback_encoding="cp1252"))
+    assert rows[0]["Description"] == "The customer’s gender"
+    with pytest.raises(UnicodeDecodeError):
+        list(extract.extract_from_csv(path))
+
+
+def test_extract_from_csv_rejects_unknown_type(tmp_path):
+    path = _write(tmp_path / "rows.csv", "a\n1\n")
+    with pytest.raises(ValueError):
+        list(extract.extract_from_csv(path, types={"a": "decimal"}))
+
+
+@pytest.fixture
+def sqlite_uri(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "warehouse.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE customers (id INTEGER PRIMARY KEY, status TEXT, charge REAL)")
+    conn.executemany(
+        "INSERT INTO customers VALUES (?, ?, ?)",
+        [(i, "Churned" if i % 4 == 0 else "Stayed", i * 1.5) for i in range(1, 101)],
+    )
+    conn.commit()
+    conn.close()
+    yield f"sqlite:///{path}"
+    extract.close_pools()
+
+
+def test_extract_from_db_streams_fetchmany_batches(sqlite_uri):
+    batches = list(extract.extract_from_db(
+        sqlite_uri, "SELECT id, status FROM customers WHERE status = ?", ["Churned"], batch_size=10
+    ))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert batches[0][0] == {"id": 4, "status": "Churned"}
+
+
+def test_extract_from_db_range_partitioned(sqlite_uri):
+    batches = list(extract.extract_from_db(
+        sqlite_uri,
+        "SELECT id, charge FROM customers",
+        batch_size=7,
+        partition_column="id",
+        partitions=4,
+    ))
+    ids = sorted(r["id"] for b in batches for r in b)
+    assert ids == list(range(1, 101))
+    assert all(len(b) <= 7 for b in batches)
+
+
+def test_extract_from_db_partitions_keep_null_keys(sqlite_uri):
+    import sqlite3
+
+    conn = sqlite3.connect(sqlite_uri[len("sqlite:///"):])
+    conn.execute("UPDATE customers SET charge = NULL WHERE id IN (3, 50)")
+    conn.commit()
+    conn.close()
+    rows = [
+        r
+        for b in extract.extract_from_db(
+            sqlite_uri, "SELECT id, charge FROM customers", partition_column="charge", partitions=3
+        )
+        for r in b
+    ]
+    assert sorted(r["id"] for r in rows) == list(range(1, 101))
+    assert sorted(r["id"] for r in rows if r["charge"] is None) == [3, 50]
+
+
+def test_get_pool_is_shared_per_uri_and_size(sqlite_uri):
+    small = extract.get_pool(sqlite_uri, max_size=2)
+    assert extract.get_pool(sqlite_uri, max_size=2) is small
+    large = extract.get_pool(sqlite_uri, max_size=8)
+    assert large is not small
+    assert large.max_size == 8
+
+
+def test_extract_from_db_partitions_float_column_and_surfaces_errors(sqlite_uri):
+    rows = [
+        r
+        for b in extract.extract_from_db(
+            sqlite_uri, "SELECT id, charge FROM customers", partition_column="charge", partitions=3
+        )
+        for r in b
+    ]
+    assert len(rows) == 100
+    with pytest.raises(Exception):
+        list(extract.extract_from_db(
+            sqlite_uri, "SELECT nope FROM customers", partition_column="id", partitions=2
+        ))
+    with pytest.raises(ValueError):
+        list(extract.extract_from_db(
+            sqlite_uri, "SELECT id FROM customers", partition_column="id; DROP", partitions=2
+        ))
+
+
+def test_extract_from_db_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        list(extract.extract_from_db("oracle://warehouse", "SELECT 1"))
+
+
+class _PagedHandler:
+    """Builds a BaseHTTPRequestHandler serving 23 items in pages, with injected failures."""
+
+    @staticmethod
+    def make(state):
+        import json
+        from http.server import BaseHTTPRequestHandler
+        from urllib.parse import parse_qs, urlparse
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                page = int(query["page"][0])
+                size = int(query["page_size"][0])
+                with state["lock"]:
+                    state["requests"].append(page)
+                    fail = state["fail"].pop(page, None)
+                if fail:
+                    self.send_response(fail)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    return
+                items = [{"id": i} for i in range((page - 1) * size, min(23, page * size))]
+                body = {"items": items}
+                if state["with_total"]:
+                    body["total_pages"] = -(-23 // size)
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+@pytest.fixture
+def api_server():
+    import threading
+    from http.server import ThreadingHTTPServer
+
+    state = {"lock": threading.Lock(), "requests": [], "fail": {}, "with_total": True}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PagedHandler.make(state))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", state
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_from_api_fetches_all_pages_with_retries(api_server):
+    base_url, state = api_server
+    state["fail"] = {2: 429, 3: 503}
+    batches = list(extract.extract_from_api(
+        base_url, "/customers", page_size=5, concurrency=3, backoff=0.01
+    ))
+    ids = sorted(item["id"] for batch in batches for item in batch)
+    assert ids == list(range(23))
+    assert state["requests"].count(2) == 2
+    assert state["requests"].count(3) == 2
+
+
+def test_extract_from_api_stops_at_empty_page_without_total(api_server):
+    base_url, state = api_server
+    state["with_total"] = False
+    batches = list(extract.extract_from_api(
+        base_url, "customers", page_size=10, concurrency=2, rate_limit=100
+    ))
+    assert sorted(i["id"] for b in batches for i in b) == list(range(23))
+
+
+def test_extract_from_api_raises_after_retries(api_server):
+    base_url, state = api_server
+    state["fail"] = {1: 404}
+    with pytest.raises(Exception):
+        list(extract.extract_from_api(base_url, "customers", max_retries=1, backoff=0.01))
+
+
+def test_token_bucket_limits_rate():
+    import asyncio
+    import time
+
+    async def run():
+        bucket = extract.TokenBucket(rate=50, capacity=1)
+        started = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_extract_from_db_partitions_text_keys_at_quantiles(sqlite_uri):
+    query = "SELECT printf('%04d-CUST', id) AS customer_id, status FROM customers"
+    batches = list(extract.extract_from_db(
+        sqlite_uri, query, batch_size=100, partition_column="customer_id", partitions=4
+    ))
+    assert len(batches) == 4
+    assert sorted(r["customer_id"] for b in batches for r in b) == [f"{i:04d}-CUST" for i in range(1, 101)]
+    # Skewed keys: two distinct values collapse duplicate quantiles into fewer ranges.
+    rows = [r for b in extract.extract_from_db(
+        sqlite_uri, "SELECT id, status FROM customers", partition_column="status", partitions=4
+    ) for r in b]
+    assert sorted(r["id"] for r in rows) == list(range(1, 101))
+
+
+def test_partition_bounds_handles_dates_and_decimals_and_rejects_other_keys():
+    from datetime import date
+    from decimal import Decimal
+
+    days = extract._partition_bounds(date(2024, 1, 1), date(2024, 1, 31), 3)
+    assert days[0][0] == date(2024, 1, 1) and days[-1] == (days[-1][0], date(2024, 1, 31), True)
+    money = extract._partition_bounds(Decimal("0"), Decimal("9"), 3)
+    assert [b[0] for b in money] == [Decimal("0"), Decimal("3"), Decimal("6")]
+    with pytest.raises(ValueError, match="Cannot range-partition"):
+        extract._partition_bounds((1,), (2,), 2)
@@ -0,0 +1,70 @@
+"""Tests for graph.schema."""
+
+from graph import schema
+
+
+class RecordingClient:
+    def __init__(self, constraints=None, indexes=None):
+        self.queries = []
+        self.constraints = constraints or []
+        self.indexes = indexes or []
+
+    def run_cypher(self, query, parameters=None):
+        self.queries.append(query)
+        if query.startswith("SHOW CONSTRAINTS"):
+            return self.constraints
+        if query.startswith("SHOW INDEXES"):
+            return self.indexes
+        return []
+
+
+def test_create_statements():
+    single = schema.SchemaItem("customer_id", "unique", "Customer", ("id",))
+    composite = schema.SchemaItem("field_key", "unique", "Field", ("name", "tableName"))
+    index = schema.SchemaItem("status", "index", "Customer", ("customerStatus",))
+    assert single.create_statement() == (
+        "CREATE CONSTRAINT customer_id IF NOT EXISTS FOR (n:Customer) REQUIRE n.id IS UNIQUE"
+    )
+    assert "REQUIRE (n.name, n.tableName) IS UNIQUE" in composite.create_statement()
+    assert index.create_statement() == (
+        "CREATE INDEX status IF NOT EXISTS FOR (n:Customer) ON (n.customerStatus)"
+    )
+
+
+def test_apply_schema_creates_only_missing_items():
+    client = RecordingClient()
+    applied = schema.apply_schema(client)
+    assert applied == [item.name for item in schema.SCHEMA]
+    creates = [q for q in client.queries if q.startswith("CREATE")]
+    assert len(creates) == len(schema.SCHEMA)
+    assert all("IF NOT EXISTS" in q for q in creates)
+
+    client = RecordingClient(constraints=[
+        {"name": "existing", "type": "UNIQUENESS", "entityType": "NODE",
+         "labelsOrTypes": ["Customer"], "properties": ["id"]},
+    ])
+    applied = schema.apply_schema(client)
+    assert "customer_id" not in applied
+    assert len(applied) == len(schema.SCHEMA) - 1
+    assert not any("customer_id" in q for q in client.queries)
+
+
+def test_schema_drift_reports_missing_and_undeclared():
+    client = RecordingClient(
+        constraints=[
+            {"name": "c1", "type": "UNIQUENESS", "entityType": "NODE",
+             "labelsOrTypes": ["Customer"], "properties": ["id"]},
+            {"name": "legacy", "type": "UNIQUENESS", "entityType": "NODE",
+             "labelsOrTypes": ["Product"], "properties": ["sku"]},
+        ],
+        indexes=[
+            {"name": "c1", "type": "RANGE", "entityType": "NODE",
+             "labelsOrTypes": ["Customer"], "properties": ["id"], "owningConstraint": "c1"},
+            {"name": "lookup", "type": "LOOKUP", "entityType": "NODE",
+             "labelsOrTypes": None, "properties": None, "owningConstraint": None},
+        ],
+    )
+    drift = schema.schema_drift(client)
+    assert "customer_id" not in drift["missing"]
+    assert "contract_name" in drift["missing"]
+    assert drift["undeclared"] == ["legacy"]
@@ -0,0 +1,76 @@
+"""Tests for graph.identity."""
+
+from graph import causal_kg
+from graph.identity import IDENTITY_KEYS, IdentityResolver, NodeRef
+
+
+def test_prefix_and_pattern_rules():
+    r = IdentityResolver()
+    assert r.resolve("churn:0004-TLHLJ") == NodeRef("ChurnOutcome", "id", "churn:0004-TLHLJ")
+    assert r.resolve("0004-TLHLJ") == NodeRef("Customer", "id", "0004-TLHLJ")
+    assert r.resolve("Contract:Month-to-Month") == NodeRef("Contract", "name", "Month-to-Month")
+    assert r.resolve("ZipCode:90001") == NodeRef("ZipCode", "zipCode", "90001")
+    assert r.resolve("Month-to-Month") is None
+
+
+def test_name_table_and_register():
+    class Client:
+        def run_cypher(self, query, params=None):
+            assert "MATCH (n:`Contract`) RETURN 'Contract' AS label" in query
+            assert "UNION ALL" in query
+            return [
+                {"label": "Contract", "value": "Month-to-Month"},
+                {"label": "Offer", "value": "Offer E"},
+                {"label": "Offer", "value": None},
+            ]
+
+    r = IdentityResolver()
+    assert r.load_names(Client()) == 2
+    assert r.resolve("Offer E") == NodeRef("Offer", "name", "Offer E")
+    r.register("San Diego", "City")
+    assert r.resolve("San Diego") == NodeRef("City", "name", "San Diego")
+
+
+def test_match_uses_indexed_lookups():
+    r = IdentityResolver()
+    clause, params = r.match("n", "churn:0004-TLHLJ", "node_id")
+    assert clause == "MATCH (n:`ChurnOutcome` {`id`: $node_id})"
+    assert params == {"node_id": "churn:0004-TLHLJ"}
+
+    clause, params = r.match("n", "Month-to-Month", "node_id")
+    assert clause.startswith("CALL {")
+    for label, key in IDENTITY_KEYS.items():
+        assert f"MATCH (m:`{label}` {{`{key}`: $node_id}}) RETURN m" in clause
+    assert "GraphMeta" not in clause
+    assert params == {"node_id": "Month-to-Month"}
+
+
+def test_union_lookup_falls_back_to_a_scan_for_labels_outside_schema():
+    r = IdentityResolver()
+    assert "Segment" not in r.keys
+    clause, params = r.match("n", "Segment:high-value", "node_id")
+    assert params == {"node_id": "Segment:high-value"}
+    # The scan only runs when every index seek came back empty.
+    guard = clause.index("UNWIND CASE WHEN size(hits) = 0 THEN [1] ELSE [] END AS scan")
+    scan = clause.index("MATCH (m) WHERE m.id = $node_id OR m.name = $node_id")
+    assert clause.index("WITH collect(m) AS hits") < guard < scan
+    assert clause.rstrip().endswith("UNWIND hits + scanned AS n\n    RETURN n\n}")
+
+
+def test_causal_helpers_avoid_all_node_scans():
+    queries = []
+
+    class Client:
+        def run_cypher(self, query, params=None):
+            queries.append((query, params))
+            return []
+
+    causal_kg.get_causal_parents(Client(), "churn:0004-TLHLJ")
+    causal_kg.intervention_effect(Client(), "Contract:Month-to-Month", "churn:0004-TLHLJ")
+    for query, _ in queries:
+        assert "OR n.name" not in query and "WHERE" not in query
+    assert "MATCH (intervention:`Contract` {`name`: $intervention_node_id})" in queries[1][0]
+    assert queries[1][1] == {
+        "intervention_node_id": "Month-to-Month",
+        "outcome_node_id": "churn:0004-TLHLJ",
+    }
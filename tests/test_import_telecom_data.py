@@ -0,0 +1,140 @@
+"""Tests for scripts/import_telecom_data.py (no Neo4j required)."""
+
+import importlib.util
+import os
+import queue
+from concurrent.futures import Future
+
+import pytest
+
+from data_pipeline import mapping
+from graph.neo4j_client import Neo4jClient
+from graph.query_stats import QueryStats, fingerprint
+from tests.fakes import FakeDriver
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_spec = importlib.util.spec_from_file_location(
+    "import_telecom_data", os.path.join(ROOT, "scripts", "import_telecom_data.py")
+)
+importer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(importer)
+
+
+def test_parallel_workers_reject_single_transaction_mode():
+    assert importer.parse_args(["--workers", "4"]).commit_per_batch
+    with pytest.raises(SystemExit):
+        importer.parse_args(["--workers", "4", "--no-commit-per-batch"])
+
+
+def test_incremental_load_honours_single_transaction_mode():
+    churn = os.path.join(ROOT, "scripts", "telecom_customer_churn.csv")
+    per_batch = FakeDriver()
+    importer.load_customers_incremental(per_batch, churn, batch_size=1000)
+    assert len(per_batch.commits) == 8
+
+    single = FakeDriver()
+    counts = importer.load_customers_incremental(single, churn, batch_size=1000, commit_per_batch=False)
+    assert counts["inserted"] == 7043
+    assert single.commits == [len(single.calls)]
+
+
+def test_close_does_not_block_on_full_queue_of_dead_worker():
+    batches = queue.Queue(maxsize=1)
+    batches.put([{"id": "a"}])
+    future = Future()
+    future.set_exception(RuntimeError("worker died"))
+    importer._close(batches, future)
+    assert batches.qsize() == 1
+
+    idle = queue.Queue(maxsize=1)
+    importer._close(idle, Future())
+    assert idle.get_nowait() is None
+
+
+def test_content_hash_is_stable_and_order_independent():
+    props = {"age": 30, "city": "Oakland"}
+    links = {"HAS_CONTRACT": ["One Year"], "HAS_OFFER": []}
+    digest = importer.content_hash(props, links)
+    assert digest == importer.content_hash(dict(reversed(props.items())), dict(reversed(links.items())))
+    assert len(digest) == 40
+    assert digest != importer.content_hash({**props, "age": 31}, links)
+    assert digest != importer.content_hash(props, {**links, "HAS_OFFER": ["Offer A"]})
+
+
+def test_customer_row_hash_covers_props_and_links():
+    row = {"Customer ID": " 0001 ", "Contract": "Month-to-Month", "Offer": "None"}
+    mapped = importer.customer_row(row)
+    assert mapped["id"] == "0001"
+    assert mapped["links"]["HAS_OFFER"] == []
+    assert mapped["hash"] == importer.content_hash(mapped["props"], mapped["links"])
+
+
+def test_upsert_query_drops_managed_links_before_relinking():
+    assert "DELETE old" not in importer.CUSTOMER_QUERY
+    upsert = importer.CUSTOMER_UPSERT_QUERY
+    cleanup = upsert.index("DELETE old")
+    assert cleanup < upsert.index("SET c += r.props") < upsert.index("FOREACH")
+    for _, _, rel, _ in importer.CUSTOMER_LINKS:
+        assert rel in upsert[:cleanup]
+
+
+def test_delete_customers_also_removes_churn_outcomes():
+    query = importer.DELETE_CUSTOMERS_QUERY
+    assert "OPTIONAL MATCH (c)-[:HAS_OUTCOME]->(co:ChurnOutcome)" in query
+    assert "DETACH DELETE c, co" in query
+
+
+def test_mapping_load_writes_the_importer_content_hash():
+    churn = os.path.join(ROOT, "scripts", "telecom_customer_churn.csv")
+    spec = os.path.join(ROOT, "src", "specs", "mappings", "telecom_customers.yml")
+    driver = FakeDriver()
+    mapping.compile_mapping(spec).run_csv(driver, path=churn)
+    mapped = {}
+    for query, params in driver.calls:
+        if "MERGE (n:`Customer`" in query:
+            mapped.update((row["id"], row["properties"]["contentHash"]) for row in params["rows"])
+    imported = {row["id"]: row["hash"] for row in importer.iter_customer_rows(churn)}
+    assert len(imported) == 7043
+    assert mapped == imported
+
+
+def test_parallel_load_reads_csv_once_and_merges_dimensions_first(monkeypatch):
+    churn = os.path.join(ROOT, "scripts", "telecom_customer_churn.csv")
+    reads = []
+    iter_rows = importer.iter_customer_rows
+
+    def counting(path):
+        reads.append(path)
+        yield from iter_rows(path)
+
+    monkeypatch.setattr(importer, "iter_customer_rows", counting)
+    driver = FakeDriver()
+    assert importer.load_customers_parallel(driver, churn, workers=3, batch_size=500) == 7043
+    assert len(reads) == 1
+
+    merged_at = {}
+    for i, (query, params) in enumerate(driver.calls):
+        if query.startswith("UNWIND $values AS v MERGE (:Contract"):
+            merged_at.update(dict.fromkeys(params["values"], i))
+    assert set(merged_at) == {"Month-to-Month", "One Year", "Two Year"}
+    for i, (query, params) in enumerate(driver.calls):
+        if query == importer.CUSTOMER_QUERY:
+            for row in params["rows"]:
+                assert all(merged_at[v] < i for v in row["links"]["HAS_CONTRACT"])
+
+
+def test_loaders_record_writes_in_client_query_stats(monkeypatch):
+    import graph.neo4j_client as client_module
+
+    driver = FakeDriver()
+    monkeypatch.setattr(client_module.GraphDatabase, "driver", lambda *a, **k: driver)
+    client = Neo4jClient("bolt://x", "u", "p", stats=QueryStats(slow_query_ms=None))
+    zips = os.path.join(ROOT, "scripts", "telecom_zipcode_population.csv")
+    assert importer.load_zipcodes(client, zips, batch_size=500) == 1671
+
+    by_fingerprint = {e["fingerprint"]: e for e in client.stats.snapshot()}
+    assert by_fingerprint[fingerprint(importer.ZIPCODE_QUERY)]["count"] == 4
+    assert by_fingerprint[fingerprint("MATCH (z:ZipCode) DETACH DELETE z")]["count"] == 1
+    assert client.inflight_stats() == {
+        "max_connection_pool_size": 100, "in_flight": 0, "peak_in_flight": 1, "calls": 2
+    }
@@ -0,0 +1,78 @@
+"""Tests for data_pipeline.load_neo4j."""
+
+import pytest
+from data_pipeline import load_neo4j, transform
+from data_pipeline.schemas import CausalEdge, EdgeBase, EdgeBatch, NodeBase, NodeBatch
+from tests.fakes import FakeDriver
+
+
+def test_load_nodes_groups_by_label_and_batches():
+    driver = FakeDriver()
+    nodes = (
+        NodeBase(id=str(i), label="Customer" if i % 2 else "Contract", properties={"i": i})
+        for i in range(5)
+    )
+    stats = load_neo4j.load_nodes(driver, nodes, batch_size=2)
+    assert stats["Customer"]["count"] == 2
+    assert stats["Contract"]["count"] == 3
+    assert stats["Contract"]["batches"] == 2
+    queries = {q for q, _ in driver.calls}
+    assert any("MERGE (n:`Customer` {`id`: row.id})" in q for q in queries)
+    assert all(len(p["rows"]) <= 2 for _, p in driver.calls)
+
+
+def test_load_edges_uses_labels_and_rel_type_override():
+    driver = FakeDriver()
+    edges = [
+        CausalEdge(source_id="Month-to-Month", target_id="churn:1"),
+        EdgeBase(source_id="a", target_id="b", relation_type="HAS_OFFER"),
+    ]
+    stats = load_neo4j.load_edges(
+        driver, iter(edges), source_label="Contract", target_label="ChurnOutcome", source_key="name"
+    )
+    assert set(stats) == {"CAUSES", "HAS_OFFER"}
+    query = next(q for q, _ in driver.calls if "CAUSES" in q)
+    assert "MATCH (a:`Contract` {`name`: row.source_id})" in query
+    assert "MATCH (b:`ChurnOutcome` {`id`: row.target_id})" in query
+
+    driver = FakeDriver()
+    stats = load_neo4j.load_edges(driver, edges, rel_type="LINKED")
+    assert stats == {"LINKED": {"count": 2, "batches": 1, "seconds": stats["LINKED"]["seconds"]}}
+
+
+def test_quote_identifier_escapes_backticks():
+    assert load_neo4j.quote_identifier("Odd`Label") == "`Odd``Label`"
+    with pytest.raises(ValueError):
+        load_neo4j.quote_identifier("")
+
+
+def test_load_nodes_sends_node_batches_as_row_maps():
+    driver = FakeDriver()
+    batch = NodeBatch(label="Customer", ids=["a", "b", "c"], columns={"age": [1, 2, 3]})
+    stats = load_neo4j.load_nodes(driver, [batch], batch_size=2)
+    assert stats["Customer"]["count"] == 3
+    assert stats["Customer"]["batches"] == 2
+    query, params = driver.calls[0]
+    assert query == load_neo4j.node_query("Customer")
+    assert params == {"rows": [{"id": "a", "properties": {"age": 1}}, {"id": "b", "properties": {"age": 2}}]}
+
+
+def test_load_edges_sends_edge_batches_as_row_maps():
+    driver = FakeDriver()
+    batch = EdgeBatch(relation_type="CAUSES", source_ids=["x"], target_ids=["y"], columns={})
+    stats = load_neo4j.load_edges(driver, [batch], source_label="Contract")
+    assert stats["CAUSES"]["count"] == 1
+    query, params = driver.calls[0]
+    assert query == load_neo4j.edge_query("CAUSES", "Contract")
+    assert params == {"rows": [{"source_id": "x", "target_id": "y", "properties": {}}]}
+
+
+def test_columnar_nodes_skip_properties_missing_from_some_rows():
+    driver = FakeDriver()
+    raw = [{"id": "a", "age": 30, "city": "Oakland"}, {"id": "b", "age": 41}]
+    load_neo4j.load_nodes(driver, transform.to_nodes(raw, label="Customer"))
+    query, params = driver.calls[0]
+    # A padded null must not wipe b's stored city: null cells are dropped from the row map.
+    assert params["rows"][1] == {"id": "b", "properties": {"age": 41}}
+    assert "SET n += row.properties" in query
+    assert "FOREACH" not in query
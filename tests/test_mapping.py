@@ -0,0 +1,85 @@
+"""Tests for data_pipeline.mapping."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from data_pipeline import mapping, transform
+from tests.fakes import FakeDriver
+
+ROOT = Path(__file__).resolve().parents[1]
+TELECOM_MAPPING = ROOT / "src" / "specs" / "mappings" / "telecom_customers.yml"
+
+
+def test_load_mapping_telecom_spec():
+    spec = mapping.load_mapping(TELECOM_MAPPING)
+    assert spec.node.label == "Customer"
+    assert spec.node.properties["tenureMonths"].type == "int"
+    assert {d.relationship for d in spec.dimensions} >= {"HAS_CONTRACT", "HAS_OFFER", "IN_CITY"}
+
+
+def test_mapping_rejects_unknown_type():
+    with pytest.raises(ValidationError):
+        mapping.MappingSpec.model_validate({
+            "name": "x",
+            "node": {
+                "label": "A",
+                "key_column": "id",
+                "properties": {"p": {"column": "p", "type": "date"}},
+            },
+        })
+
+
+def test_load_plan_writes_each_dimension_once():
+    spec = mapping.MappingSpec.model_validate({
+        "name": "orders",
+        "node": {
+            "label": "Order",
+            "key_column": "order_id",
+            "properties": {"amount": {"column": "amount", "type": "float"}},
+        },
+        "dimensions": [
+            {
+                "label": "Carrier",
+                "column": "carrier",
+                "relationship": "SHIPPED_BY",
+                "null_values": ["none"],
+            },
+        ],
+    })
+    plan = mapping.compile_mapping(spec)
+    driver = FakeDriver()
+    batches = [
+        [
+            {"order_id": "o1", "amount": 1.0, "carrier": "UPS"},
+            {"order_id": "o2", "amount": 2.0, "carrier": "None"},
+        ],
+        [
+            {"order_id": "o3", "amount": 3.0, "carrier": "UPS"},
+            {"order_id": "", "carrier": "DHL"},
+        ],
+    ]
+    result = plan.run(driver, batches)
+    assert result["rows"] == 3
+    assert result["nodes"]["Order"]["count"] == 3
+    assert result["nodes"]["Carrier"]["count"] == 1
+    assert result["relationships"]["SHIPPED_BY"]["count"] == 2
+    edge_query = next(q for q, _ in driver.calls if "SHIPPED_BY" in q)
+    assert "MATCH (a:`Order` {`id`: row.source_id})" in edge_query
+    assert "MATCH (b:`Carrier` {`name`: row.target_id})" in edge_query
+    _, params = next(c for c in driver.calls if "MERGE (n:`Order`" in c[0])
+    assert [row["properties"]["contentHash"] for row in params["rows"]] == [
+        transform.content_hash({"amount": 1.0}, {"SHIPPED_BY": ["UPS"]}),
+        transform.content_hash({"amount": 2.0}, {"SHIPPED_BY": []}),
+    ]
+
+
+def test_load_plan_runs_telecom_csv():
+    plan = mapping.compile_mapping(TELECOM_MAPPING)
+    driver = FakeDriver()
+    result = plan.run_csv(driver, path=str(ROOT / "scripts" / "telecom_customer_churn.csv"))
+    assert result["rows"] == 7043
+    assert result["nodes"]["Contract"]["count"] == 3
+    assert result["relationships"]["HAS_CONTRACT"]["count"] == 7043
+    assert result["relationships"]["HAS_OFFER"]["count"] < 7043
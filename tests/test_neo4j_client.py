@@ -21,3 +21,268 @@ def test_run_cypher_executes_and_returns_list():
         assert rows == [{"n": 1}]
     finally:
         client.close()
+
+
+class FakeResult(list):
+    def keys(self):
+        return list(self[0]) if self else []
+
+    def consume(self):
+        return None
+
+
+class FakeSession:
+    def __init__(self, driver, **config):
+        self.driver = driver
+        self.config = config
+
+    def __enter__(self):
+        self.driver.open_sessions += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.driver.open_sessions -= 1
+        return False
+
+    def run(self, query, params):
+        self.driver.calls.append(("session", query, params, self.config))
+        return FakeResult(self.driver.rows)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+        self.open_sessions = 0
+        self.rows = [{"ok": True}]
+
+    def execute_query(self, query, params, routing_=None):
+        self.calls.append(("execute_query", query, params, routing_))
+        return [{"n": 1}], None, None
+
+    def session(self, **config):
+        return FakeSession(self, **config)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("MATCH (n) RETURN n", False),
+        ("MATCH (n {name: 'SET'}) RETURN n", False),
+        ("MATCH (n) WHERE n.offset = 1 RETURN n", False),
+        ("MATCH (c) CALL { WITH c RETURN c } RETURN c", False),
+        ("SHOW INDEXES", False),
+        ("MERGE (n:A {id: 1})", True),
+        ("match (n) detach delete n", True),
+        ("CREATE CONSTRAINT x IF NOT EXISTS FOR (n:A) REQUIRE n.id IS UNIQUE", True),
+        ("CALL db.labels()", True),
+    ],
+)
+def test_is_write_query(query, expected):
+    from graph.neo4j_client import is_write_query
+
+    assert is_write_query(query) is expected
+
+
+def test_run_cypher_routes_reads_and_writes(monkeypatch):
+    import graph.neo4j_client as mod
+    from neo4j import RoutingControl
+
+    driver = FakeDriver()
+    monkeypatch.setattr(mod.GraphDatabase, "driver", lambda *a, **k: driver)
+    client = Neo4jClient("bolt://x", "u", "p")
+    assert client.run_cypher("MATCH (n) RETURN 1 AS n") == [{"n": 1}]
+    assert client.run_cypher("MERGE (n:A)") == [{"ok": True}]
+    assert driver.calls[0][0] == "execute_query"
+    assert driver.calls[0][3] == RoutingControl.READ
+    assert driver.calls[1][0] == "session"
+    stats = client.inflight_stats()
+    assert stats["calls"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 1
+    client.close()
+    assert driver.closed
+
+
+def test_connect_is_thread_safe(monkeypatch):
+    import threading
+    import time
+
+    import graph.neo4j_client as mod
+
+    created = []
+
+    def make_driver(*args, **kwargs):
+        time.sleep(0.01)
+        created.append(kwargs)
+        return FakeDriver()
+
+    monkeypatch.setattr(mod.GraphDatabase, "driver", make_driver)
+    client = Neo4jClient("bolt://x", "u", "p", max_connection_pool_size=7)
+    threads = [threading.Thread(target=client.connect) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(created) == 1
+    assert created[0]["max_connection_pool_size"] == 7
+    assert client.inflight_stats()["max_connection_pool_size"] == 7
+
+
+def test_from_settings_passes_pool_config():
+    from config.settings import Settings
+
+    settings = Settings(
+        neo4j_uri="bolt://db:7687",
+        neo4j_user="neo4j",
+        neo4j_password="pw",
+        neo4j_max_connection_pool_size=20,
+        neo4j_connection_acquisition_timeout=5.0,
+        neo4j_keep_alive=False,
+    )
+    client = Neo4jClient.from_settings(settings, max_transaction_retry_time=10.0)
+    assert client.uri == "bolt://db:7687"
+    assert client.driver_config["max_connection_pool_size"] == 20
+    assert client.driver_config["connection_acquisition_timeout"] == 5.0
+    assert client.driver_config["keep_alive"] is False
+    assert client.driver_config["max_transaction_retry_time"] == 10.0
+    assert "liveness_check_timeout" not in client.driver_config
+
+
+def test_run_cypher_iter_streams_and_batches(monkeypatch):
+    import graph.neo4j_client as mod
+    from neo4j import READ_ACCESS
+
+    driver = FakeDriver()
+    driver.rows = [{"i": i} for i in range(5)]
+    monkeypatch.setattr(mod.GraphDatabase, "driver", lambda *a, **k: driver)
+    client = Neo4jClient("bolt://x", "u", "p")
+
+    rows = client.run_cypher_iter("MATCH (c:Customer) RETURN c.id AS i", fetch_size=2)
+    assert driver.open_sessions == 0
+    assert next(rows) == {"i": 0}
+    assert driver.open_sessions == 1
+    assert driver.calls[0][3] == {"fetch_size": 2, "default_access_mode": READ_ACCESS}
+    assert client.inflight_stats()["in_flight"] == 1
+    assert list(rows) == [{"i": i} for i in range(1, 5)]
+    assert driver.open_sessions == 0
+    assert client.inflight_stats()["in_flight"] == 0
+
+    batches = list(client.run_cypher_iter("MATCH (c) RETURN c", batch_size=2))
+    assert [len(b) for b in batches] == [2, 2, 1]
+
+    early = client.run_cypher_iter("MATCH (c) RETURN c")
+    next(early)
+    early.close()
+    assert driver.open_sessions == 0
+
+
+def test_run_cypher_columns(monkeypatch):
+    import graph.neo4j_client as mod
+
+    class Result(FakeResult):
+        def keys(self):
+            return ["id", "charge"]
+
+    driver = FakeDriver()
+    monkeypatch.setattr(mod.GraphDatabase, "driver", lambda *a, **k: driver)
+    monkeypatch.setattr(FakeSession, "run", lambda self, q, p: Result([("a", 1.5), ("b", 2.0)]))
+    client = Neo4jClient("bolt://x", "u", "p")
+    cols = client.run_cypher_columns("MATCH (c:Customer) RETURN c.id AS id, c.monthlyCharge AS charge", as_numpy=False)
+    assert cols == {"id": ["a", "b"], "charge": [1.5, 2.0]}
+
+
+def test_run_cypher_cache_hits_and_generation_invalidation(monkeypatch):
+    import graph.neo4j_client as mod
+    from graph.query_cache import QueryCache
+
+    class GenerationDriver(FakeDriver):
+        generation = 1
+
+        def execute_query(self, query, params, routing_=None):
+            if "GraphMeta" in query:
+                return [{"generation": self.generation}], None, None
+            return super().execute_query(query, params, routing_)
+
+    driver = GenerationDriver()
+    monkeypatch.setattr(mod.GraphDatabase, "driver", lambda *a, **k: driver)
+    client = Neo4jClient("bolt://x", "u", "p", cache=QueryCache(), generation_check_interval=0)
+
+    def reads():
+        return [c for c in driver.calls if c[0] == "execute_query"]
+
+    q = "MATCH (n) RETURN 1 AS n"
+    assert client.run_cypher(q, {"id": "churn:1"}) == [{"n": 1}]
+    assert client.run_cypher(q, {"id": "churn:1"}) == [{"n": 1}]
+    assert len(reads()) == 1
+    assert client.cache_stats()["hits"] == 1
+
+    driver.generation = 2  # another process bumped the write generation
+    client.run_cypher(q, {"id": "churn:1"})
+    assert len(reads()) == 2
+
+    client.run_cypher("MERGE (n:A)")  # local writes clear the cache too
+    client.run_cypher(q, {"id": "churn:1"})
+    assert len(reads()) == 3
+    assert client.cache_stats()["misses"] == 3
+
+
+def test_run_cypher_does_not_cache_reads_overlapping_a_write(monkeypatch):
+    import graph.neo4j_client as mod
+    from graph.query_cache import QueryCache
+
+    cache = QueryCache()
+
+    class RacingDriver(FakeDriver):
+        def execute_query(self, query, params, routing_=None):
+            if "GraphMeta" in query:
+                return [], None, None
+            cache.invalidate()  # another thread's write commits mid-read
+            return super().execute_query(query, params, routing_)
+
+    driver = RacingDriver()
+    monkeypatch.setattr(mod.GraphDatabase, "driver", lambda *a, **k: driver)
+    client = Neo4jClient("bolt://x", "u", "p", cache=cache, generation_check_interval=0)
+    client.run_cypher("MATCH (n) RETURN 1 AS n")
+    client.run_cypher("MATCH (n) RETURN 1 AS n")
+    assert len(driver.calls) == 2
+    assert client.cache_stats()["size"] == 0
+
+
+def test_from_settings_builds_cache_when_enabled():
+    from config.settings import Settings
+
+    client = Neo4jClient.from_settings(Settings(neo4j_query_cache_size=16, neo4j_query_cache_ttl=5.0))
+    assert client.cache.max_entries == 16 and client.cache.ttl_seconds == 5.0
+    assert "cache" not in client.driver_config
+    assert Neo4jClient.from_settings(Settings()).cache is None
+
+
+def test_client_records_query_stats_and_dumps_on_close(monkeypatch, tmp_path):
+    import json
+
+    import graph.neo4j_client as mod
+    from graph.query_stats import QueryStats
+
+    driver = FakeDriver()
+    driver.rows = [{"i": 1}, {"i": 2}]
+    monkeypatch.setattr(mod.GraphDatabase, "driver", lambda *a, **k: driver)
+    dump = tmp_path / "stats.json"
+    client = Neo4jClient(
+        "bolt://x", "u", "p", stats=QueryStats(slow_query_ms=None), stats_dump_path=str(dump)
+    )
+    client.run_cypher("MATCH (n {id: 'a'}) RETURN n")
+    client.run_cypher("MATCH (n {id: 'b'}) RETURN n")
+    client.run_cypher("MERGE (n:A)")
+    rows = client.run_cypher_iter("MATCH (c) RETURN c")
+    next(rows)
+    rows.close()
+    by_query = {e["query"]: e for e in client.stats.snapshot()}
+    assert by_query["MATCH (n {id: ?}) RETURN n"]["count"] == 2
+    assert by_query["MERGE (n:A)"]["records_total"] == 2
+    assert by_query["MATCH (c) RETURN c"]["errors"] == 0
+    client.close()
+    assert len(json.loads(dump.read_text())["queries"]) == 3
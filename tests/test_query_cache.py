@@ -0,0 +1,73 @@
+"""Tests for graph.query_cache."""
+
+from graph.query_cache import QueryCache, bump_write_generation, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_normalizes_whitespace_and_param_order():
+    a = cache_key("MATCH (n)\n   RETURN n", {"a": 1, "b": 2})
+    b = cache_key("  MATCH (n) RETURN n ", {"b": 2, "a": 1})
+    assert a == b
+    assert a != cache_key("MATCH (n) RETURN n", {"a": 2, "b": 2})
+
+
+def test_lru_bound_and_hit_miss_counters():
+    cache = QueryCache(max_entries=2, ttl_seconds=None)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    assert cache.get("a") == (True, [1])
+    cache.put("c", [3])  # evicts least recently used "b"
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, [3])
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["evictions"] == 1 and stats["size"] == 2
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = QueryCache(ttl_seconds=10, clock=clock)
+    cache.put("a", [1])
+    clock.now = 5
+    assert cache.get("a")[0]
+    clock.now = 11
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["expirations"] == 1
+
+
+def test_generation_change_invalidates():
+    cache = QueryCache()
+    cache.observe_generation(1)
+    cache.put("a", [1])
+    cache.observe_generation(1)
+    assert cache.get("a")[0]
+    cache.observe_generation(2)
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["generation"] == 2
+
+
+def test_put_drops_results_read_across_an_invalidation():
+    cache = QueryCache()
+    epoch = cache.epoch
+    cache.invalidate()  # a write lands while the read is in flight
+    cache.put("a", [1], epoch=epoch)
+    assert cache.get("a") == (False, None)
+    cache.put("a", [2], epoch=cache.epoch)
+    assert cache.get("a") == (True, [2])
+
+
+def test_bump_write_generation():
+    class Client:
+        def run_cypher(self, query, params=None):
+            assert "MERGE (m:GraphMeta" in query and params == {"key": "graph"}
+            return [{"generation": 4}]
+
+    assert bump_write_generation(Client()) == 4
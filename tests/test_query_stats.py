@@ -0,0 +1,74 @@
+"""Tests for graph.query_stats."""
+
+import json
+import logging
+from types import SimpleNamespace
+
+from graph.query_stats import (
+    QueryStats,
+    fingerprint,
+    fingerprint_text,
+    profile_db_hits,
+    slow_query_logger,
+)
+
+
+def test_fingerprint_ignores_literals_and_whitespace():
+    a = "MATCH (n {id: 'a'})-[:CAUSES*1..3]->(m)\n RETURN m LIMIT 5"
+    b = "MATCH (n {id: \"b\"})-[:CAUSES*1..7]->(m) RETURN m   LIMIT 10"
+    assert fingerprint(a) == fingerprint(b)
+    assert fingerprint_text(a) == "MATCH (n {id: ?})-[:CAUSES*?..?]->(m) RETURN m LIMIT ?"
+
+
+def test_record_histogram_counters_and_db_hits():
+    stats = QueryStats(slow_query_ms=None)
+    summary = SimpleNamespace(
+        counters=SimpleNamespace(nodes_created=2, properties_set=4),
+        profile={"dbHits": 3, "children": [{"dbHits": 5, "children": []}]},
+    )
+    stats.record("MERGE (n:A {id: 1})", 0.003, records=0, summary=summary)
+    stats.record("MERGE (n:A {id: 2})", 0.2, records=0)
+    stats.record("MERGE (n:A {id: 3})", 30.0, error=RuntimeError("boom"))
+    [entry] = stats.snapshot()
+    assert entry["count"] == 3 and entry["errors"] == 1
+    assert entry["buckets"][0] == 1 and sum(entry["buckets"]) == 2  # 30s lands in +Inf
+    assert entry["counters"] == {"nodes_created": 2, "properties_set": 4}
+    assert entry["db_hits_total"] == 8 and entry["profiled"] == 1
+    assert profile_db_hits(None) == 0
+
+
+def test_slow_query_log(caplog):
+    stats = QueryStats(slow_query_ms=100)
+    slow_query_logger.addHandler(caplog.handler)
+    try:
+        with caplog.at_level(logging.WARNING, logger="graph.slow_query"):
+            stats.record("MATCH (n) RETURN n", 0.05)
+            stats.record("MATCH (n) RETURN n LIMIT 5", 0.25, records=5)
+    finally:
+        slow_query_logger.removeHandler(caplog.handler)
+    assert len(caplog.records) == 1
+    logged = json.loads(caplog.records[0].getMessage())
+    assert logged["ms"] == 250.0 and logged["records"] == 5
+    assert logged["query"] == "MATCH (n) RETURN n LIMIT ?"
+
+
+def test_slow_query_log_is_silent_until_configured(capfd):
+    QueryStats(slow_query_ms=0).record("MATCH (n) RETURN n", 0.5)
+    assert capfd.readouterr().err == ""
+
+
+def test_prometheus_and_json_dump(tmp_path):
+    stats = QueryStats(slow_query_ms=None)
+    stats.record('MATCH (n {name: "x"}) RETURN n', 0.02, records=3)
+    text = stats.to_prometheus()
+    fp = fingerprint('MATCH (n {name: "x"}) RETURN n')
+    assert f'neo4j_query_duration_seconds_bucket{{fingerprint="{fp}",le="0.025"}} 1' in text
+    assert f'neo4j_query_duration_seconds_bucket{{fingerprint="{fp}",le="+Inf"}} 1' in text
+    assert f'neo4j_query_records_total{{fingerprint="{fp}"}} 3' in text
+    assert 'query="MATCH (n {name: ?}) RETURN n"' in text
+
+    stats.dump(str(tmp_path / "stats.json"))
+    dumped = json.loads((tmp_path / "stats.json").read_text())
+    assert dumped["queries"][0]["records_total"] == 3
+    stats.dump(str(tmp_path / "stats.prom"))
+    assert (tmp_path / "stats.prom").read_text().startswith("# HELP")
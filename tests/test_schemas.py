@@ -1,7 +1,7 @@
 """Tests for data_pipeline.schemas."""
 
 import pytest
-from data_pipeline.schemas import NodeBase, EdgeBase, CausalEdge
+from data_pipeline.schemas import NodeBase, EdgeBase, CausalEdge, NodeBatch, EdgeBatch
 
 
 def test_node_base():
@@ -21,3 +21,22 @@ def test_edge_base():
 def test_causal_edge_default():
     c = CausalEdge(source_id="x", target_id="y")
     assert c.relation_type == "CAUSES"
+
+
+def test_node_batch_validates_columns():
+    b = NodeBatch(label="Customer", ids=["a", "b"], columns={"age": [30, None], "charge": [1, 2.5]})
+    assert len(b) == 2
+    assert b.slice(1, 2).ids == ["b"]
+    with pytest.raises(ValueError):
+        NodeBatch(label="Customer", ids=["a", "b"], columns={"age": [30]})
+    with pytest.raises(ValueError):
+        NodeBatch(label="Customer", ids=["a", "b"], columns={"age": [30, "x"]})
+    with pytest.raises(ValueError):
+        NodeBatch(label="Customer", ids=["a", ""])
+
+
+def test_edge_batch_validates_lengths():
+    e = EdgeBatch(relation_type="CAUSES", source_ids=["x"], target_ids=["y"], columns={"lift": [1.2]})
+    assert len(e) == 1
+    with pytest.raises(ValueError):
+        EdgeBatch(relation_type="CAUSES", source_ids=["x"], target_ids=[])
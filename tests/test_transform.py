@@ -0,0 +1,41 @@
+"""Tests for data_pipeline.transform."""
+
+import pytest
+from data_pipeline import transform
+
+
+def test_to_nodes_groups_by_label_into_columns():
+    raw = [
+        {"id": "1", "label": "Contract", "name": "One Year"},
+        {"id": "2", "label": "Offer", "name": "Offer A"},
+        {"id": "3", "label": "Contract", "name": "Two Year", "term": 24},
+    ]
+    batches = {b.label: b for b in transform.to_nodes(raw)}
+    assert batches["Contract"].ids == ["1", "3"]
+    assert batches["Contract"].columns == {"name": ["One Year", "Two Year"], "term": [None, 24]}
+    assert batches["Offer"].columns == {"name": ["Offer A"]}
+
+
+def test_to_nodes_fixed_label_and_missing_label():
+    raw = [{"Customer ID": "c1", "label": "kept", "age": 30}]
+    (batch,) = transform.to_nodes(raw, id_field="Customer ID", label="Customer")
+    assert batch.label == "Customer"
+    assert batch.columns == {"label": ["kept"], "age": [30]}
+    with pytest.raises(ValueError):
+        transform.to_nodes([{"id": "x"}])
+
+
+def test_to_edges_builds_single_batch():
+    raw = [{"src": "a", "dst": "b", "weight": 0.5}, {"src": "c", "dst": "d", "weight": 1.0}]
+    batch = transform.to_edges(raw, "src", "dst", "CAUSES")
+    assert batch.relation_type == "CAUSES"
+    assert batch.source_ids == ["a", "c"]
+    assert batch.columns == {"weight": [0.5, 1.0]}
+
+
+def test_model_paths_match_columnar_content():
+    raw = [{"id": "1", "label": "Contract", "name": "One Year"}]
+    (node,) = transform.to_node_models(raw)
+    assert node.properties == {"name": "One Year"}
+    (edge,) = transform.to_edge_models([{"s": "a", "t": "b"}], "s", "t", "CAUSES")
+    assert edge.relation_type == "CAUSES"